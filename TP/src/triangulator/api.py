@@ -1,88 +1,381 @@
 """API Flask pour le service Triangulator."""
 
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from uuid import UUID
 
-from flask import Flask, Response, jsonify
+from flask import Flask, Response, jsonify, request
 
-from triangulator import binary, client_psm, core
+from triangulator import binary, client_psm, workers
+from triangulator.cache import ByteLRUCache
+from triangulator.errors import make_error
+from triangulator.jobs import FAILED, SUCCEEDED, JobQueue, JobQueueFull
+from triangulator.singleflight import SingleFlight
 
 app = Flask(__name__)
 
+# Requêtes simultanées sur un même PointSet : une seule récupération et une
+# seule triangulation. TRIANGULATOR_LOCK_DIR étend ce regroupement aux
+# processus de la machine.
+flights = SingleFlight(os.getenv("TRIANGULATOR_LOCK_DIR") or None)
+
+# Réponses encodées, indexées par l'empreinte BLAKE2 du PointSet et le
+# format : une requête répétée ne coûte qu'une récupération et un hachage.
+# Version des résultats, à incrémenter si la triangulation produite change.
+RESULT_CACHE_VERSION = 1
+results = ByteLRUCache(
+    int(os.getenv("TRIANGULATOR_RESULT_CACHE_BYTES", str(64 * 1024 * 1024))),
+    directory=os.getenv("TRIANGULATOR_RESULT_CACHE_DIR") or None,
+    max_disk_bytes=int(os.getenv("TRIANGULATOR_RESULT_CACHE_DISK_BYTES", "0"))
+    or None,
+)
+
+# Pool de processus des triangulations (voir `workers.default_pool`) : les
+# PointSets volumineux ne bloquent plus les threads de requête.
+pool = workers.default_pool()
+
+# Tâches asynchrones (/triangulation-jobs) : file bornée, threads
+# d'exécution, durée de conservation et taille cumulée des résultats.
+jobs = JobQueue(
+    lambda job: _run_job(job),
+    max_pending=int(os.getenv("TRIANGULATOR_JOB_QUEUE", "64")),
+    workers=int(os.getenv("TRIANGULATOR_JOB_WORKERS", "2")),
+    ttl=float(os.getenv("TRIANGULATOR_JOB_TTL", "600")),
+    max_result_bytes=int(
+        os.getenv("TRIANGULATOR_JOB_RESULT_BYTES", str(256 * 1024 * 1024))
+    ),
+)
+
+# Format historique, servi par défaut.
+OCTET_STREAM = "application/octet-stream"
+
+# Types de média du format compact, associés à leur compression.
+COMPACT_MEDIA_TYPES = {
+    "application/vnd.triangulator.compact": None,
+    "application/vnd.triangulator.compact+zlib": "zlib",
+    "application/vnd.triangulator.compact+lzma": "lzma",
+}
+
+# Type de média de la réponse sans sommets (indices et somme de contrôle).
+INDICES_MEDIA_TYPE = "application/vnd.triangulator.indices"
+
+# Formats de triangulation servis, par ordre de préférence.
+RESULT_MEDIA_TYPES = (OCTET_STREAM, *COMPACT_MEDIA_TYPES, INDICES_MEDIA_TYPE)
+
+# Réponse groupée de /triangulations (voir `binary.encode_batch_item`).
+BATCH_MEDIA_TYPE = "application/vnd.triangulator.batch"
+
+# Nombre maximal d'identifiants par requête groupée, et nombre de PointSets
+# récupérés et triangulés simultanément.
+BATCH_MAX_IDS = int(os.getenv("TRIANGULATOR_BATCH_MAX_IDS", "500"))
+batch_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("TRIANGULATOR_BATCH_CONCURRENCY", "16")),
+    thread_name_prefix="triangulation-batch",
+)
+
+
+def _media_encoding(media_type: str):
+    """Retourne l'encodage et la compression associés à un type de média."""
+    if media_type == INDICES_MEDIA_TYPE:
+        return "indices", None
+    if media_type in COMPACT_MEDIA_TYPES:
+        return "compact", COMPACT_MEDIA_TYPES[media_type]
+    return "triangles", None
+
+
 @app.route("/triangulation/<pointset_id>", methods=["GET"])
 def get_triangulation(pointset_id: str) -> Response:
     """Expose un endpoint HTTP permettant de calculer la triangulation d’un PointSet.
 
     L’endpoint valide l’identifiant, récupère les données binaires du PointSet,
-    calcule la triangulation et retourne le résultat encodé.
+    calcule la triangulation et retourne le résultat encodé. Le format est
+    choisi selon l’en-tête ``Accept`` : ``application/octet-stream`` par
+    défaut, l’un des `COMPACT_MEDIA_TYPES`, ou `INDICES_MEDIA_TYPE` pour
+    ne recevoir que les indices, le client détenant déjà les sommets.
+
+    Les réponses portent un ``ETag`` fort dérivé du contenu du PointSet et
+    du format : une requête ``If-None-Match`` à jour reçoit une 304.
     """
+    if not _is_uuid(pointset_id):
+        return _error("INVALID_ID_FORMAT", "Le PointSetID doit être un UUID valide.")
+
     try:
-        UUID(pointset_id)
-    except Exception:
-        return (
-            jsonify(
-                {
-                    "code": "INVALID_ID_FORMAT",
-                    "message": "Le PointSetID doit être un UUID valide.",
-                }
-            ),
-            400,
+        media_type = request.accept_mimetypes.best_match(
+            RESULT_MEDIA_TYPES, default=OCTET_STREAM
         )
+        data = _fetch_pointset(pointset_id)
+        digest, key, etag = _result_key(data, media_type)
+
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(
+                _cached_triangulation(data, digest, key, media_type),
+                mimetype=media_type,
+                status=200,
+            )
+
+        response.set_etag(etag)
+        response.vary.add("Accept")
+        return response
+
+    except Exception as exc:
+        return _error_response(exc)
+
+
+@app.route("/triangulation-jobs", methods=["POST"])
+def submit_triangulation_job() -> Response:
+    """Crée une tâche de triangulation asynchrone.
+
+    Le corps JSON porte ``pointSetId`` et, optionnellement, ``mediaType``
+    (format du résultat, ``application/octet-stream`` par défaut). La
+    réponse 202 donne l'identifiant de la tâche et son URL de suivi dans
+    l'en-tête ``Location``.
+    """
+    body = request.get_json(silent=True) or {}
+    pointset_id = body.get("pointSetId")
+    if not isinstance(pointset_id, str) or not _is_uuid(pointset_id):
+        return _error("INVALID_ID_FORMAT", "Le PointSetID doit être un UUID valide.")
+
+    media_type = body.get("mediaType", OCTET_STREAM)
+    if media_type not in RESULT_MEDIA_TYPES:
+        return _error("INVALID_MEDIA_TYPE", f"Format inconnu : {media_type}")
 
     try:
-        data = client_psm.get_pointset_bytes(pointset_id)
-        points = binary.decode_point_set(data)
-        triangles = core.triangulate(points)
-        triangles_bytes = binary.encode_triangles(points, triangles)
-
-        return Response(
-            triangles_bytes,
-            mimetype="application/octet-stream",
-            status=200,
-        )
+        job = jobs.submit(pointset_id, media_type)
+    except JobQueueFull as exc:
+        response, status = _error("QUEUE_FULL", str(exc), 503)
+        response.headers["Retry-After"] = "5"
+        return response, status
 
-    except client_psm.PointSetNotFound:
-        return (
-            jsonify(
-                {
-                    "code": "NOT_FOUND",
-                    "message": "PointSet introuvable",
-                }
-            ),
-            404,
-        )
+    response = jsonify(_job_status(job))
+    response.status_code = 202
+    response.headers["Location"] = f"/triangulation-jobs/{job.id}"
+    return response
+
+
+@app.route("/triangulation-jobs/<job_id>", methods=["GET"])
+def get_triangulation_job(job_id: str) -> Response:
+    """Retourne l'état d'une tâche et sa progression (points insérés / total)."""
+    job, error = _find_job(job_id)
+    if error is not None:
+        return error
+    return jsonify(_job_status(job))
 
-    except client_psm.PointSetManagerUnavailable:
-        return (
-            jsonify(
-                {
-                    "code": "SERVICE_UNAVAILABLE",
-                    "message": "PointSetManager inaccessible",
-                }
-            ),
-            503,
-        )
 
-    except ValueError as exc:
-        return (
-            jsonify(
-                {
-                    "code": "BAD_POINTSET",
-                    "message": str(exc),
-                }
-            ),
-            400,
+@app.route("/triangulation-jobs/<job_id>/result", methods=["GET"])
+def get_triangulation_job_result(job_id: str) -> Response:
+    """Télécharge le résultat d'une tâche terminée.
+
+    Une tâche en cours reçoit une 409 ``JOB_NOT_FINISHED`` ; une tâche
+    échouée reçoit l'erreur de l'endpoint synchrone (``NOT_FOUND``,
+    ``BAD_POINTSET``…).
+    """
+    job, error = _find_job(job_id)
+    if error is not None:
+        return error
+    if job.status == FAILED:
+        return _error_response(job.error)
+    if job.status != SUCCEEDED:
+        return _error("JOB_NOT_FINISHED", "La tâche n'est pas terminée.", 409)
+
+    response = Response(job.result, mimetype=job.media_type, status=200)
+    response.set_etag(job.etag)
+    return response
+
+
+@app.route("/triangulations", methods=["POST"])
+def post_triangulations() -> Response:
+    """Triangule plusieurs PointSets en une seule requête.
+
+    Le corps JSON porte ``pointSetIds`` (liste d'identifiants) et,
+    optionnellement, ``mediaType`` (format de chaque triangulation,
+    ``application/octet-stream`` par défaut). Les PointSets sont récupérés
+    et triangulés en parallèle ; la réponse, de type `BATCH_MEDIA_TYPE`,
+    est une suite de trames émises au fil des résultats, chacune portant
+    l'identifiant, son statut HTTP et la triangulation ou l'erreur JSON de
+    l'endpoint unitaire. Un échec n'affecte que sa trame.
+    """
+    body = request.get_json(silent=True) or {}
+    pointset_ids = body.get("pointSetIds")
+    if not isinstance(pointset_ids, list) or not all(
+        isinstance(pointset_id, str) for pointset_id in pointset_ids
+    ):
+        return _error(
+            "INVALID_REQUEST", "pointSetIds doit être une liste d'identifiants."
+        )
+    if len(pointset_ids) > BATCH_MAX_IDS:
+        return _error(
+            "BATCH_TOO_LARGE",
+            f"Au plus {BATCH_MAX_IDS} identifiants par requête.",
+            413,
         )
 
-    except Exception as exc:
-        return (
-            jsonify(
-                {
-                    "code": "INTERNAL_ERROR",
-                    "message": str(exc),
-                }
-            ),
-            500,
+    media_type = body.get("mediaType", OCTET_STREAM)
+    if media_type not in RESULT_MEDIA_TYPES:
+        return _error("INVALID_MEDIA_TYPE", f"Format inconnu : {media_type}")
+
+    invalid = [pid for pid in pointset_ids if not _is_uuid(pid)]
+    futures = {
+        batch_executor.submit(_batch_triangulation, pid, media_type): pid
+        for pid in pointset_ids
+        if _is_uuid(pid)
+    }
+
+    def frames():
+        yield binary.encode_batch_header(len(pointset_ids))
+        for pid in invalid:
+            yield _error_frame(
+                pid, "INVALID_ID_FORMAT", "Le PointSetID doit être un UUID valide.", 400
+            )
+        for future in as_completed(futures):
+            try:
+                yield binary.encode_batch_item(futures[future], 200, future.result())
+            except Exception as exc:
+                yield _error_frame(futures[future], *_error_fields(exc))
+
+    return Response(frames(), mimetype=BATCH_MEDIA_TYPE, status=200)
+
+
+def _batch_triangulation(pointset_id: str, media_type: str) -> bytes:
+    """Retourne la triangulation encodée d'un élément de requête groupée."""
+    data = _fetch_pointset(pointset_id)
+    digest, key, _ = _result_key(data, media_type)
+    # Les éléments d'un lot sont calculés en parallèle : même petits, ils
+    # passent par le pool de processus plutôt que sous le GIL.
+    return _cached_triangulation(data, digest, key, media_type, inline=False)
+
+
+def _error_frame(pointset_id: str, code: str, message: str, status: int) -> bytes:
+    """Retourne la trame d'un élément en échec, avec son erreur JSON."""
+    body = json.dumps(make_error(code, message)).encode("utf-8")
+    return binary.encode_batch_item(pointset_id, status, body)
+
+
+def _is_uuid(value: str) -> bool:
+    """Vérifie qu'un identifiant est un UUID valide."""
+    try:
+        UUID(value)
+    except Exception:
+        return False
+    return True
+
+
+def _error(code: str, message: str, status: int = 400):
+    """Retourne une réponse d'erreur JSON (code et message)."""
+    return jsonify(make_error(code, message)), status
+
+
+def _error_response(exc: Exception):
+    """Associe une exception de la triangulation à sa réponse d'erreur."""
+    return _error(*_error_fields(exc))
+
+
+def _error_fields(exc: Exception):
+    """Retourne le code, le message et le statut HTTP d'une exception."""
+    if isinstance(exc, client_psm.PointSetNotFound):
+        return "NOT_FOUND", "PointSet introuvable", 404
+    if isinstance(exc, client_psm.PointSetManagerUnavailable):
+        return "SERVICE_UNAVAILABLE", "PointSetManager inaccessible", 503
+    if isinstance(exc, workers.TriangulationTimeout):
+        return "TRIANGULATION_TIMEOUT", str(exc), 422
+    if isinstance(exc, ValueError):
+        return "BAD_POINTSET", str(exc), 400
+    return "INTERNAL_ERROR", str(exc), 500
+
+
+def _find_job(job_id: str):
+    """Retourne la tâche demandée, ou la réponse d'erreur à renvoyer."""
+    if not _is_uuid(job_id):
+        return None, _error(
+            "INVALID_ID_FORMAT", "L'identifiant de tâche doit être un UUID valide."
         )
+    job = jobs.get(job_id)
+    if job is None:
+        return None, _error("NOT_FOUND", "Tâche introuvable", 404)
+    return job, None
+
+
+def _job_status(job) -> dict:
+    """Retourne la représentation JSON de l'état d'une tâche."""
+    status = {
+        "jobId": job.id,
+        "pointSetId": job.pointset_id,
+        "status": job.status,
+        "progress": {"inserted": job.inserted, "total": job.total},
+    }
+    if job.status == SUCCEEDED:
+        status["result"] = f"/triangulation-jobs/{job.id}/result"
+    elif job.status == FAILED:
+        code, message, _ = _error_fields(job.error)
+        status["error"] = make_error(code, message)
+    return status
+
+
+def _run_job(job):
+    """Exécute une tâche asynchrone.
+
+    Returns:
+        tuple: Réponse encodée et son ETag.
+
+    """
+    data = _fetch_pointset(job.pointset_id)
+    job.total = max((len(data) - 4) // 8, 0)
+    digest, key, etag = _result_key(data, job.media_type)
+    body = _cached_triangulation(data, digest, key, job.media_type, job.report)
+    return body, etag
+
+
+def _fetch_pointset(pointset_id: str) -> bytes:
+    """Récupère un PointSet, une seule fois pour les requêtes simultanées."""
+    return flights.do(
+        f"pointset:{pointset_id}",
+        lambda: client_psm.get_pointset_bytes(pointset_id),
+    )
+
+
+def _result_key(data: bytes, media_type: str):
+    """Retourne l'empreinte du PointSet, la clé du cache et l'ETag associés."""
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    key = f"v{RESULT_CACHE_VERSION}:{digest}:{media_type}"
+    etag = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return digest, key, etag
+
+
+def _cached_triangulation(
+    data, digest, key, media_type, progress=None, inline=True
+) -> bytes:
+    """Retourne la réponse encodée depuis le cache, ou la calcule et la range."""
+    entry = results.get(key)
+    if entry is not None:
+        return entry.body
+    body = _encode_triangulation(data, digest, media_type, progress, inline)
+    results.put(key, body)
+    return body
+
+
+def _encode_triangulation(
+    data: bytes, digest: str, media_type: str, progress=None, inline=True
+) -> bytes:
+    """Triangule un PointSet puis encode le résultat dans le format demandé.
+
+    Le calcul est confié au `pool` de processus et partagé entre les
+    requêtes simultanées portant sur le même contenu et le même format.
+    Avec ``inline`` faux, même un petit PointSet passe par le pool (voir
+    `workers.TriangulationPool.run`).
+
+    Returns:
+        bytes: Réponse encodée.
+
+    """
+    encoding, compression = _media_encoding(media_type)
+    return flights.do(
+        f"triangulation:{digest}:{media_type}",
+        lambda: pool.run(data, encoding, compression, progress, inline=inline),
+    )
+
 
 if __name__ == "__main__":
-    app.run(debug=True)
\ No newline at end of file
+    app.run(debug=True)
@@ -1,28 +1,115 @@
-"""Encodeur et décodeur binaire pour les structures PointSet et Triangles."""
-
+"""Encodeur et décodeur binaire pour les structures PointSet et Triangles.
+
+Les décodeurs valident l'en-tête une seule fois puis lisent le corps
+sans le découper : `decode_point_set` et `decode_triangles` s'appuient sur
+`struct.iter_unpack`, et les variantes ``*_view`` exposent directement les
+coordonnées et indices du buffer d'origine (``memoryview`` ou tableau
+NumPy), sans copie.
+
+`load_point_set` et `load_triangles` projettent un fichier en mémoire
+(`mmap`) et retournent ces mêmes vues : l'ouverture est immédiate quelle
+que soit la taille du fichier, les pages n'étant lues qu'à l'accès, et
+plusieurs processus partagent le cache de pages du système.
+`save_triangles` écrit directement dans le fichier projeté.
+
+`encode_triangles_compact` produit un format de transport plus dense : les
+triangles sont réordonnés pour la localité, puis leurs indices codés en
+écarts zigzag sur des entiers de longueur variable (varint), le tout
+éventuellement compressé par zlib ou lzma.
+
+`encode_triangle_indices` omet le bloc des sommets, que le client détient
+déjà : la réponse ne contient que les indices et une somme de contrôle
+CRC-32 du PointSet source, vérifiée par `decode_triangles`.
+
+`encode_batch_header` et `encode_batch_item` découpent une réponse groupée
+en trames autonomes, chacune portant l'identifiant du PointSet, un statut
+HTTP et son corps ; `decode_batch` les relit.
+"""
+
+import lzma
+import mmap
 import struct
+import sys
+import zlib
+from array import array
+from itertools import chain
+
+try:  # NumPy est optionnel : il permet des vues (N, 2) sur les buffers.
+    import numpy as np
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    np = None
+
+# Signature du format compact et codes de compression de son en-tête.
+COMPACT_MAGIC = b"TRC1"
+COMPACT_CODECS = {None: 0, "zlib": 1, "lzma": 2}
+
+# Signature du format sans sommets (indices seuls).
+INDICES_MAGIC = b"TIDX"
+
+# Signature d'une réponse groupée (plusieurs PointSets).
+BATCH_MAGIC = b"TBAT"
+
+
+def point_set_nbytes(n_points):
+    """Retourne la taille en octets d'un PointSet de ``n_points`` points.
+
+    Args:
+        n_points (int): Nombre de points.
+
+    Returns:
+        int: Taille de l'encodage binaire.
+
+    """
+    return 4 + 8 * n_points
+
 
+def triangles_nbytes(n_points, n_triangles):
+    """Retourne la taille en octets d'une triangulation encodée.
 
-def encode_point_set(points):
+    Args:
+        n_points (int): Nombre de sommets.
+        n_triangles (int): Nombre de triangles.
+
+    Returns:
+        int: Taille de l'encodage binaire.
+
+    """
+    return point_set_nbytes(n_points) + 4 + 12 * n_triangles
+
+
+def encode_point_set(points, out=None):
     """Encode une liste de points 2D dans le format binaire PointSet.
 
     Format :
     - 4 octets : nombre de points (entier non signé)
     - N × 8 octets : coordonnées (x, y) de chaque point en flottants
 
+    Le PointSet est écrit en un seul appel à `struct.pack` (format répété
+    ``<I{2N}f``), sans concaténations successives.
+
     Args:
         points (list[tuple[float, float]]): Liste des points (x, y).
+        out (bytearray | memoryview | None): Tampon inscriptible fourni par
+            l'appelant, d'au moins ``point_set_nbytes(len(points))`` octets.
 
     Returns:
-        bytes: Données binaires représentant le PointSet.
+        bytes | memoryview: Données binaires représentant le PointSet, ou
+        vue sur la partie écrite de ``out`` si un tampon est fourni.
 
-    """
-    data = struct.pack("<I", len(points))
+    Raises:
+        ValueError: Si un point n'a pas deux coordonnées ou si ``out`` est
+            trop petit.
 
-    for x, y in points:
-        data += struct.pack("<ff", float(x), float(y))
+    """
+    n = len(points)
+    coords = _flatten(points, 2, "Chaque point doit avoir deux coordonnées")
+    fmt = f"<I{2 * n}f"
+    if out is None:
+        return struct.pack(fmt, n, *coords)
 
-    return data
+    view = _output_view(out, point_set_nbytes(n))
+    struct.pack_into(fmt, view, 0, n, *coords)
+    return view
 
 
 def decode_point_set(data):
@@ -38,27 +125,181 @@ def decode_point_set(data):
         ValueError: Si le buffer est trop court ou incohérent.
 
     """
-    if len(data) < 4:
+    view = memoryview(data)
+    _point_set_size(view)
+    return list(struct.iter_unpack("<ff", view[4:]))
+
+
+def decode_point_set_view(data, as_numpy=False):
+    """Expose les coordonnées d'un PointSet sans les copier.
+
+    Args:
+        data (bytes): Données binaires au format PointSet.
+        as_numpy (bool): Retourner un tableau NumPy (N, 2) ``float32``
+            plutôt qu'une vue plate.
+
+    Returns:
+        memoryview | numpy.ndarray: Vue de format ``'f'`` sur les 2N
+        coordonnées (x0, y0, x1, y1, ...), ou tableau (N, 2) partageant la
+        mémoire de ``data``.
+
+    Raises:
+        ValueError: Si le buffer est trop court ou incohérent, ou si NumPy
+            est demandé sans être installé.
+
+    """
+    view = memoryview(data)
+    n_points = (_point_set_size(view) - 4) // 8
+    return _coordinates_view(data, view, n_points, as_numpy)
+
+
+class PointSetStreamDecoder:
+    """Décodeur incrémental d'un PointSet reçu par morceaux.
+
+    Les morceaux sont poussés avec `feed` au fil de leur arrivée, quelle
+    que soit leur taille. L'en-tête est validé dès ses 4 octets reçus et
+    les coordonnées sont ajoutées à un ``array('f')`` qui grandit avec le
+    flux : un excédent de données est rejeté immédiatement, sans attendre
+    la fin du transfert.
+
+    Attributes:
+        n_points (int | None): Nombre de points annoncé par l'en-tête, ou
+            None tant qu'il n'est pas complet.
+
+    """
+
+    def __init__(self, expected_size=None):
+        """Initialise un décodeur vide.
+
+        Args:
+            expected_size (int | None): Taille totale annoncée du flux (par
+                exemple l'en-tête ``Content-Length``), confrontée à l'en-tête
+                du PointSet dès sa réception.
+
+        """
+        self.n_points = None
+        self._expected_size = expected_size
+        self._header = bytearray()
+        self._pending = bytearray()
+        self._coords = array("f")
+
+    @property
+    def coordinates(self):
+        """array: Coordonnées (x0, y0, x1, y1, ...) décodées jusqu'ici."""
+        return self._coords
+
+    @property
+    def done(self):
+        """bool: Indique si tous les points annoncés ont été reçus."""
+        return self.n_points is not None and len(self._coords) == 2 * self.n_points
+
+    def feed(self, chunk):
+        """Ajoute un morceau du flux binaire.
+
+        Args:
+            chunk (bytes | bytearray | memoryview): Octets reçus. Ils sont
+                copiés : l'appelant peut réutiliser son tampon.
+
+        Raises:
+            ValueError: Si le flux dépasse la taille annoncée par l'en-tête
+                ou contredit ``expected_size``.
+
+        """
+        view = memoryview(chunk).cast("B")
+        if self.n_points is None:
+            missing = 4 - len(self._header)
+            self._header += view[:missing]
+            view = view[missing:]
+            if len(self._header) < 4:
+                return
+            (self.n_points,) = struct.unpack("<I", self._header)
+            if (
+                self._expected_size is not None
+                and self._expected_size != point_set_nbytes(self.n_points)
+            ):
+                raise ValueError("Longueur binaire invalide pour un PointSet")
+
+        received = 4 * len(self._coords) + len(self._pending)
+        if len(view) > 8 * self.n_points - received:
+            raise ValueError("Longueur binaire invalide pour un PointSet")
+
+        if self._pending:
+            missing = 4 - len(self._pending)
+            self._pending += view[:missing]
+            view = view[missing:]
+            if len(self._pending) < 4:
+                return
+            self._extend(self._pending)
+            self._pending.clear()
+
+        whole = len(view) - len(view) % 4
+        self._extend(view[:whole])
+        self._pending += view[whole:]
+
+    def close(self):
+        """Termine le décodage et retourne les points.
+
+        Returns:
+            list[tuple[float, float]]: Points décodés, comme
+            `decode_point_set`.
+
+        Raises:
+            ValueError: Si le flux s'est arrêté avant la fin annoncée.
+
+        """
+        if self.n_points is None:
+            raise ValueError("Buffer trop court pour un PointSet")
+        if not self.done:
+            raise ValueError("Longueur binaire invalide pour un PointSet")
+        coords = iter(self._coords)
+        return list(zip(coords, coords))
+
+    def _extend(self, data):
+        """Ajoute des flottants little-endian complets aux coordonnées."""
+        if sys.byteorder != "little":
+            swapped = array("f", bytes(data))
+            swapped.byteswap()
+            self._coords.extend(swapped)
+        else:
+            self._coords.frombytes(data)
+
+
+def _point_set_size(view):
+    """Vérifie l'en-tête d'un PointSet occupant tout le buffer.
+
+    Returns:
+        int: Taille en octets du PointSet.
+
+    """
+    if len(view) < 4:
         raise ValueError("Buffer trop court pour un PointSet")
 
-    (n_points,) = struct.unpack("<I", data[:4])
+    (n_points,) = struct.unpack_from("<I", view)
     expected_length = 4 + n_points * 8
 
-    if len(data) != expected_length:
+    if len(view) != expected_length:
         raise ValueError("Longueur binaire invalide pour un PointSet")
 
-    points = []
-    offset = 4
+    return expected_length
+
 
-    for _ in range(n_points):
-        x, y = struct.unpack("<ff", data[offset:offset + 8])
-        points.append((x, y))
-        offset += 8
+def _coordinates_view(data, view, n_points, as_numpy):
+    """Retourne les 2N coordonnées qui suivent l'en-tête, sans copie."""
+    if as_numpy:
+        if np is None:
+            raise ValueError("La vue NumPy nécessite le paquet numpy.")
+        coords = np.frombuffer(data, dtype="<f4", count=2 * n_points, offset=4)
+        return coords.reshape(n_points, 2)
 
-    return points
+    body = view[4:4 + 8 * n_points]
+    if sys.byteorder != "little":
+        coords = array("f", body.tobytes())
+        coords.byteswap()
+        return memoryview(coords)
+    return body.cast("f")
 
 
-def encode_triangles(vertices, triangles):
+def encode_triangles(vertices, triangles, out=None):
     """Encode les sommets et les triangles d'une triangulation en binaire.
 
     Format :
@@ -66,28 +307,157 @@ def encode_triangles(vertices, triangles):
     - 4 octets : nombre de triangles
     - T × 12 octets : indices (i, j, k) des sommets
 
+    Les triangles peuvent aussi être fournis sous forme de tampon d'entiers
+    32 bits non signés (``array('I')`` plat, tableau NumPy ``uint32`` de
+    forme (T, 3) ou ``memoryview``) : leurs octets sont alors recopiés d'un
+    bloc, sans traitement par triangle. Une liste de triplets est encodée,
+    avec les sommets, en un seul appel à `struct.pack`.
+
     Args:
         vertices (list[tuple[float, float]]): Sommets 2D.
-        triangles (list[tuple[int, int, int]]): Indices des triangles.
+        triangles (list[tuple[int, int, int]] | array | numpy.ndarray):
+            Indices des triangles.
+        out (bytearray | memoryview | None): Tampon inscriptible fourni par
+            l'appelant, d'au moins `triangles_nbytes` octets. Il peut être
+            réutilisé d'un appel à l'autre.
+
+    Returns:
+        bytes | memoryview: Données binaires de la triangulation, ou vue sur
+        la partie écrite de ``out`` si un tampon est fourni.
+
+    Raises:
+        ValueError: Si le tampon ne contient pas un multiple de 3 indices,
+            si un triangle n'a pas trois sommets ou si ``out`` est trop
+            petit.
+
+    """
+    n = len(vertices)
+    indices = _index_buffer(triangles)
+    if indices is not None:
+        if len(indices) % 12:
+            raise ValueError("Tampon de triangles incomplet")
+        count = len(indices) // 12
+        if out is None:
+            return b"".join(
+                (encode_point_set(vertices), struct.pack("<I", count), indices)
+            )
+
+        view = _output_view(out, triangles_nbytes(n, count))
+        offset = point_set_nbytes(n)
+        encode_point_set(vertices, view[:offset])
+        struct.pack_into("<I", view, offset, count)
+        view[offset + 4:] = indices
+        return view
+
+    count = len(triangles)
+    coords = _flatten(vertices, 2, "Chaque point doit avoir deux coordonnées")
+    flat = _flatten(triangles, 3, "Chaque triangle doit avoir trois sommets")
+    fmt = f"<I{2 * n}fI{3 * count}I"
+    if out is None:
+        return struct.pack(fmt, n, *coords, count, *flat)
+
+    view = _output_view(out, triangles_nbytes(n, count))
+    struct.pack_into(fmt, view, 0, n, *coords, count, *flat)
+    return view
+
+
+def _flatten(records, width, message):
+    """Aplatit une séquence d'enregistrements de ``width`` valeurs.
+
+    Args:
+        records: Séquence de tuples (points ou triangles).
+        width (int): Nombre de valeurs attendu par enregistrement.
+        message (str): Message d'erreur si un enregistrement est mal formé.
+
+    Returns:
+        list: Valeurs concaténées, dans l'ordre.
+
+    Raises:
+        ValueError: Si un enregistrement n'a pas ``width`` valeurs.
+
+    """
+    if any(len(record) != width for record in records):
+        raise ValueError(message)
+    return list(chain.from_iterable(records))
+
+
+def _output_view(out, size):
+    """Retourne une vue octets des ``size`` premiers octets de ``out``.
+
+    Args:
+        out (bytearray | memoryview): Tampon inscriptible.
+        size (int): Nombre d'octets à écrire.
 
     Returns:
-        bytes: Données binaires de la triangulation.
+        memoryview: Vue inscriptible de ``size`` octets.
+
+    Raises:
+        ValueError: Si le tampon est en lecture seule ou trop petit.
 
     """
-    data = encode_point_set(vertices)
-    data += struct.pack("<I", len(triangles))
+    view = memoryview(out).cast("B")
+    if view.readonly:
+        raise ValueError("Le tampon de sortie doit être inscriptible")
+    if view.nbytes < size:
+        raise ValueError("Tampon de sortie trop petit")
+    return view[:size]
 
-    for i, j, k in triangles:
-        data += struct.pack("<III", int(i), int(j), int(k))
 
-    return data
+def _index_buffer(triangles):
+    """Retourne les octets little-endian d'un tampon d'indices uint32.
 
+    Args:
+        triangles: Triangles à encoder.
+
+    Returns:
+        memoryview | None: Vue en octets des indices, ou None si
+        ``triangles`` est une séquence de triplets.
 
-def decode_triangles(data):
+    Raises:
+        ValueError: Si un tableau NumPy n'est pas de forme (T, 3), n'est
+            pas entier ou contient un indice hors de l'intervalle uint32.
+
+    """
+    if isinstance(triangles, array):
+        if triangles.typecode not in "IL" or triangles.itemsize != 4:
+            triangles = array("I", triangles)
+        if sys.byteorder != "little":
+            triangles = array("I", triangles)
+            triangles.byteswap()
+        return memoryview(triangles).cast("B")
+
+    if hasattr(triangles, "__array_interface__"):
+        if triangles.size == 0:
+            return memoryview(b"")
+        if triangles.ndim != 2 or triangles.shape[1] != 3:
+            raise ValueError("Chaque triangle doit avoir trois sommets")
+        if triangles.dtype.kind not in "iu":
+            raise ValueError("Les indices de triangles doivent être entiers")
+        if triangles.min() < 0 or triangles.max() >= 2 ** 32:
+            raise ValueError("Indice de sommet hors de l'intervalle uint32")
+        # Tableau NumPy : conversion sans copie s'il est déjà en uint32 contigu.
+        contiguous = triangles.astype("<u4", order="C", copy=False)
+        return memoryview(contiguous).cast("B")
+
+    if isinstance(triangles, memoryview):
+        if triangles.itemsize != 4 or triangles.format not in ("I", "<I", "=I"):
+            raise ValueError("Le tampon de triangles doit contenir des uint32")
+        if sys.byteorder != "little":
+            return _index_buffer(array("I", triangles))
+        return triangles.cast("B")
+
+    return None
+
+
+def decode_triangles(data, pointset=None):
     """Décode des données binaires de triangulation.
 
     Args:
-        data (bytes): Données binaires contenant sommets et triangles.
+        data (bytes): Données binaires contenant sommets et triangles, ou
+            indices seuls (format `encode_triangle_indices`) si ``pointset``
+            est fourni.
+        pointset (bytes | list[tuple[float, float]] | None): PointSet
+            source, binaire ou décodé, requis pour le format sans sommets.
 
     Returns:
         tuple:
@@ -95,37 +465,508 @@ def decode_triangles(data):
             - triangles (list[tuple[int, int, int]])
 
     Raises:
-        ValueError: Si le buffer est invalide ou incomplet.
+        ValueError: Si le buffer est invalide ou incomplet, ou si la somme
+            de contrôle ne correspond pas au PointSet fourni.
+
+    """
+    if pointset is not None:
+        return _decode_triangle_indices(data, pointset)
+
+    view = memoryview(data)
+    pointset_size = _triangles_layout(view)
+
+    vertices = list(struct.iter_unpack("<ff", view[4:pointset_size]))
+    triangles = list(struct.iter_unpack("<III", view[pointset_size + 4:]))
+
+    return vertices, triangles
+
+
+def encode_triangle_indices(pointset, triangles):
+    """Encode les triangles seuls, sans le bloc des sommets.
+
+    Format :
+    - 4 octets : signature ``TIDX``
+    - 4 octets : CRC-32 du PointSet source (binaire)
+    - 4 octets : nombre de triangles
+    - T × 12 octets : indices (i, j, k) des sommets
+
+    Args:
+        pointset (bytes | list[tuple[float, float]]): PointSet source, tel
+            que reçu du PointSetManager ou sous forme de points.
+        triangles (list[tuple[int, int, int]] | array | numpy.ndarray):
+            Indices des triangles, sous les formes admises par
+            `encode_triangles`.
+
+    Returns:
+        bytes: Données binaires des indices.
+
+    Raises:
+        ValueError: Si les triangles sont mal formés.
+
+    """
+    header = INDICES_MAGIC + struct.pack("<I", _pointset_checksum(pointset))
+
+    indices = _index_buffer(triangles)
+    if indices is not None:
+        if len(indices) % 12:
+            raise ValueError("Tampon de triangles incomplet")
+        return b"".join((header, struct.pack("<I", len(indices) // 12), indices))
+
+    flat = _flatten(triangles, 3, "Chaque triangle doit avoir trois sommets")
+    return header + struct.pack(f"<I{len(flat)}I", len(triangles), *flat)
+
+
+def _pointset_checksum(pointset):
+    """Retourne le CRC-32 d'un PointSet binaire ou d'une liste de points."""
+    if isinstance(pointset, (bytes, bytearray, memoryview)):
+        return zlib.crc32(pointset)
+    return zlib.crc32(encode_point_set(pointset))
+
+
+def _decode_triangle_indices(data, pointset):
+    """Décode le format sans sommets et le confronte au PointSet source."""
+    view = memoryview(data)
+    if len(view) < 12 or view[:4] != INDICES_MAGIC:
+        raise ValueError("Buffer trop court pour une triangulation")
+
+    (checksum, n_triangles) = struct.unpack_from("<II", view, 4)
+    if len(view) != 12 + 12 * n_triangles:
+        raise ValueError("Longueur invalide pour les triangles")
+    if checksum != _pointset_checksum(pointset):
+        raise ValueError("Somme de contrôle différente du PointSet source")
+
+    if isinstance(pointset, (bytes, bytearray, memoryview)):
+        vertices = decode_point_set(pointset)
+    else:
+        vertices = list(pointset)
+    triangles = list(struct.iter_unpack("<III", view[12:]))
+
+    if triangles and max(map(max, triangles)) >= len(vertices):
+        raise ValueError("Indice de sommet hors du PointSet source")
+    return vertices, triangles
+
+
+def decode_triangles_view(data, as_numpy=False):
+    """Expose les sommets et indices d'une triangulation sans les copier.
+
+    Args:
+        data (bytes): Données binaires contenant sommets et triangles.
+        as_numpy (bool): Retourner des tableaux NumPy (N, 2) ``float32`` et
+            (T, 3) ``uint32`` plutôt que des vues plates.
+
+    Returns:
+        tuple:
+            - vertices (memoryview | numpy.ndarray): coordonnées, comme
+              `decode_point_set_view`.
+            - triangles (memoryview | numpy.ndarray): vue de format ``'I'``
+              sur les 3T indices, ou tableau (T, 3).
+
+    Raises:
+        ValueError: Si le buffer est invalide ou incomplet, ou si NumPy
+            est demandé sans être installé.
+
+    """
+    view = memoryview(data)
+    pointset_size = _triangles_layout(view)
+    n_points = (pointset_size - 4) // 8
+    n_triangles = (len(view) - pointset_size - 4) // 12
+
+    vertices = _coordinates_view(data, view, n_points, as_numpy)
+    offset = pointset_size + 4
+    if as_numpy:
+        indices = np.frombuffer(
+            data, dtype="<u4", count=3 * n_triangles, offset=offset
+        )
+        return vertices, indices.reshape(n_triangles, 3)
+
+    body = view[offset:]
+    if sys.byteorder != "little":
+        indices = array("I", body.tobytes())
+        indices.byteswap()
+        return vertices, memoryview(indices)
+    return vertices, body.cast("I")
+
+
+def _triangles_layout(view):
+    """Vérifie les en-têtes d'une triangulation occupant tout le buffer.
+
+    Returns:
+        int: Taille en octets du bloc PointSet des sommets.
 
     """
-    if len(data) < 4:
+    if len(view) < 4:
         raise ValueError("Buffer trop court pour une triangulation")
 
-    (n_points,) = struct.unpack("<I", data[:4])
+    (n_points,) = struct.unpack_from("<I", view)
     pointset_size = 4 + n_points * 8
 
-    if len(data) < pointset_size:
+    if len(view) < pointset_size:
         raise ValueError("Données insuffisantes pour les sommets")
 
-    vertices = decode_point_set(data[:pointset_size])
-    offset = pointset_size
-
-    if len(data) < offset + 4:
+    if len(view) < pointset_size + 4:
         raise ValueError("Données insuffisantes pour l'en-tête des triangles")
 
-    (n_triangles,) = struct.unpack("<I", data[offset:offset + 4])
-    offset += 4
-
-    expected_length = offset + n_triangles * 12
+    (n_triangles,) = struct.unpack_from("<I", view, pointset_size)
+    expected_length = pointset_size + 4 + n_triangles * 12
 
-    if len(data) != expected_length:
+    if len(view) != expected_length:
         raise ValueError("Longueur invalide pour les triangles")
 
+    return pointset_size
+
+
+def encode_triangles_compact(vertices, triangles, compression=None):
+    """Encode une triangulation dans le format compact.
+
+    Format :
+    - 4 octets : signature ``TRC1``
+    - 1 octet : compression du corps (0 aucune, 1 zlib, 2 lzma)
+    - corps, éventuellement compressé :
+        - PointSet des sommets
+        - 4 octets : nombre de triangles
+        - 3T varints : indices codés en écarts zigzag
+
+    Chaque triangle est tourné pour commencer par son plus petit indice
+    (l'orientation est conservée), puis les triangles sont triés : le
+    premier indice est codé par rapport à celui du triangle précédent, les
+    deux autres par rapport au premier. Les écarts restent petits et tiennent
+    le plus souvent sur un octet.
+
+    Args:
+        vertices (list[tuple[float, float]]): Sommets 2D.
+        triangles (list[tuple[int, int, int]]): Indices des triangles.
+        compression (str | None): ``"zlib"``, ``"lzma"`` ou None.
+
+    Returns:
+        bytes: Données binaires au format compact.
+
+    Raises:
+        ValueError: Si la compression est inconnue.
+
+    """
+    if compression not in COMPACT_CODECS:
+        raise ValueError(f"Compression inconnue : {compression}")
+
+    ordered = sorted(_rotate_min_first(t) for t in _triangle_records(triangles))
+    body = bytearray(encode_point_set(vertices))
+    body += struct.pack("<I", len(ordered))
+
+    previous = 0
+    for a, b, c in ordered:
+        _append_zigzag(body, a - previous)
+        _append_zigzag(body, b - a)
+        _append_zigzag(body, c - a)
+        previous = a
+
+    if compression == "zlib":
+        body = zlib.compress(body)
+    elif compression == "lzma":
+        body = lzma.compress(body)
+    return COMPACT_MAGIC + bytes((COMPACT_CODECS[compression],)) + body
+
+
+def decode_triangles_compact(data):
+    """Décode une triangulation au format compact.
+
+    Args:
+        data (bytes): Données produites par `encode_triangles_compact`.
+
+    Returns:
+        tuple:
+            - vertices (list[tuple[float, float]])
+            - triangles (list[tuple[int, int, int]]), dans l'ordre du flux
+
+    Raises:
+        ValueError: Si les données sont invalides ou incomplètes.
+
+    """
+    view = memoryview(data)
+    if len(view) < 5 or view[:4] != COMPACT_MAGIC:
+        raise ValueError("Signature invalide pour une triangulation compacte")
+
+    codec = view[4]
+    try:
+        if codec == COMPACT_CODECS["zlib"]:
+            view = memoryview(zlib.decompress(view[5:]))
+        elif codec == COMPACT_CODECS["lzma"]:
+            view = memoryview(lzma.decompress(view[5:]))
+        elif codec == COMPACT_CODECS[None]:
+            view = view[5:]
+        else:
+            raise ValueError(f"Compression inconnue : {codec}")
+    except (zlib.error, lzma.LZMAError) as exc:
+        raise ValueError(f"Corps compressé invalide : {exc}") from exc
+
+    if len(view) < 4:
+        raise ValueError("Buffer trop court pour une triangulation")
+    (n_points,) = struct.unpack_from("<I", view)
+    pointset_size = point_set_nbytes(n_points)
+    if len(view) < pointset_size + 4:
+        raise ValueError("Données insuffisantes pour les sommets")
+
+    vertices = list(struct.iter_unpack("<ff", view[4:pointset_size]))
+    (n_triangles,) = struct.unpack_from("<I", view, pointset_size)
+    values = _read_zigzags(view[pointset_size + 4:], 3 * n_triangles)
+
     triangles = []
+    previous = 0
+    for k in range(0, len(values), 3):
+        a = previous + values[k]
+        triangles.append((a, a + values[k + 1], a + values[k + 2]))
+        previous = a
+
+    if triangles and (
+        min(map(min, triangles)) < 0 or max(map(max, triangles)) >= n_points
+    ):
+        raise ValueError("Indice de sommet hors de la triangulation")
+    return vertices, triangles
+
+
+def _triangle_records(triangles):
+    """Retourne les triangles sous forme de triplets d'entiers."""
+    indices = _index_buffer(triangles)
+    if indices is None:
+        return [(int(a), int(b), int(c)) for a, b, c in triangles]
+    if len(indices) % 12:
+        raise ValueError("Tampon de triangles incomplet")
+    return list(struct.iter_unpack("<III", indices))
+
+
+def _rotate_min_first(triangle):
+    """Tourne un triangle pour qu'il commence par son plus petit indice."""
+    a, b, c = triangle
+    if a <= b and a <= c:
+        return a, b, c
+    if b <= c:
+        return b, c, a
+    return c, a, b
+
+
+def _append_zigzag(out, value):
+    """Ajoute un entier signé codé en zigzag puis en varint."""
+    value = (value << 1) ^ (value >> 63)
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_zigzags(view, count):
+    """Lit exactement ``count`` entiers zigzag/varint occupant tout ``view``.
+
+    Raises:
+        ValueError: Si le flux est tronqué ou contient des octets en trop.
+
+    """
+    values = []
+    value = 0
+    shift = 0
+    for byte in view:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append((value >> 1) ^ -(value & 1))
+        value = 0
+        shift = 0
+
+    if shift or len(values) != count:
+        raise ValueError("Longueur invalide pour les triangles")
+    return values
+
+
+def encode_batch_header(count):
+    """Encode l'en-tête d'une réponse groupée.
+
+    Format de la réponse :
+    - 4 octets : signature ``TBAT``
+    - 4 octets : nombre de trames
+    - trames, dans un ordre quelconque (voir `encode_batch_item`)
+
+    Args:
+        count (int): Nombre de trames qui suivent.
+
+    Returns:
+        bytes: En-tête binaire.
+
+    """
+    return BATCH_MAGIC + struct.pack("<I", count)
+
+
+def encode_batch_item(pointset_id, status, body):
+    """Encode une trame de réponse groupée.
+
+    Format :
+    - 2 octets : longueur L de l'identifiant
+    - L octets : identifiant du PointSet (UTF-8)
+    - 2 octets : statut HTTP de l'élément
+    - 4 octets : longueur B du corps
+    - B octets : corps (triangulation si le statut vaut 200, erreur JSON
+      sinon)
+
+    Args:
+        pointset_id (str): Identifiant demandé.
+        status (int): Statut HTTP de l'élément.
+        body (bytes): Corps de l'élément.
+
+    Returns:
+        bytes: Trame binaire.
+
+    Raises:
+        ValueError: Si l'identifiant dépasse 65535 octets.
+
+    """
+    key = pointset_id.encode("utf-8")
+    if len(key) > 0xFFFF:
+        raise ValueError("Identifiant trop long pour une trame")
+    return b"".join(
+        (
+            struct.pack("<H", len(key)),
+            key,
+            struct.pack("<HI", status, len(body)),
+            body,
+        )
+    )
+
+
+def decode_batch(data):
+    """Décode une réponse groupée.
+
+    Args:
+        data (bytes): Données produites par `encode_batch_header` suivi des
+            trames.
+
+    Returns:
+        list[tuple[str, int, bytes]]: Identifiant, statut et corps de chaque
+        trame, dans l'ordre du flux.
+
+    Raises:
+        ValueError: Si les données sont invalides ou incomplètes.
+
+    """
+    view = memoryview(data)
+    if len(view) < 8 or view[:4] != BATCH_MAGIC:
+        raise ValueError("Signature invalide pour une réponse groupée")
+
+    (count,) = struct.unpack_from("<I", view, 4)
+    items = []
+    offset = 8
+    for _ in range(count):
+        if len(view) < offset + 2:
+            raise ValueError("Trame tronquée dans la réponse groupée")
+        (key_size,) = struct.unpack_from("<H", view, offset)
+        offset += 2
+        key_end = offset + key_size
+        if len(view) < key_end + 6:
+            raise ValueError("Trame tronquée dans la réponse groupée")
+        status, body_size = struct.unpack_from("<HI", view, key_end)
+        body_start = key_end + 6
+        if len(view) < body_start + body_size:
+            raise ValueError("Trame tronquée dans la réponse groupée")
+        items.append(
+            (
+                bytes(view[offset:key_end]).decode("utf-8"),
+                status,
+                bytes(view[body_start:body_start + body_size]),
+            )
+        )
+        offset = body_start + body_size
+
+    if offset != len(view):
+        raise ValueError("Longueur invalide pour une réponse groupée")
+    return items
+
+
+def load_point_set(path, as_numpy=False):
+    """Ouvre un fichier PointSet par projection en mémoire.
+
+    Args:
+        path (str | os.PathLike): Chemin du fichier au format PointSet.
+        as_numpy (bool): Retourner un tableau NumPy (N, 2) plutôt qu'une
+            vue plate.
+
+    Returns:
+        memoryview | numpy.ndarray: Coordonnées, comme
+        `decode_point_set_view`, adossées au fichier projeté.
+
+    Raises:
+        ValueError: Si le fichier est trop court ou incohérent.
+
+    """
+    mapped = _map_file(path)
+    if mapped is None:
+        raise ValueError("Buffer trop court pour un PointSet")
+    return decode_point_set_view(mapped, as_numpy=as_numpy)
+
+
+def load_triangles(path, as_numpy=False):
+    """Ouvre un fichier de triangulation par projection en mémoire.
+
+    Args:
+        path (str | os.PathLike): Chemin du fichier de triangulation.
+        as_numpy (bool): Retourner des tableaux NumPy plutôt que des vues
+            plates.
+
+    Returns:
+        tuple: Sommets et indices, comme `decode_triangles_view`, adossés
+        au fichier projeté.
+
+    Raises:
+        ValueError: Si le fichier est invalide ou incomplet.
+
+    """
+    mapped = _map_file(path)
+    if mapped is None:
+        raise ValueError("Buffer trop court pour une triangulation")
+    return decode_triangles_view(mapped, as_numpy=as_numpy)
 
-    for _ in range(n_triangles):
-        i, j, k = struct.unpack("<III", data[offset:offset + 12])
-        triangles.append((i, j, k))
-        offset += 12
 
-    return vertices, triangles
\ No newline at end of file
+def save_triangles(path, vertices, triangles):
+    """Écrit une triangulation dans un fichier, sans tampon intermédiaire.
+
+    Le fichier est dimensionné à la taille finale puis projeté en mémoire ;
+    l'encodeur écrit en-têtes et données directement dans la projection.
+
+    Args:
+        path (str | os.PathLike): Chemin du fichier à (re)créer.
+        vertices (list[tuple[float, float]]): Sommets 2D.
+        triangles (list[tuple[int, int, int]] | array | numpy.ndarray):
+            Indices des triangles, sous les formes admises par
+            `encode_triangles`.
+
+    Returns:
+        int: Nombre d'octets écrits.
+
+    Raises:
+        ValueError: Si les triangles sont mal formés.
+
+    """
+    indices = _index_buffer(triangles)
+    if indices is None:
+        n_triangles = len(triangles)
+    elif len(indices) % 12:
+        raise ValueError("Tampon de triangles incomplet")
+    else:
+        n_triangles = len(indices) // 12
+
+    size = triangles_nbytes(len(vertices), n_triangles)
+    with open(path, "w+b") as f:
+        f.truncate(size)
+        with mmap.mmap(f.fileno(), size) as mapped:
+            encode_triangles(vertices, triangles, out=mapped).release()
+            mapped.flush()
+    return size
+
+
+def _map_file(path):
+    """Projette un fichier en lecture seule.
+
+    Returns:
+        mmap.mmap | None: Projection du fichier, ou None s'il est vide
+        (un fichier vide ne peut pas être projeté).
+
+    """
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
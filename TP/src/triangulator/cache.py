@@ -0,0 +1,325 @@
+"""Cache LRU borné en octets, avec durée de vie et niveau disque optionnel.
+
+Le cache associe à une clé un corps binaire et quelques métadonnées (par
+exemple les validateurs HTTP ``ETag`` / ``Last-Modified``). Il est borné
+par la somme des tailles des corps : l'insertion d'une entrée évince les
+moins récemment utilisées. Une entrée plus ancienne que la durée de vie
+reste disponible mais est signalée comme périmée, afin que l'appelant la
+revalide plutôt que de la retélécharger.
+
+Avec un répertoire, chaque entrée est aussi écrite sur disque : un
+processus redémarré retrouve ses entrées sans les redemander. Le corps est
+écrit avant ses métadonnées, et une entrée illisible est supprimée. Le
+niveau disque a son propre budget : chaque écriture supprime les entrées
+les plus anciennes au-delà de celui-ci.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional
+
+
+class CacheEntry(NamedTuple):
+    """Entrée du cache : corps, métadonnées et date d'enregistrement."""
+
+    body: bytes
+    metadata: Dict[str, Optional[str]]
+    stored_at: float
+
+
+class ByteLRUCache:
+    """Cache LRU thread-safe, borné par la taille totale des corps.
+
+    Attributes:
+        hits (int): Lectures d'une entrée valide.
+        stale (int): Lectures d'une entrée présente mais périmée.
+        misses (int): Lectures d'une clé absente.
+        revalidations (int): Entrées périmées déclarées à jour (`touch`).
+        evictions (int): Entrées évincées de la mémoire pour faire de la place.
+        disk_hits (int): Entrées rechargées depuis le disque.
+
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl: Optional[float] = None,
+        directory: Optional[str] = None,
+        max_disk_bytes: Optional[int] = None,
+    ) -> None:
+        """Crée un cache vide.
+
+        Args:
+            max_bytes: Taille maximale cumulée des corps gardés en mémoire.
+            ttl: Durée de vie d'une entrée en secondes (None : illimitée).
+            directory: Répertoire du niveau disque (None : pas de disque).
+            max_disk_bytes: Taille maximale cumulée des corps gardés sur
+                disque (None : ``max_bytes``). L'entrée qui vient d'être
+                écrite est toujours gardée.
+
+        Raises:
+            ValueError: Si ``max_bytes`` est négatif.
+
+        """
+        if max_bytes < 0:
+            raise ValueError("La taille maximale du cache doit être positive")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.directory = directory
+        self.max_disk_bytes = max_bytes if max_disk_bytes is None else max_disk_bytes
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.stale = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.disk_hits = 0
+
+    @property
+    def size(self) -> int:
+        """int: Taille cumulée des corps gardés en mémoire."""
+        return self._size
+
+    def __len__(self) -> int:
+        """Retourne le nombre d'entrées gardées en mémoire."""
+        return len(self._entries)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Indique si une entrée est encore dans sa durée de vie."""
+        return self.ttl is None or time.time() - entry.stored_at < self.ttl
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Retourne l'entrée associée à la clé, même périmée.
+
+        Args:
+            key: Clé recherchée.
+
+        Returns:
+            L'entrée (à tester avec `is_fresh`), ou None si elle est absente
+            de la mémoire et du disque.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            entry = self._read_disk(key)
+            if entry is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                    self._store(key, entry)
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            elif self.is_fresh(entry):
+                self.hits += 1
+            else:
+                self.stale += 1
+        return entry
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        metadata: Optional[Dict[str, Optional[str]]] = None,
+    ) -> CacheEntry:
+        """Enregistre un corps et ses métadonnées.
+
+        Un corps plus grand que ``max_bytes`` n'est gardé que sur disque.
+
+        Args:
+            key: Clé de l'entrée.
+            body: Corps binaire.
+            metadata: Métadonnées associées (valeurs textuelles ou None).
+
+        Returns:
+            L'entrée enregistrée.
+
+        """
+        entry = CacheEntry(bytes(body), dict(metadata or {}), time.time())
+        with self._lock:
+            self._store(key, entry)
+        self._write_disk(key, entry)
+        return entry
+
+    def touch(self, key: str) -> Optional[CacheEntry]:
+        """Redémarre la durée de vie d'une entrée revalidée.
+
+        Args:
+            key: Clé de l'entrée.
+
+        Returns:
+            L'entrée mise à jour, ou None si elle n'est plus en cache.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            entry = self._read_disk(key)
+            if entry is None:
+                return None
+
+        entry = entry._replace(stored_at=time.time())
+        with self._lock:
+            if key in self._entries:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            self.revalidations += 1
+        self._write_disk(key, entry, metadata_only=True)
+        return entry
+
+    def discard(self, key: str) -> None:
+        """Retire une entrée de la mémoire et du disque."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= len(entry.body)
+        if self.directory is not None:
+            for path in self._paths(key):
+                _remove(path)
+
+    def stats(self) -> Dict[str, int]:
+        """Retourne les compteurs et l'occupation du cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "stale": self.stale,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "disk_hits": self.disk_hits,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        """Insère une entrée en mémoire et évince les plus anciennes (verrou tenu)."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous.body)
+        if len(entry.body) > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self._size += len(entry.body)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.body)
+            self.evictions += 1
+
+    def _paths(self, key: str):
+        """Retourne les chemins du corps et des métadonnées d'une clé."""
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, name)
+        return base + ".bin", base + ".json"
+
+    def _write_disk(
+        self, key: str, entry: CacheEntry, metadata_only: bool = False
+    ) -> None:
+        """Écrit une entrée sur disque, de façon atomique fichier par fichier.
+
+        Le corps est écrit avant les métadonnées : des métadonnées présentes
+        désignent un corps complet.
+        """
+        if self.directory is None:
+            return
+        body_path, meta_path = self._paths(key)
+        meta = {"metadata": entry.metadata, "stored_at": entry.stored_at}
+        if not metadata_only:
+            _atomic_write(body_path, entry.body)
+        _atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+        if not metadata_only:
+            self._prune_disk(body_path)
+
+    def _read_disk(self, key: str) -> Optional[CacheEntry]:
+        """Relit une entrée depuis le disque, ou None si elle est absente.
+
+        Une entrée mal formée, ou dont le corps manque, est supprimée.
+        """
+        if self.directory is None:
+            return None
+        body_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, "rb") as f:
+                meta = json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            meta = None
+        try:
+            if not isinstance(meta, dict) or not isinstance(meta["metadata"], dict):
+                raise TypeError("Métadonnées mal formées")
+            stored_at = float(meta["stored_at"])
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError, KeyError, TypeError):
+            _remove(meta_path)
+            _remove(body_path)
+            return None
+        return CacheEntry(body, meta["metadata"], stored_at)
+
+    def _prune_disk(self, keep: str) -> None:
+        """Supprime les entrées disque les plus anciennes au-delà du budget.
+
+        Args:
+            keep: Chemin du corps qui vient d'être écrit, jamais supprimé.
+
+        """
+        files = []
+        total = 0
+        with os.scandir(self.directory) as entries:
+            for item in entries:
+                if not item.name.endswith(".bin"):
+                    continue
+                base = item.path[: -len(".bin")]
+                try:
+                    size = item.stat().st_size
+                    try:
+                        used = os.stat(base + ".json").st_mtime
+                    except FileNotFoundError:
+                        used = item.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                total += size
+                files.append((used, item.path, size))
+
+        files.sort()
+        for _, body_path, size in files:
+            if total <= self.max_disk_bytes:
+                break
+            if body_path == keep:
+                continue
+            _remove(body_path[: -len(".bin")] + ".json")
+            _remove(body_path)
+            total -= size
+
+
+def _remove(path: str) -> None:
+    """Supprime un fichier s'il existe encore."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Écrit un fichier via un fichier temporaire renommé."""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
@@ -4,21 +4,108 @@ Ce module gère la communication avec le service PointSetManager afin
 de récupérer des ensembles de points (PointSet) au format binaire.
 Il repose uniquement sur la bibliothèque standard afin de limiter
 les dépendances externes.
+
+`get_pointset` décode le PointSet au fil du téléchargement : les morceaux
+lus sur la socket alimentent directement un `PointSetStreamDecoder`, sans
+conserver le corps complet de la réponse.
+
+`PointSetManagerPool` garde des connexions HTTP/1.1 persistantes
+(`http.client`) vers le PointSetManager, partagées entre threads. Il est
+activé pour `get_pointset_bytes` et `get_pointset` en fixant
+``PSM_POOL_SIZE`` (nombre maximal de connexions) ; sinon chaque appel
+ouvre une connexion via `urllib.request.urlopen`.
+
+`AsyncPointSetManagerClient` offre les mêmes récupérations en asyncio
+(flux `asyncio.open_connection`), dont `get_many` qui charge plusieurs
+PointSets en parallèle avec une concurrence bornée.
+
+Si ``PSM_CACHE_BYTES`` est non nul, `get_pointset_bytes` passe par un
+`ByteLRUCache` : une entrée valide est servie sans appel réseau, une
+entrée périmée est revalidée par ``If-None-Match`` / ``If-Modified-Since``
+et une réponse 304 la prolonge sans retransférer le corps.
+
+Les appels bloquants peuvent être protégés (voir `triangulator.resilience`)
+par des relances avec gigue sur les réponses 503 (``PSM_RETRIES``), par
+une requête de couverture lancée après ``PSM_HEDGE_DELAY`` secondes sans
+réponse, et par un disjoncteur (``PSM_BREAKER_THRESHOLD``) qui échoue
+immédiatement tant que le PointSetManager est considéré en panne.
 """
 
+from __future__ import annotations
+
+import asyncio
+import http.client
 import os
+import ssl
+import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from triangulator import binary
+from triangulator.cache import ByteLRUCache
+from triangulator.resilience import CircuitBreaker, backoff_delay, hedged
 
 PSM_HOST = os.getenv("PSM_HOST", "http://localhost:5001")
 
+# Taille des morceaux lus sur la socket par `get_pointset`.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Connexions persistantes vers PSM_HOST (0 : une connexion par appel).
+PSM_POOL_SIZE = int(os.getenv("PSM_POOL_SIZE", "0"))
+PSM_CONNECT_TIMEOUT = float(os.getenv("PSM_CONNECT_TIMEOUT", "2.0"))
+PSM_READ_TIMEOUT = float(os.getenv("PSM_READ_TIMEOUT", "10.0"))
+
+# Cache des PointSets (0 : désactivé), durée de vie et niveau disque.
+PSM_CACHE_BYTES = int(os.getenv("PSM_CACHE_BYTES", "0"))
+PSM_CACHE_TTL = float(os.getenv("PSM_CACHE_TTL", "60.0"))
+PSM_CACHE_DIR = os.getenv("PSM_CACHE_DIR") or None
+# Budget du niveau disque (0 : celui de la mémoire, PSM_CACHE_BYTES).
+PSM_CACHE_DISK_BYTES = int(os.getenv("PSM_CACHE_DISK_BYTES", "0"))
+
+# Relances sur 503 (nombre et attente de référence, en secondes).
+PSM_RETRIES = int(os.getenv("PSM_RETRIES", "0"))
+PSM_RETRY_BACKOFF = float(os.getenv("PSM_RETRY_BACKOFF", "0.1"))
+
+# Délai (95e centile de latence visé) avant une requête de couverture ;
+# 0 : pas de couverture.
+PSM_HEDGE_DELAY = float(os.getenv("PSM_HEDGE_DELAY", "0"))
+# Threads des requêtes couvertes ; au-delà, l'appel s'exécute sur le thread
+# appelant, sans couverture.
+PSM_HEDGE_WORKERS = int(os.getenv("PSM_HEDGE_WORKERS", "8"))
+
+# Échecs consécutifs ouvrant le disjoncteur (0 : pas de disjoncteur) et
+# durée d'ouverture, en secondes.
+PSM_BREAKER_THRESHOLD = int(os.getenv("PSM_BREAKER_THRESHOLD", "0"))
+PSM_BREAKER_RESET = float(os.getenv("PSM_BREAKER_RESET", "30.0"))
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+_default_cache = None
+_default_breaker = None
+_hedge_executor = None
+_hedge_slots = None
+
 
 class PointSetNotFound(Exception):
     """Exception levée lorsque le PointSet demandé n’existe pas (404)."""
 
 
 class PointSetManagerUnavailable(Exception):
-    """Exception levée lorsque le PointSetManager est indisponible (5xx ou réseau)."""
+    """Exception levée lorsque le PointSetManager est indisponible (5xx ou réseau).
+
+    Attributes:
+        status (int | None): Statut HTTP reçu, ou None pour une erreur
+            réseau ou un circuit ouvert.
+
+    """
+
+    def __init__(self, message: str = "", status: int | None = None) -> None:
+        """Initialise l'exception avec son message et le statut HTTP reçu."""
+        super().__init__(message)
+        self.status = status
 
 
 def get_pointset_bytes(pointset_id: str) -> bytes:
@@ -34,21 +121,685 @@ def get_pointset_bytes(pointset_id: str) -> bytes:
         PointSetNotFound: Si le PointSet n’existe pas.
         PointSetManagerUnavailable: Si le service est indisponible ou inaccessible.
 
+    """
+    cache = default_cache()
+    if cache is not None:
+        return get_pointset_bytes_cached(cache, pointset_id)
+    if PSM_POOL_SIZE > 0:
+        return _call_psm(lambda: default_pool().get_pointset_bytes(pointset_id))
+    return _call_psm(
+        lambda: _request(pointset_id, lambda response: response.read())
+    )
+
+
+def get_pointset_bytes_cached(cache: ByteLRUCache, pointset_id: str) -> bytes:
+    """Récupère un PointSet via un cache, en revalidant les entrées périmées.
+
+    Args:
+        cache (ByteLRUCache): Cache des PointSets, indexé par identifiant.
+        pointset_id (str): Identifiant UUID du PointSet à récupérer.
+
+    Returns:
+        bytes: Représentation binaire du PointSet.
+
+    Raises:
+        PointSetNotFound: Si le PointSet n’existe pas.
+        PointSetManagerUnavailable: Si le service est indisponible ou inaccessible.
+
+    """
+    entry = cache.get(pointset_id)
+    if entry is not None and cache.is_fresh(entry):
+        return entry.body
+
+    headers = {}
+    if entry is not None:
+        if entry.metadata.get("etag"):
+            headers["If-None-Match"] = entry.metadata["etag"]
+        if entry.metadata.get("last_modified"):
+            headers["If-Modified-Since"] = entry.metadata["last_modified"]
+
+    result = _fetch(pointset_id, headers)
+    if result is None:
+        if entry is None:
+            raise PointSetManagerUnavailable("Réponse 304 sans entrée en cache.")
+        cache.touch(pointset_id)
+        return entry.body
+
+    body, etag, last_modified = result
+    cache.put(pointset_id, body, {"etag": etag, "last_modified": last_modified})
+    return body
+
+
+def default_cache():
+    """Retourne le cache partagé des PointSets, ou None s'il est désactivé.
+
+    Returns:
+        ByteLRUCache | None: Cache de ``PSM_CACHE_BYTES`` octets.
+
+    """
+    global _default_cache
+    if PSM_CACHE_BYTES <= 0:
+        return None
+    with _default_pool_lock:
+        if _default_cache is None:
+            _default_cache = ByteLRUCache(
+                PSM_CACHE_BYTES,
+                ttl=PSM_CACHE_TTL,
+                directory=PSM_CACHE_DIR,
+                max_disk_bytes=PSM_CACHE_DISK_BYTES or None,
+            )
+        return _default_cache
+
+
+def get_pointset(pointset_id: str, chunk_size: int = STREAM_CHUNK_SIZE) -> list:
+    """Récupère et décode un PointSet au fil de son téléchargement.
+
+    Args:
+        pointset_id (str): Identifiant UUID du PointSet à récupérer.
+        chunk_size (int): Taille maximale des morceaux lus sur la socket.
+
+    Returns:
+        list[tuple[float, float]]: Points décodés, comme
+        `binary.decode_point_set`.
+
+    Raises:
+        PointSetNotFound: Si le PointSet n’existe pas.
+        PointSetManagerUnavailable: Si le service est indisponible ou si le
+            transfert est interrompu.
+        ValueError: Si le flux reçu n’est pas un PointSet valide.
+
+    """
+    if PSM_POOL_SIZE > 0:
+        return _call_psm(
+            lambda: default_pool().get_pointset(pointset_id, chunk_size)
+        )
+    return _call_psm(
+        lambda: _request(
+            pointset_id, lambda response: _decode_stream(response, chunk_size)
+        )
+    )
+
+
+def _fetch(pointset_id: str, headers: dict):
+    """Effectue un GET conditionnel, via le pool s'il est activé.
+
+    Returns:
+        tuple | None: Corps, ``ETag`` et ``Last-Modified`` de la réponse,
+        ou None si le PointSetManager répond 304.
+
+    """
+    if PSM_POOL_SIZE > 0:
+        return _call_psm(lambda: default_pool().fetch(pointset_id, headers))
+    return _call_psm(
+        lambda: _request(
+            pointset_id,
+            lambda response: (
+                response.read(),
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            ),
+            headers,
+        )
+    )
+
+
+def _call_psm(call):
+    """Exécute un appel au PointSetManager avec les protections configurées.
+
+    Le disjoncteur est consulté avant chaque tentative ; une réponse 503
+    est relancée au plus ``PSM_RETRIES`` fois, après une attente avec
+    gigue ; chaque tentative est couverte si ``PSM_HEDGE_DELAY`` est non nul.
+
+    Args:
+        call: Appel bloquant au PointSetManager, sans argument.
+
+    Returns:
+        Le résultat de l'appel.
+
+    Raises:
+        PointSetNotFound: Si le PointSet n’existe pas.
+        PointSetManagerUnavailable: Si le service reste indisponible ou si
+            le circuit est ouvert.
+
+    """
+    breaker = default_breaker()
+    attempt = 0
+    while True:
+        if breaker is not None and not breaker.allow():
+            raise PointSetManagerUnavailable(
+                "PointSetManager indisponible (circuit ouvert)."
+            )
+        try:
+            if PSM_HEDGE_DELAY > 0:
+                executor, slots = _executor()
+                result = hedged(
+                    call,
+                    PSM_HEDGE_DELAY,
+                    executor,
+                    final=(PointSetNotFound,),
+                    slots=slots,
+                )
+            else:
+                result = call()
+        except PointSetManagerUnavailable as exc:
+            if breaker is not None:
+                breaker.record_failure()
+            if exc.status != 503 or attempt >= PSM_RETRIES:
+                raise
+            time.sleep(backoff_delay(attempt, PSM_RETRY_BACKOFF))
+            attempt += 1
+            continue
+        except PointSetNotFound:
+            if breaker is not None:
+                breaker.record_success()
+            raise
+        except BaseException:
+            # Toute autre erreur compte comme un échec : un appel d'essai
+            # doit toujours rouvrir ou refermer le circuit.
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+
+def default_breaker():
+    """Retourne le disjoncteur partagé, ou None s'il est désactivé.
+
+    Returns:
+        CircuitBreaker | None: Disjoncteur de ``PSM_BREAKER_THRESHOLD`` échecs.
+
+    """
+    global _default_breaker
+    if PSM_BREAKER_THRESHOLD <= 0:
+        return None
+    with _default_pool_lock:
+        if _default_breaker is None:
+            _default_breaker = CircuitBreaker(
+                PSM_BREAKER_THRESHOLD, PSM_BREAKER_RESET
+            )
+        return _default_breaker
+
+
+def _executor():
+    """Retourne l'exécuteur partagé des requêtes couvertes et ses places.
+
+    Returns:
+        tuple: Exécuteur de ``PSM_HEDGE_WORKERS`` threads et sémaphore
+        comptant ses threads libres, pour ne jamais mettre un appel en file.
+
+    """
+    global _hedge_executor, _hedge_slots
+    with _default_pool_lock:
+        if _hedge_executor is None:
+            workers = max(PSM_HEDGE_WORKERS, 1)
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="psm-hedge"
+            )
+            _hedge_slots = threading.BoundedSemaphore(workers)
+        return _hedge_executor, _hedge_slots
+
+
+def _request(pointset_id: str, consume, headers=None):
+    """Interroge le PointSetManager et traduit ses erreurs.
+
+    Args:
+        pointset_id (str): Identifiant du PointSet.
+        consume: Fonction appelée avec la réponse HTTP 200 ; sa valeur de
+            retour est retournée.
+        headers (dict | None): En-têtes supplémentaires de la requête. Une
+            réponse 304 à une requête conditionnelle retourne None.
+
+    Raises:
+        PointSetNotFound: Si le PointSet n’existe pas.
+        PointSetManagerUnavailable: Si le service est indisponible ou inaccessible.
+
     """
     url = f"{PSM_HOST}/pointset/{pointset_id}"
+    if headers:
+        url = urllib.request.Request(url, headers=headers)
 
     try:
-        with urllib.request.urlopen(url) as response:
+        with urllib.request.urlopen(url, timeout=PSM_READ_TIMEOUT) as response:
             if response.status == 200:
-                return response.read()
-            raise PointSetManagerUnavailable(f"Statut inattendu : {response.status}")
+                return consume(response)
+            raise PointSetManagerUnavailable(
+                f"Statut inattendu : {response.status}", response.status
+            )
 
     except urllib.error.HTTPError as e:
+        if e.code == 304 and headers:
+            return None
         if e.code == 404:
             raise PointSetNotFound(f"PointSet {pointset_id} introuvable.")
         if e.code == 503:
-            raise PointSetManagerUnavailable("PointSetManager indisponible.")
-        raise PointSetManagerUnavailable(f"Erreur PointSetManager : {e.code}")
+            raise PointSetManagerUnavailable("PointSetManager indisponible.", 503)
+        raise PointSetManagerUnavailable(f"Erreur PointSetManager : {e.code}", e.code)
 
     except urllib.error.URLError:
-        raise PointSetManagerUnavailable("Impossible de contacter le PointSetManager.")
\ No newline at end of file
+        raise PointSetManagerUnavailable("Impossible de contacter le PointSetManager.")
+
+    except (OSError, http.client.HTTPException):
+        raise PointSetManagerUnavailable("Transfert du PointSet interrompu.")
+
+
+def _decode_stream(response, chunk_size: int) -> list:
+    """Alimente un décodeur incrémental avec le corps de la réponse."""
+    length = response.headers.get("Content-Length")
+    decoder = binary.PointSetStreamDecoder(
+        int(length) if length and length.isdigit() else None
+    )
+
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    try:
+        while True:
+            received = response.readinto(buffer)
+            if not received:
+                break
+            decoder.feed(view[:received])
+    except (OSError, http.client.HTTPException):
+        raise PointSetManagerUnavailable("Transfert du PointSet interrompu.")
+
+    return decoder.close()
+
+
+def _check_status(status: int, pointset_id: str) -> None:
+    """Traduit un statut HTTP d'erreur du PointSetManager en exception.
+
+    Raises:
+        PointSetNotFound: Pour un statut 404.
+        PointSetManagerUnavailable: Pour tout autre statut que 200.
+
+    """
+    if status == 200:
+        return
+    if status == 404:
+        raise PointSetNotFound(f"PointSet {pointset_id} introuvable.")
+    if status == 503:
+        raise PointSetManagerUnavailable("PointSetManager indisponible.", 503)
+    raise PointSetManagerUnavailable(f"Erreur PointSetManager : {status}", status)
+
+
+class PointSetManagerPool:
+    """Pool borné de connexions persistantes vers le PointSetManager.
+
+    Les connexions inactives sont conservées pour les requêtes suivantes,
+    ce qui évite une poignée de main TCP par appel. Au plus
+    ``max_connections`` connexions sont ouvertes simultanément : les
+    threads supplémentaires attendent qu'une connexion se libère. Une
+    connexion réutilisée que le serveur a fermée entre-temps est remplacée
+    de manière transparente.
+    """
+
+    def __init__(
+        self,
+        host: str = PSM_HOST,
+        max_connections: int = 4,
+        connect_timeout: float = PSM_CONNECT_TIMEOUT,
+        read_timeout: float = PSM_READ_TIMEOUT,
+    ) -> None:
+        """Prépare le pool, sans ouvrir de connexion.
+
+        Args:
+            host (str): URL de base du PointSetManager (http ou https).
+            max_connections (int): Nombre maximal de connexions ouvertes.
+            connect_timeout (float): Délai d'établissement d'une connexion,
+                en secondes.
+            read_timeout (float): Délai maximal d'attente de données sur une
+                connexion établie, en secondes.
+
+        Raises:
+            ValueError: Si l'URL ou la taille du pool est invalide.
+
+        """
+        url = urllib.parse.urlsplit(host)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise ValueError(f"URL du PointSetManager invalide : {host}")
+        if max_connections < 1:
+            raise ValueError("Le pool doit autoriser au moins une connexion")
+
+        self._connection_class = (
+            http.client.HTTPSConnection
+            if url.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._address = (url.hostname, url.port)
+        self._base_path = url.path.rstrip("/")
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._idle = []
+        self.connections_opened = 0
+
+    def get_pointset_bytes(self, pointset_id: str) -> bytes:
+        """Récupère les données binaires d’un PointSet sur une connexion du pool.
+
+        Args:
+            pointset_id (str): Identifiant UUID du PointSet à récupérer.
+
+        Returns:
+            bytes: Représentation binaire du PointSet.
+
+        Raises:
+            PointSetNotFound: Si le PointSet n’existe pas.
+            PointSetManagerUnavailable: Si le service est indisponible ou
+                inaccessible.
+
+        """
+        return self.fetch(pointset_id)[0]
+
+    def get_pointset(
+        self, pointset_id: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> list:
+        """Récupère et décode un PointSet au fil de son téléchargement.
+
+        Args:
+            pointset_id (str): Identifiant UUID du PointSet à récupérer.
+            chunk_size (int): Taille maximale des morceaux lus sur la socket.
+
+        Returns:
+            list[tuple[float, float]]: Points décodés.
+
+        Raises:
+            PointSetNotFound: Si le PointSet n’existe pas.
+            PointSetManagerUnavailable: Si le service est indisponible ou si
+                le transfert est interrompu.
+            ValueError: Si le flux reçu n’est pas un PointSet valide.
+
+        """
+        path = f"{self._base_path}/pointset/{pointset_id}"
+        with self._slots:
+            response, points = self._get(
+                path, {}, lambda response: _decode_stream(response, chunk_size)
+            )
+        _check_status(response.status, pointset_id)
+        return points
+
+    def fetch(self, pointset_id: str, headers=None):
+        """Effectue un GET, éventuellement conditionnel, d'un PointSet.
+
+        Args:
+            pointset_id (str): Identifiant UUID du PointSet à récupérer.
+            headers (dict | None): En-têtes supplémentaires, par exemple
+                ``If-None-Match``.
+
+        Returns:
+            tuple | None: Corps, ``ETag`` et ``Last-Modified`` de la réponse,
+            ou None si le PointSetManager répond 304.
+
+        Raises:
+            PointSetNotFound: Si le PointSet n’existe pas.
+            PointSetManagerUnavailable: Si le service est indisponible ou
+                inaccessible.
+
+        """
+        path = f"{self._base_path}/pointset/{pointset_id}"
+        with self._slots:
+            response, body = self._get(path, headers or {})
+
+        if response.status == 304 and headers:
+            return None
+        _check_status(response.status, pointset_id)
+        return body, response.getheader("ETag"), response.getheader("Last-Modified")
+
+    def close(self) -> None:
+        """Ferme les connexions inactives du pool."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def _get(self, path: str, headers: dict, consume=None):
+        """Exécute un GET, en rouvrant une connexion réutilisée devenue obsolète.
+
+        Args:
+            path (str): Chemin de la requête.
+            headers (dict): En-têtes supplémentaires.
+            consume: Fonction lisant une réponse 200 jusqu'au bout et
+                retournant son contenu (None : corps brut). Si elle lève une
+                exception, la connexion est fermée.
+
+        Returns:
+            tuple: Réponse HTTP (déjà lue) et son corps, ou la valeur de
+            retour de ``consume``.
+
+        """
+        connection = self._checkout()
+        reused = connection.sock is not None
+        try:
+            if connection.sock is None:
+                self._connect(connection)
+            try:
+                response = self._send(connection, path, headers)
+            except (http.client.RemoteDisconnected, ConnectionError):
+                if not reused:
+                    raise
+                # Le serveur a fermé la connexion inactive : on en rouvre une.
+                connection.close()
+                self._connect(connection)
+                response = self._send(connection, path, headers)
+            if consume is not None and response.status == 200:
+                body = consume(response)
+            else:
+                body = response.read()
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            raise PointSetManagerUnavailable(
+                "Impossible de contacter le PointSetManager."
+            )
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        with self._lock:
+            self._idle.append(connection)
+        return response, body
+
+    def _checkout(self):
+        """Retourne la dernière connexion inactive, ou une nouvelle."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        host, port = self._address
+        return self._connection_class(host, port, timeout=self.connect_timeout)
+
+    def _connect(self, connection) -> None:
+        """Ouvre la socket puis applique le délai de lecture."""
+        connection.connect()
+        connection.sock.settimeout(self.read_timeout)
+        with self._lock:
+            self.connections_opened += 1
+
+    @staticmethod
+    def _send(connection, path: str, headers: dict):
+        """Envoie la requête GET et retourne la réponse HTTP."""
+        connection.request("GET", path, headers={"Connection": "keep-alive", **headers})
+        return connection.getresponse()
+
+
+def default_pool() -> PointSetManagerPool:
+    """Retourne le pool partagé vers ``PSM_HOST``, créé au premier appel.
+
+    Returns:
+        PointSetManagerPool: Pool de ``PSM_POOL_SIZE`` connexions.
+
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = PointSetManagerPool(
+                PSM_HOST, max_connections=max(PSM_POOL_SIZE, 1)
+            )
+        return _default_pool
+
+
+class AsyncPointSetManagerClient:
+    """Client asyncio du PointSetManager, sur les flux de la bibliothèque standard.
+
+    Chaque récupération ouvre une connexion HTTP/1.1 dédiée
+    (``Connection: close``) ; les erreurs sont traduites comme par
+    `get_pointset_bytes`.
+    """
+
+    def __init__(
+        self, host: str = PSM_HOST, timeout: float = PSM_READ_TIMEOUT
+    ) -> None:
+        """Prépare le client.
+
+        Args:
+            host (str): URL de base du PointSetManager (http ou https).
+            timeout (float): Durée maximale d'une récupération, en secondes.
+
+        Raises:
+            ValueError: Si l'URL est invalide.
+
+        """
+        url = urllib.parse.urlsplit(host)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise ValueError(f"URL du PointSetManager invalide : {host}")
+
+        self._host = url.hostname
+        self._port = url.port or (443 if url.scheme == "https" else 80)
+        self._ssl = ssl.create_default_context() if url.scheme == "https" else None
+        self._base_path = url.path.rstrip("/")
+        self.timeout = timeout
+
+    async def get_pointset_bytes(self, pointset_id: str) -> bytes:
+        """Récupère les données binaires d’un PointSet.
+
+        Args:
+            pointset_id (str): Identifiant UUID du PointSet à récupérer.
+
+        Returns:
+            bytes: Représentation binaire du PointSet.
+
+        Raises:
+            PointSetNotFound: Si le PointSet n’existe pas.
+            PointSetManagerUnavailable: Si le service est indisponible ou
+                inaccessible.
+
+        """
+        try:
+            status, body = await asyncio.wait_for(
+                self._get(f"{self._base_path}/pointset/{pointset_id}"),
+                self.timeout,
+            )
+        except (
+            OSError,
+            ValueError,
+            asyncio.TimeoutError,
+            asyncio.IncompleteReadError,
+        ):
+            raise PointSetManagerUnavailable(
+                "Impossible de contacter le PointSetManager."
+            )
+
+        _check_status(status, pointset_id)
+        return body
+
+    async def get_many(self, pointset_ids, concurrency: int = 8) -> list:
+        """Récupère plusieurs PointSets, au plus ``concurrency`` à la fois.
+
+        Args:
+            pointset_ids (Iterable[str]): Identifiants des PointSets.
+            concurrency (int): Nombre maximal de récupérations simultanées.
+
+        Returns:
+            list[bytes]: Données binaires, dans l'ordre des identifiants.
+
+        Raises:
+            PointSetNotFound: Si l'un des PointSets n’existe pas ; les
+                récupérations en cours sont alors annulées.
+            PointSetManagerUnavailable: Si le service est indisponible.
+            ValueError: Si ``concurrency`` est inférieur à 1.
+
+        """
+        if concurrency < 1:
+            raise ValueError("La concurrence doit être d'au moins 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(pointset_id):
+            async with semaphore:
+                return await self.get_pointset_bytes(pointset_id)
+
+        tasks = [asyncio.ensure_future(fetch(i)) for i in pointset_ids]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _get(self, path: str):
+        """Envoie un GET et lit la réponse complète.
+
+        Returns:
+            tuple[int, bytes]: Statut HTTP et corps de la réponse.
+
+        """
+        reader, writer = await asyncio.open_connection(
+            self._host, self._port, ssl=self._ssl
+        )
+        try:
+            writer.write(
+                f"GET {path} HTTP/1.1\r\n"
+                f"Host: {self._host}:{self._port}\r\n"
+                "Connection: close\r\n\r\n".encode("latin-1")
+            )
+            await writer.drain()
+
+            status = _parse_status_line(await reader.readline())
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            if headers.get("transfer-encoding", "").lower() == "chunked":
+                body = await _read_chunked(reader)
+            elif "content-length" in headers:
+                body = await reader.readexactly(int(headers["content-length"]))
+            else:
+                body = await reader.read()
+            return status, body
+        finally:
+            writer.close()
+
+
+def _parse_status_line(line: bytes) -> int:
+    """Retourne le code d'une ligne de statut HTTP.
+
+    Raises:
+        ValueError: Si la ligne est vide (connexion fermée sans réponse) ou
+            mal formée.
+
+    """
+    parts = line.split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith(b"HTTP/"):
+        raise ValueError(f"Ligne de statut HTTP invalide : {line!r}")
+    code = parts[1]
+    if len(code) != 3 or not code.isdigit():
+        raise ValueError(f"Ligne de statut HTTP invalide : {line!r}")
+    return int(code)
+
+
+async def _read_chunked(reader) -> bytes:
+    """Lit un corps HTTP en ``Transfer-Encoding: chunked``."""
+    body = bytearray()
+    while True:
+        size = int((await reader.readline()).split(b";")[0], 16)
+        if size == 0:
+            await reader.readline()
+            return bytes(body)
+        body += await reader.readexactly(size)
+        await reader.readexactly(2)
@@ -3,26 +3,46 @@
 Ce module implémente une triangulation de points 2D basée sur
 l’algorithme de Bowyer-Watson (triangulation de Delaunay).
 Il fournit :
-- la triangulation à partir d’une liste de points,
+- la triangulation à partir d’une liste de points, via le moteur à
+  adjacence de `triangulator.mesh` ou la version historique par listes,
+  et en parallèle (`triangulator.parallel`) au-delà d’un seuil de taille,
+- une triangulation incrémentale (`Triangulation`) qui conserve son
+  maillage entre deux ajouts de points,
 - un pipeline complet binaire (décodage → triangulation → encodage).
 """
 
 from __future__ import annotations
 
-from typing import List, Sequence, Tuple
+import os
+import struct
+from array import array
+from functools import partial
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+try:  # NumPy est optionnel : il accélère le moteur par balayage.
+    import numpy as np
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    np = None
 
 from triangulator.binary import decode_point_set, encode_triangles
+from triangulator.mesh import DelaunayMesh
+from triangulator.ordering import brio_order, hilbert_order
+from triangulator.parallel import triangulate_parallel
+from triangulator.predicates import (
+    CCW_ERRBOUND,
+    ICC_ERRBOUND,
+    incircle,
+    orient2d,
+)
 
 Point = Tuple[float, float]
 Triangle = Tuple[int, int, int]
+TriangleOutput = Union[List[Triangle], array, "np.ndarray"]
 
-
-def _distance_sq(p1: Point, p2: Point) -> float:
-    """Compute the squared Euclidean distance between two points.
-
-    This helper avoids using a square root for performance reasons.
-    """
-    return (p1[0] - p2[0])**2 + (p1[1] - p2[1])**2
+# Nombre de points à partir duquel le moteur "auto" triangule en parallèle
+# (0 désactive la bascule), et nombre de processus utilisés (0 : un par cœur).
+PARALLEL_THRESHOLD = int(os.getenv("TRIANGULATOR_PARALLEL_THRESHOLD", "200000"))
+PARALLEL_WORKERS = int(os.getenv("TRIANGULATOR_WORKERS", "0"))
 
 
 def _circumcircle_contains(
@@ -39,81 +59,258 @@ def _circumcircle_contains(
 
     Returns:
         True si le point est strictement à l’intérieur du cercle circonscrit,
-        False sinon.
+        False sinon (en particulier pour un triangle dégénéré).
 
     """
-    p1 = points[tri_indices[0]]
-    p2 = points[tri_indices[1]]
-    p3 = points[tri_indices[2]]
+    ax, ay = points[tri_indices[0]]
+    bx, by = points[tri_indices[1]]
+    cx, cy = points[tri_indices[2]]
+    return _in_circumcircle(ax, ay, bx, by, cx, cy, point[0], point[1])
+
+
+def _in_circumcircle(
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    cx: float,
+    cy: float,
+    px: float,
+    py: float,
+) -> bool:
+    """Évalue le test du cercle circonscrit avec les prédicats robustes.
 
-    ax, ay = p1
-    bx, by = p2
-    cx, cy = p3
-    
-    d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
-    
-    if abs(d) < 1e-9:
+    Le signe de `incircle` est corrigé par celui de l'orientation, ce qui
+    rend le test indépendant du sens de parcours du triangle.
+    """
+    orientation = orient2d(ax, ay, bx, by, cx, cy)
+    if orientation == 0:
         return False
+    det = incircle(ax, ay, bx, by, cx, cy, px, py)
+    return det > 0 if orientation > 0 else det < 0
 
-    ux = (
-        (ax**2 + ay**2) * (by - cy)
-        + (bx**2 + by**2) * (cy - ay)
-        + (cx**2 + cy**2) * (ay - by)
-    ) / d
-    uy = (
-        (ax**2 + ay**2) * (cx - bx)
-        + (bx**2 + by**2) * (ax - cx)
-        + (cx**2 + cy**2) * (bx - ax)
-    ) / d
-    
-    center = (ux, uy)
-    
-    radius_sq = _distance_sq(center, p1)
-    dist_sq = _distance_sq(center, point)
 
-    return dist_sq < radius_sq
+def _circumcircle_mask(tri_coords: np.ndarray, point: Point) -> np.ndarray:
+    """Évalue le test du cercle circonscrit sur un lot de triangles.
 
+    Version vectorisée de `_circumcircle_contains` : l'orientation et le
+    déterminant « incircle » sont calculés en une passe NumPy avec les
+    bornes d'erreur de `triangulator.predicates`. Seuls les triangles dont
+    le signe reste incertain sont réévalués par le prédicat exact.
 
-def triangulate(points: Sequence[Point]) -> List[Triangle]:
+    Args:
+        tri_coords: Tableau (T, 3, 2) des coordonnées des sommets.
+        point: Point à tester.
+
+    Returns:
+        Masque booléen (T,) des triangles dont le cercle circonscrit
+        contient strictement le point.
+
+    """
+    px, py = point
+    adx = tri_coords[:, 0, 0] - px
+    ady = tri_coords[:, 0, 1] - py
+    bdx = tri_coords[:, 1, 0] - px
+    bdy = tri_coords[:, 1, 1] - py
+    cdx = tri_coords[:, 2, 0] - px
+    cdy = tri_coords[:, 2, 1] - py
+
+    orient_left = (adx - cdx) * (bdy - cdy)
+    orient_right = (ady - cdy) * (bdx - cdx)
+    orientation = orient_left - orient_right
+    orient_bound = CCW_ERRBOUND * (np.abs(orient_left) + np.abs(orient_right))
+
+    bdxcdy = bdx * cdy
+    cdxbdy = cdx * bdy
+    cdxady = cdx * ady
+    adxcdy = adx * cdy
+    adxbdy = adx * bdy
+    bdxady = bdx * ady
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+
+    det = (
+        alift * (bdxcdy - cdxbdy)
+        + blift * (cdxady - adxcdy)
+        + clift * (adxbdy - bdxady)
+    )
+    permanent = (
+        (np.abs(bdxcdy) + np.abs(cdxbdy)) * alift
+        + (np.abs(cdxady) + np.abs(adxcdy)) * blift
+        + (np.abs(adxbdy) + np.abs(bdxady)) * clift
+    )
+
+    mask = det * np.sign(orientation) > 0
+    uncertain = (np.abs(det) <= ICC_ERRBOUND * permanent) | (
+        np.abs(orientation) <= orient_bound
+    )
+    for t in np.flatnonzero(uncertain).tolist():
+        (ax, ay), (bx, by), (cx, cy) = tri_coords[t].tolist()
+        mask[t] = _in_circumcircle(ax, ay, bx, by, cx, cy, px, py)
+    return mask
+
+
+def triangulate(
+    points: Sequence[Point],
+    engine: str = "auto",
+    order: str = "brio",
+    output: str = "list",
+    progress: Optional[Callable[[int], None]] = None,
+) -> TriangleOutput:
     """Compute the Delaunay triangulation of a 2D point set.
 
     Args:
         points: Sequence of (x, y) coordinates.
+        engine: Triangulation engine: ``"mesh"`` (adjacency-based, walking
+            point location), ``"parallel"`` (``"mesh"`` on spatial strips
+            in a process pool), ``"bowyer-watson"`` (list scanning), or
+            ``"auto"`` which picks ``"parallel"`` from
+            ``PARALLEL_THRESHOLD`` points and ``"mesh"`` below.
+        order: Insertion order, either ``"brio"`` (randomized rounds sorted
+            along a Hilbert curve), ``"hilbert"`` or ``"input"``. Triangle
+            indices always refer to the input order. The parallel engine
+            always inserts in BRIO order.
+        output: Triangle container: ``"list"`` (list of index triplets),
+            ``"array"`` (flat ``array('I')`` of 3 indices per triangle) or
+            ``"numpy"`` (``uint32`` array of shape (T, 3) sharing the flat
+            array's memory). Both buffers can be passed directly to
+            `binary.encode_triangles`.
+        progress: Called with the number of points inserted so far. The
+            ``"mesh"`` engine reports every ``mesh.PROGRESS_INTERVAL``
+            insertions; the other engines only report completion.
 
     Returns:
-        List of triangles represented as index triplets.
+        Triangles as index triplets, in the requested container.
 
     Raises:
-        ValueError: If fewer than three points are provided.
-        
+        ValueError: If fewer than three points are provided, the engine,
+            order or output is unknown, or NumPy output is requested
+            without NumPy installed.
+
     """
-    n = len(points)
-    if n < 3:
+    if len(points) < 3:
         raise ValueError("Moins de 3 points: non triangulable.")
+    if output not in ("list", "array", "numpy"):
+        raise ValueError(f"Format de sortie inconnu : {output}")
+    if output == "numpy" and np is None:
+        raise ValueError("La sortie NumPy nécessite le paquet numpy.")
+
+    if engine == "auto":
+        large = PARALLEL_THRESHOLD and len(points) >= PARALLEL_THRESHOLD
+        engine = "parallel" if large else "mesh"
+
+    if engine == "parallel":
+        triangles = triangulate_parallel(points, workers=PARALLEL_WORKERS or None)
+        if progress is not None:
+            progress(len(points))
+        return _as_output(triangles, output)
+    if engine == "mesh":
+        run = _triangulate_mesh_array if output != "list" else _triangulate_mesh
+    elif engine == "bowyer-watson":
+        run = (
+            _triangulate_bowyer_watson_numpy
+            if np is not None
+            else _triangulate_bowyer_watson
+        )
+    else:
+        raise ValueError(f"Moteur de triangulation inconnu : {engine}")
+    if progress is not None:
+        run = partial(run, progress=progress)
+
+    if order == "input":
+        return _as_output(run(points), output)
+    if order == "brio":
+        permutation = brio_order(points)
+    elif order == "hilbert":
+        permutation = hilbert_order(points)
+    else:
+        raise ValueError(f"Ordre d'insertion inconnu : {order}")
+
+    triangles = run([points[i] for i in permutation])
+    if isinstance(triangles, array):
+        remapped = array("I", map(permutation.__getitem__, triangles))
+        return _as_output(remapped, output)
+    remapped = [
+        (permutation[a], permutation[b], permutation[c]) for a, b, c in triangles
+    ]
+    return _as_output(remapped, output)
+
+
+def _triangulate_mesh(
+    points: Sequence[Point], progress: Optional[Callable[[int], None]] = None
+) -> List[Triangle]:
+    """Compute the triangulation with the adjacency-based engine."""
+    return DelaunayMesh.from_points(points, progress).triangles()
+
+
+def _triangulate_mesh_array(
+    points: Sequence[Point], progress: Optional[Callable[[int], None]] = None
+) -> array:
+    """Compute the adjacency-based triangulation as a flat ``array('I')``."""
+    return DelaunayMesh.from_points(points, progress).triangle_array()
+
+
+def _as_output(
+    triangles: Union[List[Triangle], array], output: str
+) -> TriangleOutput:
+    """Convertit des triangles (liste ou tableau plat) dans le format demandé."""
+    if output == "list":
+        if isinstance(triangles, array):
+            it = iter(triangles)
+            return list(zip(it, it, it))
+        return triangles
+
+    flat = triangles
+    if not isinstance(flat, array):
+        flat = array("I", [v for t in triangles for v in t])
+    if output == "array":
+        return flat
+    return np.frombuffer(flat, dtype=np.uint32).reshape(-1, 3)
+
+
+def _cavity_boundary(bad_triangles: Sequence[Triangle]) -> List[Tuple[int, int]]:
+    """Extrait le bord d'une cavité en comptant ses arêtes non orientées.
+
+    Une arête partagée par deux triangles de la cavité est intérieure ; les
+    arêtes vues une seule fois forment le bord. Chaque arête de bord est
+    retournée avec l'orientation qu'elle a dans son triangle, en O(k) pour
+    k triangles.
 
-    
-    min_x = min(p[0] for p in points)
-    max_x = max(p[0] for p in points)
-    min_y = min(p[1] for p in points)
-    max_y = max(p[1] for p in points)
-
-    dx = max_x - min_x
-    dy = max_y - min_y
-    delta_max = max(dx, dy)
-    
-    mid_x = (min_x + max_x) / 2
-    mid_y = (min_y + max_y) / 2
+    Args:
+        bad_triangles: Triangles dont le cercle circonscrit contient le point.
 
-    p_st1 = (mid_x - 20 * delta_max, mid_y - delta_max)
-    p_st2 = (mid_x, mid_y + 20 * delta_max)
-    p_st3 = (mid_x + 20 * delta_max, mid_y - delta_max)
+    Returns:
+        Liste des arêtes orientées (a, b) du bord de la cavité.
 
+    """
+    edges = {}
+    for a, b, c in bad_triangles:
+        for u, v in ((a, b), (b, c), (c, a)):
+            key = (u, v) if u < v else (v, u)
+            # None marque une arête déjà vue : elle est intérieure.
+            edges[key] = None if key in edges else (u, v)
+    return [edge for edge in edges.values() if edge is not None]
+
+
+def _triangulate_bowyer_watson(
+    points: Sequence[Point], progress: Optional[Callable[[int], None]] = None
+) -> List[Triangle]:
+    """Compute the triangulation by scanning the whole triangle list.
+
+    Every inserted point is tested against every triangle, which makes this
+    engine quadratic; it is kept as a reference for the ``"mesh"`` engine.
+    ``progress`` is only called once, on completion.
+    """
+    n = len(points)
     local_points = list(points)
-    local_points.extend([p_st1, p_st2, p_st3])
+    local_points.extend(_super_triangle(points))
     
     st_idx1, st_idx2, st_idx3 = n, n+1, n+2
 
-    triangulation = [(st_idx1, st_idx2, st_idx3)]
+    # Sens trigonométrique : chaque arête de bord de cavité garde alors
+    # l'orientation de son triangle et l'éventail reste orienté de même.
+    triangulation = [(st_idx1, st_idx3, st_idx2)]
 
     for i in range(n):
         point = local_points[i]
@@ -123,30 +320,7 @@ def triangulate(points: Sequence[Point]) -> List[Triangle]:
             if _circumcircle_contains(tri, point, local_points):
                 bad_triangles.append(tri)
 
-        polygon = []
-        
-        for tri in bad_triangles:
-            edges = [
-                (tri[0], tri[1]),
-                (tri[1], tri[2]),
-                (tri[2], tri[0])
-            ]
-            for edge in edges:
-                is_shared = False
-                for other_tri in bad_triangles:
-                    if tri == other_tri:
-                        continue
-                    other_edges = [
-                        (other_tri[0], other_tri[1]), 
-                        (other_tri[1], other_tri[2]), 
-                        (other_tri[2], other_tri[0])
-                    ]
-                    if edge in other_edges or (edge[1], edge[0]) in other_edges:
-                        is_shared = True
-                        break
-                
-                if not is_shared:
-                    polygon.append(edge)
+        polygon = _cavity_boundary(bad_triangles)
 
         for tri in bad_triangles:
             triangulation.remove(tri)
@@ -160,9 +334,228 @@ def triangulate(points: Sequence[Point]) -> List[Triangle]:
             continue
         final_triangles.append(tri)
 
+    if progress is not None:
+        progress(n)
     return final_triangles
 
 
+def _triangulate_bowyer_watson_numpy(
+    points: Sequence[Point], progress: Optional[Callable[[int], None]] = None
+) -> List[Triangle]:
+    """Compute the scanning triangulation with the batched NumPy predicate.
+
+    Triangle indices and vertex coordinates are kept in parallel arrays so
+    that each insertion evaluates all circumcircles in a single call.
+    """
+    n = len(points)
+    coords = np.array(list(points) + _super_triangle(points), dtype=float)
+    coords = coords.reshape(-1, 2)
+
+    tris = np.array([[n, n + 2, n + 1]], dtype=np.intp)
+    tri_coords = coords[tris]
+
+    for i in range(n):
+        bad = _circumcircle_mask(tri_coords, (coords[i, 0], coords[i, 1]))
+        if not bad.any():
+            continue
+
+        polygon = _cavity_boundary([tuple(t) for t in tris[bad].tolist()])
+        fan = np.array([(a, b, i) for a, b in polygon], dtype=np.intp)
+        fan = fan.reshape(-1, 3)
+
+        keep = ~bad
+        tris = np.concatenate((tris[keep], fan))
+        tri_coords = np.concatenate((tri_coords[keep], coords[fan]))
+
+    final = tris[(tris < n).all(axis=1)]
+    if progress is not None:
+        progress(n)
+    return [tuple(t) for t in final.tolist()]
+
+
+def _super_triangle(points: Sequence[Point]) -> List[Point]:
+    """Retourne les trois sommets du super-triangle englobant les points."""
+    min_x = min(p[0] for p in points)
+    max_x = max(p[0] for p in points)
+    min_y = min(p[1] for p in points)
+    max_y = max(p[1] for p in points)
+
+    dx = max_x - min_x
+    dy = max_y - min_y
+    delta_max = max(dx, dy)
+
+    mid_x = (min_x + max_x) / 2
+    mid_y = (min_y + max_y) / 2
+
+    p_st1 = (mid_x - 20 * delta_max, mid_y - delta_max)
+    p_st2 = (mid_x, mid_y + 20 * delta_max)
+    p_st3 = (mid_x + 20 * delta_max, mid_y - delta_max)
+    return [p_st1, p_st2, p_st3]
+
+
+class Triangulation:
+    """Triangulation de Delaunay incrémentale, extensible point par point.
+
+    Le maillage (super-triangle compris) est conservé entre deux appels à
+    `insert` : ajouter k points coûte environ O(k log n), sans recalcul.
+    Le super-triangle est dimensionné sur un « domaine » rectangulaire ;
+    un point tombant hors du domaine déclenche une reconstruction complète
+    sur un domaine deux fois plus grand, ce qui amortit les agrandissements.
+    Comme pour `triangulate`, les triangles très aplatis le long de
+    l'enveloppe convexe peuvent dépendre de la taille de ce domaine.
+
+    Les indices des triangles désignent les points dans leur ordre d'ajout.
+    """
+
+    _STATE_MAGIC = b"TRIS"
+
+    def __init__(self, points: Sequence[Point] = ()) -> None:
+        """Crée la triangulation, éventuellement avec des points initiaux.
+
+        Args:
+            points: Points initiaux (x, y).
+
+        """
+        self._points: List[Point] = []
+        self._ids: List[int] = []
+        self._mesh: Optional[DelaunayMesh] = None
+        self._domain = (0.0, 0.0, 0.0, 0.0)
+        if len(points):
+            self.insert(points)
+
+    @property
+    def points(self) -> List[Point]:
+        """Retourne une copie des points, dans leur ordre d'ajout."""
+        return list(self._points)
+
+    def insert(self, points: Sequence[Point]) -> List[int]:
+        """Ajoute des points à la triangulation.
+
+        Les nouveaux points sont insérés dans l'ordre BRIO pour garder des
+        marches de localisation courtes.
+
+        Args:
+            points: Points (x, y) à ajouter.
+
+        Returns:
+            Indices attribués aux nouveaux points.
+
+        """
+        first = len(self._points)
+        added = [(float(x), float(y)) for x, y in points]
+        self._points.extend(added)
+        if not added:
+            return []
+
+        min_x, min_y, max_x, max_y = self._domain
+        inside = self._mesh is not None and all(
+            min_x <= x <= max_x and min_y <= y <= max_y for x, y in added
+        )
+        if not inside:
+            self._rebuild(grow=self._mesh is not None)
+        else:
+            for k in brio_order(added):
+                self._mesh.insert(*added[k])
+                self._ids.append(first + k)
+        return list(range(first, len(self._points)))
+
+    def triangles(self) -> List[Triangle]:
+        """Retourne les triangles courants (indices des points d'ajout)."""
+        if self._mesh is None:
+            return []
+        ids = self._ids
+        return [(ids[a], ids[b], ids[c]) for a, b, c in self._mesh.triangles()]
+
+    def to_bytes(self) -> bytes:
+        """Encode les sommets et triangles au format binaire Triangles."""
+        if self._mesh is None:
+            return encode_triangles(self._points, [])
+        flat = array("I", map(self._ids.__getitem__, self._mesh.triangle_array()))
+        return encode_triangles(self._points, flat)
+
+    def dump_state(self) -> bytes:
+        """Sérialise la triangulation pour pouvoir la prolonger plus tard.
+
+        Returns:
+            État binaire (points, domaine et maillage), relu par
+            `Triangulation.load_state`.
+
+        """
+        coords = array("d", [c for p in self._points for c in p])
+        ids = array("q", self._ids)
+        mesh = self._mesh.dump_state() if self._mesh is not None else b""
+        header = struct.pack(
+            "<4s4dqqq",
+            self._STATE_MAGIC,
+            *self._domain,
+            len(self._points),
+            len(ids),
+            len(mesh),
+        )
+        return header + coords.tobytes() + ids.tobytes() + mesh
+
+    @classmethod
+    def load_state(cls, data: bytes) -> Triangulation:
+        """Restaure une triangulation sérialisée par `dump_state`.
+
+        Args:
+            data: État binaire.
+
+        Returns:
+            Triangulation prête à recevoir de nouveaux points.
+
+        Raises:
+            ValueError: Si l'état est tronqué ou incohérent.
+
+        """
+        header_size = struct.calcsize("<4s4dqqq")
+        if len(data) < header_size:
+            raise ValueError("État de triangulation tronqué")
+        magic, *domain, n_points, n_ids, mesh_size = struct.unpack_from(
+            "<4s4dqqq", data
+        )
+        if magic != cls._STATE_MAGIC:
+            raise ValueError("État de triangulation inconnu")
+        expected = header_size + 16 * n_points + 8 * n_ids + mesh_size
+        if min(n_points, n_ids, mesh_size) < 0 or len(data) != expected:
+            raise ValueError("Longueur invalide pour un état de triangulation")
+
+        view = memoryview(data)
+        offset = header_size
+        coords = array("d")
+        coords.frombytes(view[offset:offset + 16 * n_points])
+        offset += 16 * n_points
+        ids = array("q")
+        ids.frombytes(view[offset:offset + 8 * n_ids])
+        offset += 8 * n_ids
+        if ids and not (0 <= min(ids) and max(ids) < n_points):
+            raise ValueError("Indice de point hors de l'état de triangulation")
+
+        triangulation = cls()
+        triangulation._points = list(zip(coords[0::2], coords[1::2]))
+        triangulation._ids = ids.tolist()
+        triangulation._domain = tuple(domain)
+        if mesh_size:
+            triangulation._mesh = DelaunayMesh.load_state(view[offset:])
+        return triangulation
+
+    def _rebuild(self, grow: bool) -> None:
+        """Reconstruit le maillage sur un domaine englobant tous les points."""
+        xs = [p[0] for p in self._points]
+        ys = [p[1] for p in self._points]
+        min_x, min_y, max_x, max_y = min(xs), min(ys), max(xs), max(ys)
+        if grow:
+            half = max(max_x - min_x, max_y - min_y) / 2
+            min_x, min_y = min_x - half, min_y - half
+            max_x, max_y = max_x + half, max_y + half
+
+        self._domain = (min_x, min_y, max_x, max_y)
+        self._mesh = DelaunayMesh(*self._domain)
+        self._ids = brio_order(self._points)
+        for i in self._ids:
+            self._mesh.insert(*self._points[i])
+
+
 def triangulate_data(data: bytes) -> bytes:
     """Exécute le pipeline complet de triangulation à partir de données binaires.
 
@@ -179,5 +572,5 @@ def triangulate_data(data: bytes) -> bytes:
 
     """
     points = decode_point_set(data)
-    triangles = triangulate(points)
+    triangles = triangulate(points, output="array")
     return encode_triangles(points, triangles)
\ No newline at end of file
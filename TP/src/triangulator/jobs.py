@@ -0,0 +1,198 @@
+"""File de tâches de triangulation asynchrones.
+
+Une triangulation volumineuse peut dépasser le délai d'un proxy HTTP.
+`JobQueue` la découple de la requête : la tâche est placée dans une file
+bornée, exécutée par un petit nombre de threads, puis son résultat est
+conservé jusqu'à expiration pour être téléchargé plus tard. La taille cumulée
+des résultats conservés est bornée : au-delà, les tâches réussies les plus
+anciennes sont oubliées avant leur expiration. Le calcul lui-même
+est fourni par l'appelant (l'API le confie au pool de processus de
+`triangulator.workers`).
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class JobQueueFull(Exception):
+    """Exception levée lorsque la file de tâches est pleine."""
+
+
+class Job:
+    """Tâche de triangulation et son état.
+
+    Attributes:
+        id (str): Identifiant (UUID) de la tâche.
+        pointset_id (str): PointSet à trianguler.
+        media_type (str): Format de réponse demandé.
+        status (str): ``"queued"``, ``"running"``, ``"succeeded"`` ou
+            ``"failed"``.
+        inserted (int): Points déjà insérés.
+        total (int): Nombre total de points (0 tant qu'il est inconnu).
+        result (bytes | None): Réponse encodée, une fois la tâche réussie.
+        error (Exception | None): Exception de la tâche échouée.
+        etag (str | None): Validateur de la réponse.
+
+    """
+
+    def __init__(self, pointset_id: str, media_type: str) -> None:
+        """Crée une tâche en attente."""
+        self.id = str(uuid.uuid4())
+        self.pointset_id = pointset_id
+        self.media_type = media_type
+        self.status = QUEUED
+        self.inserted = 0
+        self.total = 0
+        self.result: Optional[bytes] = None
+        self.error: Optional[Exception] = None
+        self.etag: Optional[str] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        """bool: Vrai si la tâche a réussi ou échoué."""
+        return self.status in (SUCCEEDED, FAILED)
+
+    def report(self, inserted: int) -> None:
+        """Enregistre le nombre de points insérés."""
+        self.inserted = inserted
+
+
+class JobQueue:
+    """File bornée de tâches exécutées par un pool de threads."""
+
+    def __init__(
+        self,
+        run: Callable[[Job], Any],
+        max_pending: int = 64,
+        workers: int = 2,
+        ttl: float = 600.0,
+        max_result_bytes: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Crée une file vide ; les threads sont lancés à la première tâche.
+
+        Args:
+            run: Exécute une tâche et retourne ``(résultat, etag)`` ; ses
+                exceptions font échouer la tâche.
+            max_pending: Nombre maximal de tâches en attente.
+            workers: Nombre de threads d'exécution.
+            ttl: Durée de conservation d'une tâche terminée, en secondes.
+            max_result_bytes: Taille cumulée maximale des résultats conservés
+                (None : illimitée). La tâche qui vient de réussir est
+                toujours gardée ; les plus anciennes sont oubliées d'abord.
+            clock: Horloge monotone, remplaçable pour les tests.
+
+        """
+        self._run = run
+        self.workers = workers
+        self.ttl = ttl
+        self.max_result_bytes = max_result_bytes
+        self._clock = clock
+        self._pending: "queue.Queue[Job]" = queue.Queue(maxsize=max_pending)
+        self._jobs: Dict[str, Job] = {}
+        # Tâches réussies dans l'ordre de fin, avec la taille de leur résultat.
+        self._results: "OrderedDict[str, int]" = OrderedDict()
+        self._result_bytes = 0
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+    def submit(self, pointset_id: str, media_type: str) -> Job:
+        """Ajoute une tâche à la file.
+
+        Args:
+            pointset_id: PointSet à trianguler.
+            media_type: Format de réponse demandé.
+
+        Returns:
+            Job: Tâche créée, en attente.
+
+        Raises:
+            JobQueueFull: Si ``max_pending`` tâches attendent déjà.
+
+        """
+        self._expire()
+        job = Job(pointset_id, media_type)
+        with self._lock:
+            self._start_workers()
+            try:
+                self._pending.put_nowait(job)
+            except queue.Full:
+                raise JobQueueFull("File de triangulation pleine.") from None
+            self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Retourne une tâche, ou None si elle est inconnue ou expirée."""
+        self._expire()
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _start_workers(self) -> None:
+        """Lance les threads d'exécution manquants (verrou tenu)."""
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._work, name="triangulation-job", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self) -> None:
+        """Boucle d'un thread d'exécution."""
+        while True:
+            job = self._pending.get()
+            job.status = RUNNING
+            try:
+                job.result, job.etag = self._run(job)
+                job.inserted = job.total
+                status = SUCCEEDED
+            except Exception as exc:
+                job.error = exc
+                status = FAILED
+            job.finished_at = self._clock()
+            if status == SUCCEEDED:
+                self._retain(job)
+            job.status = status
+            self._pending.task_done()
+
+    def _retain(self, job: Job) -> None:
+        """Comptabilise un résultat et oublie les plus anciens au-delà du budget."""
+        with self._lock:
+            size = len(job.result or b"")
+            self._results[job.id] = size
+            self._result_bytes += size
+            if self.max_result_bytes is None:
+                return
+            while self._result_bytes > self.max_result_bytes:
+                job_id = next(iter(self._results))
+                if job_id == job.id:
+                    break
+                self._forget(job_id)
+
+    def _forget(self, job_id: str) -> None:
+        """Oublie une tâche et son résultat (verrou tenu)."""
+        self._jobs.pop(job_id, None)
+        self._result_bytes -= self._results.pop(job_id, 0)
+
+    def _expire(self) -> None:
+        """Oublie les tâches terminées depuis plus de ``ttl`` secondes."""
+        deadline = self._clock() - self.ttl
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.finished_at is not None and job.finished_at < deadline
+            ]
+            for job_id in expired:
+                self._forget(job_id)
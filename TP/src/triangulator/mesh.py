@@ -0,0 +1,484 @@
+"""Moteur de triangulation de Delaunay basé sur l'adjacence des triangles.
+
+Contrairement à la version « liste » de Bowyer-Watson de `core`, ce moteur
+conserve pour chaque triangle ses trois voisins. L'insertion d'un point se
+fait alors en trois étapes locales :
+
+- localisation du triangle contenant le point par marche orientée
+  (visibility walk) depuis le dernier triangle créé,
+- croissance de la cavité (triangles dont le cercle circonscrit contient
+  le point) par parcours des voisins à partir du triangle contenant,
+- remplacement de la cavité par un éventail de triangles reliés au point.
+
+Le coût d'une insertion ne dépend donc que de la taille de la cavité et de
+la longueur de la marche, et non plus du nombre total de triangles.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from triangulator.predicates import incircle, orient2d
+
+Point = Tuple[float, float]
+Triangle = Tuple[int, int, int]
+
+# Les trois sommets du super-triangle occupent les premiers indices internes ;
+# le point d'entrée i est stocké à l'indice interne i + SUPER_VERTICES.
+SUPER_VERTICES = 3
+
+# Voisin absent (arête du super-triangle).
+NO_NEIGHBOR = -1
+
+# En-tête de l'état sérialisé d'un maillage (voir `DelaunayMesh.dump_state`).
+STATE_MAGIC = b"DMSH"
+STATE_VERSION = 1
+
+# Marge relative du filtre par cercle mis en cache : en deçà, la distance
+# au cercle est trop proche de l'erreur d'arrondi du centre et le prédicat
+# robuste `incircle` tranche.
+CIRCLE_FILTER_MARGIN = 1e-8
+
+# Sinus minimal de l'angle en a (d / (|ab| |ac|)) pour qu'un triangle
+# garde un cercle en cache ; les triangles plus aplatis passent toujours
+# par le prédicat robuste.
+MIN_CACHED_SINE = 1e-6
+
+# Nombre d'insertions entre deux appels du suivi de progression de
+# `DelaunayMesh.from_points`.
+PROGRESS_INTERVAL = 4096
+
+
+class DelaunayMesh:
+    """Triangulation de Delaunay incrémentale avec adjacence explicite.
+
+    Les triangles sont stockés dans des listes plates indexées par « slot » :
+    ``_tri[3 * t + k]`` est le k-ième sommet du triangle ``t`` (ordre
+    trigonométrique) et ``_adj[3 * t + k]`` le triangle voisin partageant
+    l'arête opposée à ce sommet. Un slot libéré est marqué par un premier
+    sommet à -1 et réutilisé lors des insertions suivantes.
+
+    Le cercle circonscrit de chaque triangle est calculé une seule fois, à
+    sa création, et rangé dans trois colonnes ``array('d')`` parallèles
+    (centre ``_cx``, ``_cy`` et rayon au carré ``_r2``) indexées par slot.
+    """
+
+    def __init__(
+        self,
+        min_x: float,
+        min_y: float,
+        max_x: float,
+        max_y: float,
+    ) -> None:
+        """Initialise le maillage avec un super-triangle englobant la boîte.
+
+        Args:
+            min_x: Abscisse minimale des points à insérer.
+            min_y: Ordonnée minimale des points à insérer.
+            max_x: Abscisse maximale des points à insérer.
+            max_y: Ordonnée maximale des points à insérer.
+
+        """
+        delta_max = max(max_x - min_x, max_y - min_y) or 1.0
+        mid_x = (min_x + max_x) / 2
+        mid_y = (min_y + max_y) / 2
+
+        # Mêmes proportions que le super-triangle de `core.triangulate`,
+        # listées dans le sens trigonométrique.
+        self._xs: List[float] = [
+            mid_x - 20 * delta_max,
+            mid_x + 20 * delta_max,
+            mid_x,
+        ]
+        self._ys: List[float] = [
+            mid_y - delta_max,
+            mid_y - delta_max,
+            mid_y + 20 * delta_max,
+        ]
+
+        self._tri: List[int] = []
+        self._adj: List[int] = []
+        self._cx = array("d")
+        self._cy = array("d")
+        self._r2 = array("d")
+        self._free: List[int] = []
+        self._last = self._new_triangle(0, 1, 2)
+
+    @classmethod
+    def from_points(
+        cls,
+        points: Sequence[Point],
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> DelaunayMesh:
+        """Construit le maillage de Delaunay d'une séquence de points.
+
+        Args:
+            points: Séquence de coordonnées (x, y).
+            progress: Appelée avec le nombre de points déjà insérés, toutes
+                les ``PROGRESS_INTERVAL`` insertions puis à la fin.
+
+        Returns:
+            Maillage contenant tous les points, dans l'ordre d'entrée.
+
+        """
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        mesh = cls(min(xs), min(ys), max(xs), max(ys))
+        if progress is None:
+            for x, y in zip(xs, ys):
+                mesh.insert(x, y)
+            return mesh
+
+        for start in range(0, len(xs), PROGRESS_INTERVAL):
+            stop = min(start + PROGRESS_INTERVAL, len(xs))
+            for i in range(start, stop):
+                mesh.insert(xs[i], ys[i])
+            progress(stop)
+        return mesh
+
+    def dump_state(self) -> bytes:
+        """Sérialise l'état complet du maillage (sommets, adjacence, cache).
+
+        Returns:
+            Représentation binaire little-endian, relue par `load_state`.
+
+        """
+        header = struct.pack(
+            "<4sIq", STATE_MAGIC, STATE_VERSION, self._last
+        )
+        columns = [
+            array("d", self._xs),
+            array("d", self._ys),
+            array("q", self._tri),
+            array("q", self._adj),
+            array("q", self._free),
+            self._cx,
+            self._cy,
+            self._r2,
+        ]
+        chunks = [header]
+        for column in columns:
+            if sys.byteorder != "little":
+                column = array(column.typecode, column)
+                column.byteswap()
+            chunks.append(struct.pack("<cq", column.typecode.encode(), len(column)))
+            chunks.append(column.tobytes())
+        return b"".join(chunks)
+
+    @classmethod
+    def load_state(cls, data: bytes) -> DelaunayMesh:
+        """Reconstruit un maillage sérialisé par `dump_state`.
+
+        Args:
+            data: Représentation binaire de l'état.
+
+        Returns:
+            Maillage prêt à recevoir de nouveaux points.
+
+        Raises:
+            ValueError: Si les données sont tronquées ou incohérentes.
+
+        """
+        view = memoryview(data)
+        header_size = struct.calcsize("<4sIq")
+        if len(view) < header_size:
+            raise ValueError("État de maillage tronqué")
+        magic, version, last = struct.unpack_from("<4sIq", view)
+        if magic != STATE_MAGIC or version != STATE_VERSION:
+            raise ValueError("État de maillage inconnu")
+
+        offset = header_size
+        columns = []
+        for typecode in "ddqqqddd":
+            if len(view) < offset + 9:
+                raise ValueError("État de maillage tronqué")
+            code, count = struct.unpack_from("<cq", view, offset)
+            offset += 9
+            column = array(typecode)
+            size = count * column.itemsize
+            if code != typecode.encode() or len(view) < offset + size:
+                raise ValueError("État de maillage tronqué")
+            column.frombytes(view[offset:offset + size])
+            if sys.byteorder != "little":
+                column.byteswap()
+            columns.append(column)
+            offset += size
+        if offset != len(view):
+            raise ValueError("Longueur invalide pour un état de maillage")
+
+        xs, ys, tri, adj, free, cx, cy, r2 = columns
+        if not (
+            len(xs) == len(ys) >= SUPER_VERTICES
+            and len(tri) == len(adj) == 3 * len(r2)
+            and len(cx) == len(cy) == len(r2)
+            and 0 <= last < len(r2)
+        ):
+            raise ValueError("État de maillage incohérent")
+        _check_indices(tri, adj, free, last, len(xs))
+
+        mesh = cls.__new__(cls)
+        mesh._xs = xs.tolist()
+        mesh._ys = ys.tolist()
+        mesh._tri = tri.tolist()
+        mesh._adj = adj.tolist()
+        mesh._free = free.tolist()
+        mesh._cx = cx
+        mesh._cy = cy
+        mesh._r2 = r2
+        mesh._last = last
+        return mesh
+
+    def insert(self, x: float, y: float) -> int:
+        """Insère un point dans la triangulation.
+
+        Un point confondu avec un sommet existant est enregistré mais ne
+        crée aucun triangle.
+
+        Args:
+            x: Abscisse du point.
+            y: Ordonnée du point.
+
+        Returns:
+            Indice du point (indice d'entrée, hors super-triangle).
+
+        """
+        xs = self._xs
+        ys = self._ys
+        v = len(xs)
+        xs.append(x)
+        ys.append(y)
+
+        start = self._locate(x, y)
+        if not self._in_circle(start, x, y):
+            return v - SUPER_VERTICES
+
+        tri = self._tri
+        adj = self._adj
+        cavity = {start}
+        stack = [start]
+        boundary = []
+
+        while stack:
+            t = stack.pop()
+            base = 3 * t
+            for k in range(3):
+                n = adj[base + k]
+                if n in cavity:
+                    continue
+                if n != NO_NEIGHBOR and self._in_circle(n, x, y):
+                    cavity.add(n)
+                    stack.append(n)
+                    continue
+                a = tri[base + (k + 1) % 3]
+                b = tri[base + (k + 2) % 3]
+                j = -1
+                if n != NO_NEIGHBOR:
+                    j = adj[3 * n:3 * n + 3].index(t)
+                boundary.append((a, b, n, j))
+
+        free = self._free
+        free.extend(cavity)
+        for t in cavity:
+            tri[3 * t] = -1
+
+        starts = {}
+        ends = {}
+        created = []
+        for a, b, n, j in boundary:
+            t = self._new_triangle(a, b, v)
+            adj[3 * t + 2] = n
+            if n != NO_NEIGHBOR:
+                adj[3 * n + j] = t
+            starts[a] = t
+            ends[b] = t
+            created.append(t)
+
+        for t in created:
+            base = 3 * t
+            adj[base] = starts[tri[base + 1]]
+            adj[base + 1] = ends[tri[base]]
+
+        self._last = created[-1]
+        return v - SUPER_VERTICES
+
+    def triangles(self, include_super: bool = False) -> List[Triangle]:
+        """Retourne les triangles du maillage.
+
+        Args:
+            include_super: Inclure aussi les triangles touchant le
+                super-triangle, dont les sommets ont alors les indices
+                négatifs -3, -2 et -1.
+
+        Returns:
+            Liste de triplets d'indices d'entrée, dans le sens trigonométrique.
+
+        """
+        tri = self._tri
+        result = []
+        for base in range(0, len(tri), 3):
+            a, b, c = tri[base], tri[base + 1], tri[base + 2]
+            if a == -1:
+                continue
+            if not include_super and (
+                a < SUPER_VERTICES or b < SUPER_VERTICES or c < SUPER_VERTICES
+            ):
+                continue
+            result.append(
+                (a - SUPER_VERTICES, b - SUPER_VERTICES, c - SUPER_VERTICES)
+            )
+        return result
+
+    def triangle_array(self) -> array:
+        """Retourne les triangles réels sous forme de tableau plat.
+
+        Returns:
+            ``array('I')`` de 3 indices d'entrée par triangle, dans le même
+            ordre que `triangles`, sans construire de tuples.
+
+        """
+        tri = self._tri
+        result = array("I")
+        append = result.append
+        for base in range(0, len(tri), 3):
+            a, b, c = tri[base], tri[base + 1], tri[base + 2]
+            if a < SUPER_VERTICES or b < SUPER_VERTICES or c < SUPER_VERTICES:
+                continue
+            append(a - SUPER_VERTICES)
+            append(b - SUPER_VERTICES)
+            append(c - SUPER_VERTICES)
+        return result
+
+    def _new_triangle(self, a: int, b: int, c: int) -> int:
+        """Alloue un slot (réutilisé si possible) pour le triangle (a, b, c)."""
+        ux, uy, r2 = self._circumcircle(a, b, c)
+        if self._free:
+            t = self._free.pop()
+            base = 3 * t
+            self._tri[base:base + 3] = (a, b, c)
+            self._adj[base:base + 3] = (NO_NEIGHBOR, NO_NEIGHBOR, NO_NEIGHBOR)
+            self._cx[t] = ux
+            self._cy[t] = uy
+            self._r2[t] = r2
+            return t
+        t = len(self._tri) // 3
+        self._tri.extend((a, b, c))
+        self._adj.extend((NO_NEIGHBOR, NO_NEIGHBOR, NO_NEIGHBOR))
+        self._cx.append(ux)
+        self._cy.append(uy)
+        self._r2.append(r2)
+        return t
+
+    def _circumcircle(self, a: int, b: int, c: int) -> Tuple[float, float, float]:
+        """Retourne le centre et le rayon au carré du cercle circonscrit.
+
+        Pour un triangle trop aplati, le centre calculé n'est pas fiable :
+        le rayon vaut alors -1 et `_in_circle` utilise directement le
+        prédicat robuste.
+        """
+        xs = self._xs
+        ys = self._ys
+        ax, ay = xs[a], ys[a]
+        bx = xs[b] - ax
+        by = ys[b] - ay
+        cx = xs[c] - ax
+        cy = ys[c] - ay
+
+        b2 = bx * bx + by * by
+        c2 = cx * cx + cy * cy
+        d = 2 * (bx * cy - by * cx)
+        if d * d <= 4 * MIN_CACHED_SINE * MIN_CACHED_SINE * b2 * c2:
+            return 0.0, 0.0, -1.0
+
+        ux = (cy * b2 - by * c2) / d
+        uy = (bx * c2 - cx * b2) / d
+        return ax + ux, ay + uy, ux * ux + uy * uy
+
+    def _in_circle(self, t: int, x: float, y: float) -> bool:
+        """Indique si (x, y) est strictement dans le cercle circonscrit de t.
+
+        Le cercle en cache tranche les cas nets ; près du cercle, le signe
+        est donné par le prédicat adaptatif `incircle`.
+        """
+        r2 = self._r2[t]
+        if r2 > 0:
+            dx = x - self._cx[t]
+            dy = y - self._cy[t]
+            delta = dx * dx + dy * dy - r2
+            margin = CIRCLE_FILTER_MARGIN * r2
+            if delta > margin:
+                return False
+            if delta < -margin:
+                return True
+
+        tri = self._tri
+        xs = self._xs
+        ys = self._ys
+        base = 3 * t
+        a, b, c = tri[base], tri[base + 1], tri[base + 2]
+        return incircle(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c], x, y) > 0
+
+    def _locate(self, x: float, y: float) -> int:
+        """Trouve un triangle contenant (x, y) par marche orientée.
+
+        La marche part du dernier triangle créé et traverse l'arête derrière
+        laquelle se trouve le point. En cas de cycle dû aux arrondis, on
+        se replie sur un parcours exhaustif des triangles vivants.
+        """
+        tri = self._tri
+        adj = self._adj
+        xs = self._xs
+        ys = self._ys
+
+        t = self._last
+        max_steps = len(tri) // 3 + 1
+        for step in range(max_steps):
+            base = 3 * t
+            for i in range(3):
+                # Décalage du premier côté testé pour éviter les cycles.
+                k = (i + step) % 3
+                a = tri[base + (k + 1) % 3]
+                b = tri[base + (k + 2) % 3]
+                if (
+                    adj[base + k] != NO_NEIGHBOR
+                    and orient2d(xs[a], ys[a], xs[b], ys[b], x, y) < 0
+                ):
+                    t = adj[base + k]
+                    break
+            else:
+                return t
+
+        for base in range(0, len(tri), 3):
+            if tri[base] != -1 and self._in_circle(base // 3, x, y):
+                return base // 3
+        return t
+
+
+def _check_indices(tri: array, adj: array, free: array, last: int, n: int) -> None:
+    """Vérifie les indices d'un état relu par `DelaunayMesh.load_state`.
+
+    Les sommets doivent désigner l'un des ``n`` sommets (le premier vaut -1
+    pour un slot libre), les voisins un slot existant ou `NO_NEIGHBOR`, et
+    les slots libres ainsi que ``last`` des slots respectivement libres et
+    occupés.
+
+    Raises:
+        ValueError: Si un indice est hors limites ou incohérent.
+
+    """
+    slots = len(tri) // 3
+    firsts = tri[0::3]
+    if (
+        min(firsts) < -1
+        or min(tri[1::3]) < 0
+        or min(tri[2::3]) < 0
+        or max(tri) >= n
+        or min(adj) < NO_NEIGHBOR
+        or max(adj) >= slots
+        or firsts[last] == -1
+        or len(set(free)) != len(free)
+        or any(not 0 <= t < slots or firsts[t] != -1 for t in free)
+    ):
+        raise ValueError("Indices incohérents dans l'état de maillage")
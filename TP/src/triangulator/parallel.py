@@ -0,0 +1,337 @@
+"""Triangulation parallèle par bandes pour les très grands PointSets.
+
+Les points sont découpés en bandes verticales de même effectif, chacune
+triangulée dans un processus séparé (`ProcessPoolExecutor`). Toutes les
+bandes partagent le super-triangle de l'ensemble complet, ce qui rend
+leurs triangulations comparables à celle du moteur séquentiel.
+
+Le recollement s'appuie sur une propriété simple : un triangle de bande
+dont le cercle circonscrit reste strictement dans l'intervalle d'abscisses
+de sa bande ne peut contenir aucun point d'une autre bande ; il est donc
+un triangle de Delaunay global et est conservé tel quel, à condition
+qu'aucun autre point ne soit sur ce cercle. Les sommets des autres
+triangles (cercle débordant sur une couture, triangle touchant le
+super-triangle, ou point cocirculaire) forment l'ensemble de couture.
+Celui-ci est triangulé séquentiellement et l'on n'en garde que les
+triangles dont le cercle circonscrit est vide vis-à-vis de tous les points.
+
+Écarter les triangles cocirculaires des bandes est indispensable : sur une
+grille, les deux diagonales d'un carré ont des cercles « vides » au sens
+large, et une bande pourrait confirmer l'une pendant que la couture garde
+l'autre. Les triangles confirmés ont donc un cercle strictement vide : ils
+figurent dans toute triangulation de Delaunay, et la couture ne peut pas
+les chevaucher.
+
+Pour des points en position générale, le résultat est le même ensemble de
+triangles que celui du moteur séquentiel ``"mesh"`` ; avec des points
+cocirculaires, c'est une triangulation de Delaunay de même nombre de
+triangles, dont seules les diagonales des polygones cocirculaires peuvent
+différer.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence, Set, Tuple
+
+from triangulator.mesh import DelaunayMesh
+from triangulator.ordering import brio_order
+from triangulator.predicates import incircle
+
+Point = Tuple[float, float]
+Triangle = Tuple[int, int, int]
+Bounds = Tuple[float, float, float, float]
+
+# Nombre minimal de points par bande pour que le découpage soit rentable.
+MIN_POINTS_PER_STRIP = 1000
+
+# Marge relative appliquée au test « cercle contenu dans la bande ».
+STRIP_MARGIN = 1e-9
+
+
+def triangulate_parallel(
+    points: Sequence[Point],
+    workers: int | None = None,
+) -> List[Triangle]:
+    """Triangule les points en parallèle, par bandes verticales.
+
+    Args:
+        points: Séquence de coordonnées (x, y).
+        workers: Nombre de processus (et de bandes) ; par défaut le nombre
+            de cœurs disponibles.
+
+    Returns:
+        Liste de triangles (indices d'entrée), dans le sens trigonométrique.
+
+    Raises:
+        ValueError: Si moins de trois points sont fournis.
+
+    """
+    n = len(points)
+    if n < 3:
+        raise ValueError("Moins de 3 points: non triangulable.")
+
+    workers = workers or os.cpu_count() or 1
+    strips = min(workers, n // MIN_POINTS_PER_STRIP)
+
+    # Les doublons sont écartés : seule la première occurrence est triangulée.
+    first: Dict[Point, int] = {}
+    for i, p in enumerate(points):
+        first.setdefault((p[0], p[1]), i)
+    unique = sorted(first.values(), key=lambda i: (points[i][0], points[i][1]))
+
+    if strips < 2:
+        return _triangulate_subset(points, unique, _bounds(points, unique))
+
+    bounds = _bounds(points, unique)
+    tasks = []
+    size = math.ceil(len(unique) / strips)
+    for s in range(strips):
+        chunk = unique[s * size:(s + 1) * size]
+        if not chunk:
+            continue
+        lo = -math.inf if s == 0 else _seam(points, unique, s * size)
+        hi = math.inf if (s + 1) * size >= len(unique) else _seam(
+            points, unique, (s + 1) * size
+        )
+        coords = [(points[i][0], points[i][1]) for i in chunk]
+        tasks.append((coords, chunk, lo, hi, bounds))
+
+    confirmed: Set[Triangle] = set()
+    seam: Set[int] = set()
+    with ProcessPoolExecutor(max_workers=len(tasks)) as pool:
+        for kept, pending in pool.map(_triangulate_strip, tasks):
+            confirmed.update(kept)
+            seam.update(pending)
+
+    known = {_canonical(t) for t in confirmed}
+    stitched = _stitch(points, sorted(seam), bounds, unique, known)
+    return list(confirmed) + stitched
+
+
+def _bounds(points: Sequence[Point], indices: Sequence[int]) -> Bounds:
+    """Retourne la boîte englobante (min_x, min_y, max_x, max_y) des indices."""
+    xs = [points[i][0] for i in indices]
+    ys = [points[i][1] for i in indices]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _seam(points: Sequence[Point], order: Sequence[int], k: int) -> float:
+    """Retourne l'abscisse de la couture entre les rangs k - 1 et k."""
+    return (points[order[k - 1]][0] + points[order[k]][0]) / 2
+
+
+def _canonical(triangle: Triangle) -> Triangle:
+    """Retourne la rotation du triangle commençant par son plus petit indice."""
+    a, b, c = triangle
+    if a < b and a < c:
+        return a, b, c
+    if b < c:
+        return b, c, a
+    return c, a, b
+
+
+def _triangulate_subset(
+    points: Sequence[Point], indices: Sequence[int], bounds: Bounds
+) -> List[Triangle]:
+    """Triangule un sous-ensemble de points dans le super-triangle commun."""
+    mesh = DelaunayMesh(*bounds)
+    subset = [points[i] for i in indices]
+    order = brio_order(subset)
+    for k in order:
+        mesh.insert(*subset[k])
+    return [
+        (indices[order[a]], indices[order[b]], indices[order[c]])
+        for a, b, c in mesh.triangles()
+    ]
+
+
+def _triangulate_strip(
+    task: Tuple[List[Point], List[int], float, float, Bounds],
+) -> Tuple[List[Triangle], List[int]]:
+    """Triangule une bande et sépare les triangles sûrs des sommets de couture.
+
+    Exécutée dans un processus de travail.
+
+    Args:
+        task: Coordonnées de la bande, leurs indices globaux, bornes
+            d'abscisse de la bande et boîte englobante globale.
+
+    Returns:
+        Les triangles dont le cercle circonscrit reste dans la bande, et les
+        indices globaux des sommets des autres triangles.
+
+    """
+    coords, indices, lo, hi, bounds = task
+    mesh = DelaunayMesh(*bounds)
+    order = brio_order(coords)
+    for k in order:
+        mesh.insert(*coords[k])
+
+    triangles = mesh.triangles(include_super=True)
+    tied = _cocircular_triangles(coords, order, triangles)
+
+    kept = []
+    pending = set()
+    for a, b, c in triangles:
+        real = [v for v in (a, b, c) if v >= 0]
+        if (
+            len(real) == 3
+            and _circle_inside(coords, order, a, b, c, lo, hi)
+            and _canonical((a, b, c)) not in tied
+        ):
+            kept.append((indices[order[a]], indices[order[b]], indices[order[c]]))
+        else:
+            pending.update(indices[order[v]] for v in real)
+    return kept, list(pending)
+
+
+def _cocircular_triangles(
+    coords: Sequence[Point],
+    order: Sequence[int],
+    triangles: Sequence[Triangle],
+) -> Set[Triangle]:
+    """Retourne les triangles ayant un point exactement sur leur cercle.
+
+    Dans une triangulation de Delaunay, les points cocirculaires d'un
+    triangle forment avec lui un polygone inscrit triangulé : si un tel
+    point existe, il est le sommet opposé d'un des trois voisins. Le test
+    étant symétrique, chaque arête intérieure n'est évaluée qu'une fois.
+
+    Returns:
+        Triangles concernés, sous forme `_canonical`.
+
+    """
+    # Sommet opposé à chaque arête orientée : le voisin de (a, b, c) par
+    # l'arête (a, b) est le triangle portant l'arête (b, a).
+    opposite: Dict[Tuple[int, int], int] = {}
+    for a, b, c in triangles:
+        opposite[(a, b)] = c
+        opposite[(b, c)] = a
+        opposite[(c, a)] = b
+
+    tied: Set[Triangle] = set()
+    for (a, b), c in opposite.items():
+        if a > b or min(a, b, c) < 0:
+            continue
+        d = opposite.get((b, a), -1)
+        if d < 0:
+            continue
+        ax, ay = coords[order[a]]
+        bx, by = coords[order[b]]
+        cx, cy = coords[order[c]]
+        dx, dy = coords[order[d]]
+        if incircle(ax, ay, bx, by, cx, cy, dx, dy) == 0:
+            tied.add(_canonical((a, b, c)))
+            tied.add(_canonical((b, a, d)))
+    return tied
+
+
+def _circle_inside(
+    coords: Sequence[Point],
+    order: Sequence[int],
+    a: int,
+    b: int,
+    c: int,
+    lo: float,
+    hi: float,
+) -> bool:
+    """Indique si le cercle circonscrit de (a, b, c) reste dans ]lo, hi[."""
+    ax, ay = coords[order[a]]
+    bx, by = coords[order[b]]
+    cx, cy = coords[order[c]]
+    bx -= ax
+    by -= ay
+    cx -= ax
+    cy -= ay
+
+    d = 2 * (bx * cy - by * cx)
+    if d == 0:
+        return False
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+    ux = (cy * b2 - by * c2) / d
+    uy = (bx * c2 - cx * b2) / d
+    r = math.sqrt(ux * ux + uy * uy)
+    ux += ax
+
+    margin = STRIP_MARGIN * (r + abs(ux))
+    return ux - r - margin > lo and ux + r + margin < hi
+
+
+def _stitch(
+    points: Sequence[Point],
+    seam: Sequence[int],
+    bounds: Bounds,
+    unique: Sequence[int],
+    known: Set[Triangle],
+) -> List[Triangle]:
+    """Triangule les sommets de couture et garde les triangles de Delaunay.
+
+    Un triangle est retenu s'il n'a pas déjà été confirmé par une bande et
+    si aucun point de l'ensemble complet n'est strictement dans son cercle
+    circonscrit.
+    """
+    grid = _PointGrid(points, unique, bounds)
+    result = []
+    for a, b, c in _triangulate_subset(points, seam, bounds):
+        if _canonical((a, b, c)) in known:
+            continue
+        if grid.circle_is_empty(a, b, c):
+            result.append((a, b, c))
+    return result
+
+
+class _PointGrid:
+    """Grille régulière de points pour les tests de cercle vide."""
+
+    def __init__(
+        self, points: Sequence[Point], indices: Sequence[int], bounds: Bounds
+    ) -> None:
+        """Range chaque indice dans la case contenant son point."""
+        self._points = points
+        min_x, min_y, max_x, max_y = bounds
+        self._side = max(1, int(math.sqrt(len(indices) / 4)))
+        self._min_x = min_x
+        self._min_y = min_y
+        self._cell = max(max_x - min_x, max_y - min_y, 1e-300) / self._side
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        for i in indices:
+            key = self._key(points[i][0], points[i][1])
+            self._cells.setdefault(key, []).append(i)
+
+    def _key(self, x: float, y: float) -> Tuple[int, int]:
+        """Retourne la case (bornée à la grille) contenant (x, y)."""
+        last = self._side - 1
+        cx = int((x - self._min_x) / self._cell)
+        cy = int((y - self._min_y) / self._cell)
+        return min(max(cx, 0), last), min(max(cy, 0), last)
+
+    def circle_is_empty(self, a: int, b: int, c: int) -> bool:
+        """Indique si aucun point n'est strictement dans le cercle de (a, b, c)."""
+        points = self._points
+        ax, ay = points[a]
+        bx, by = points[b]
+        cx, cy = points[c]
+
+        # Boîte englobante du cercle, élargie d'une case contre les arrondis.
+        d = 2 * ((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+        b2 = (bx - ax) ** 2 + (by - ay) ** 2
+        c2 = (cx - ax) ** 2 + (cy - ay) ** 2
+        ux = ax + ((cy - ay) * b2 - (by - ay) * c2) / d
+        uy = ay + ((bx - ax) * c2 - (cx - ax) * b2) / d
+        r = math.hypot(ux - ax, uy - ay)
+
+        x0, y0 = self._key(ux - r, uy - r)
+        x1, y1 = self._key(ux + r, uy + r)
+        for gx in range(max(x0 - 1, 0), min(x1 + 1, self._side - 1) + 1):
+            for gy in range(max(y0 - 1, 0), min(y1 + 1, self._side - 1) + 1):
+                for i in self._cells.get((gx, gy), ()):
+                    if i == a or i == b or i == c:
+                        continue
+                    px, py = points[i]
+                    if incircle(ax, ay, bx, by, cx, cy, px, py) > 0:
+                        return False
+        return True
@@ -0,0 +1,176 @@
+"""Prédicats géométriques robustes (orientation et cercle circonscrit).
+
+Les deux prédicats suivent l'approche adaptative de Shewchuk : le
+déterminant est d'abord évalué en flottants, puis comparé à une borne
+d'erreur a priori. Si le signe est certain, la valeur flottante est
+retournée directement ; sinon le déterminant est recalculé exactement avec
+`fractions.Fraction` (tout flottant est un rationnel dyadique exact).
+
+Le chemin exact n'est emprunté que pour des points (presque) alignés ou
+cocirculaires, ce qui garde le cas courant aussi rapide qu'un calcul
+flottant naïf tout en garantissant des signes justes.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+
+# Epsilon machine au sens de Shewchuk : moitié de l'écart entre 1.0 et le
+# flottant suivant.
+EPSILON = 2.0 ** -53
+
+CCW_ERRBOUND = (3.0 + 16.0 * EPSILON) * EPSILON
+ICC_ERRBOUND = (10.0 + 96.0 * EPSILON) * EPSILON
+
+
+def orient2d(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float
+) -> float:
+    """Évalue l'orientation du triplet (a, b, c).
+
+    Args:
+        ax: Abscisse de a.
+        ay: Ordonnée de a.
+        bx: Abscisse de b.
+        by: Ordonnée de b.
+        cx: Abscisse de c.
+        cy: Ordonnée de c.
+
+    Returns:
+        Valeur positive si (a, b, c) tourne dans le sens trigonométrique,
+        négative dans le sens horaire, nulle si les points sont alignés.
+        Le signe est toujours exact.
+
+    """
+    detleft = (ax - cx) * (by - cy)
+    detright = (ay - cy) * (bx - cx)
+    det = detleft - detright
+
+    if detleft > 0:
+        if detright <= 0:
+            return det
+        detsum = detleft + detright
+    elif detleft < 0:
+        if detright >= 0:
+            return det
+        detsum = -detleft - detright
+    else:
+        return det
+
+    errbound = CCW_ERRBOUND * detsum
+    if det >= errbound or -det >= errbound:
+        return det
+    return _orient2d_exact(ax, ay, bx, by, cx, cy)
+
+
+def incircle(
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    cx: float,
+    cy: float,
+    dx: float,
+    dy: float,
+) -> float:
+    """Évalue la position de d par rapport au cercle passant par a, b et c.
+
+    Args:
+        ax: Abscisse de a.
+        ay: Ordonnée de a.
+        bx: Abscisse de b.
+        by: Ordonnée de b.
+        cx: Abscisse de c.
+        cy: Ordonnée de c.
+        dx: Abscisse du point testé.
+        dy: Ordonnée du point testé.
+
+    Returns:
+        Pour (a, b, c) dans le sens trigonométrique : valeur positive si d
+        est strictement à l'intérieur du cercle, négative à l'extérieur,
+        nulle s'il est sur le cercle (signe inversé pour le sens horaire).
+        Le signe est toujours exact.
+
+    """
+    adx = ax - dx
+    bdx = bx - dx
+    cdx = cx - dx
+    ady = ay - dy
+    bdy = by - dy
+    cdy = cy - dy
+
+    bdxcdy = bdx * cdy
+    cdxbdy = cdx * bdy
+    alift = adx * adx + ady * ady
+
+    cdxady = cdx * ady
+    adxcdy = adx * cdy
+    blift = bdx * bdx + bdy * bdy
+
+    adxbdy = adx * bdy
+    bdxady = bdx * ady
+    clift = cdx * cdx + cdy * cdy
+
+    det = (
+        alift * (bdxcdy - cdxbdy)
+        + blift * (cdxady - adxcdy)
+        + clift * (adxbdy - bdxady)
+    )
+    permanent = (
+        (abs(bdxcdy) + abs(cdxbdy)) * alift
+        + (abs(cdxady) + abs(adxcdy)) * blift
+        + (abs(adxbdy) + abs(bdxady)) * clift
+    )
+
+    errbound = ICC_ERRBOUND * permanent
+    if det > errbound or -det > errbound:
+        return det
+    return _incircle_exact(ax, ay, bx, by, cx, cy, dx, dy)
+
+
+def _sign(value: Fraction) -> float:
+    """Retourne le signe d'un rationnel sous forme de flottant (-1, 0 ou 1)."""
+    if value > 0:
+        return 1.0
+    if value < 0:
+        return -1.0
+    return 0.0
+
+
+def _orient2d_exact(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float
+) -> float:
+    """Retourne le signe exact du déterminant d'orientation."""
+    acx = Fraction(ax) - Fraction(cx)
+    bcx = Fraction(bx) - Fraction(cx)
+    acy = Fraction(ay) - Fraction(cy)
+    bcy = Fraction(by) - Fraction(cy)
+    return _sign(acx * bcy - acy * bcx)
+
+
+def _incircle_exact(
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    cx: float,
+    cy: float,
+    dx: float,
+    dy: float,
+) -> float:
+    """Retourne le signe exact du déterminant incircle."""
+    fdx = Fraction(dx)
+    fdy = Fraction(dy)
+    adx = Fraction(ax) - fdx
+    bdx = Fraction(bx) - fdx
+    cdx = Fraction(cx) - fdx
+    ady = Fraction(ay) - fdy
+    bdy = Fraction(by) - fdy
+    cdy = Fraction(cy) - fdy
+
+    det = (
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+        + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+        + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+    )
+    return _sign(det)
@@ -0,0 +1,184 @@
+"""Outils de résilience des appels à un service distant.
+
+- `CircuitBreaker` cesse d'appeler un service qui échoue en série : après
+  ``failure_threshold`` échecs consécutifs, le circuit s'ouvre et les appels
+  échouent immédiatement pendant ``reset_timeout`` secondes, puis un seul
+  appel d'essai décide de sa refermeture.
+- `hedged` couvre un appel lent : si la réponse n'est pas arrivée après un
+  délai (typiquement le 95e centile de latence), un second appel identique
+  est lancé et la première réponse réussie est retenue. Avec un sémaphore
+  de places, un exécuteur saturé n'est pas sollicité : l'appel s'exécute
+  sur le thread appelant, sans couverture.
+- `backoff_delay` donne l'attente, avec gigue, avant une nouvelle tentative.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, Callable, Optional, Tuple, Type
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """Disjoncteur thread-safe à trois états (fermé, ouvert, semi-ouvert)."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Crée un disjoncteur fermé.
+
+        Args:
+            failure_threshold: Échecs consécutifs qui ouvrent le circuit.
+            reset_timeout: Durée d'ouverture avant un appel d'essai, en
+                secondes.
+            clock: Horloge monotone, remplaçable pour les tests.
+
+        Raises:
+            ValueError: Si le seuil est inférieur à 1.
+
+        """
+        if failure_threshold < 1:
+            raise ValueError("Le seuil d'ouverture doit être d'au moins 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state = CLOSED
+
+    @property
+    def state(self) -> str:
+        """str: État courant (``"closed"``, ``"open"`` ou ``"half-open"``)."""
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """Indique si un appel peut partir.
+
+        Un circuit ouvert depuis plus de ``reset_timeout`` passe en
+        semi-ouvert et laisse partir un unique appel d'essai.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if (
+                self._state == OPEN
+                and self._clock() - self._opened_at >= self.reset_timeout
+            ):
+                self._state = HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Enregistre un appel réussi : le circuit se referme."""
+        with self._lock:
+            self._failures = 0
+            self._state = CLOSED
+
+    def record_failure(self) -> None:
+        """Enregistre un échec : ouvre le circuit au seuil ou après un essai."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = self._clock()
+
+
+def hedged(
+    call: Callable[[], Any],
+    delay: float,
+    executor: Executor,
+    final: Tuple[Type[BaseException], ...] = (),
+    slots: Optional[threading.Semaphore] = None,
+) -> Any:
+    """Exécute ``call`` avec un second appel de couverture après ``delay``.
+
+    L'appel perdant n'est pas interrompu : il se termine (ou expire) en
+    arrière-plan et son résultat est ignoré.
+
+    Args:
+        call: Appel à exécuter, sans argument.
+        delay: Délai avant le lancement de l'appel de couverture, en secondes.
+        executor: Exécuteur des appels.
+        final: Exceptions définitives, propagées dès qu'un appel les lève
+            (par exemple une ressource introuvable).
+        slots: Places disponibles dans ``executor`` (None : illimitées).
+            Sans place libre, le premier appel s'exécute sur le thread
+            appelant et la couverture est abandonnée.
+
+    Returns:
+        Le résultat du premier appel réussi.
+
+    Raises:
+        Exception: L'exception du dernier appel, si tous ont échoué.
+
+    """
+    first = _submit(executor, call, slots)
+    if first is None:
+        return call()
+    done, _ = wait([first], timeout=delay)
+    if done:
+        return first.result()
+
+    hedge = _submit(executor, call, slots)
+    if hedge is None:
+        return first.result()
+    pending = {first, hedge}
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            error = future.exception()
+            if error is None:
+                return future.result()
+            if isinstance(error, final):
+                raise error
+    raise error
+
+
+def _submit(
+    executor: Executor,
+    call: Callable[[], Any],
+    slots: Optional[threading.Semaphore],
+) -> Optional[Future]:
+    """Soumet ``call`` s'il reste une place, ou retourne None."""
+    if slots is None:
+        return executor.submit(call)
+    if not slots.acquire(blocking=False):
+        return None
+
+    def run():
+        try:
+            return call()
+        finally:
+            slots.release()
+
+    try:
+        return executor.submit(run)
+    except BaseException:
+        slots.release()
+        raise
+
+
+def backoff_delay(attempt: int, base: float) -> float:
+    """Retourne l'attente avant la tentative suivante (gigue complète).
+
+    Args:
+        attempt: Numéro de la tentative échouée, à partir de 0.
+        base: Attente de référence de la première relance, en secondes.
+
+    Returns:
+        Durée tirée uniformément dans [0, base × 2^attempt].
+
+    """
+    return random.uniform(0.0, base * (2 ** attempt))
@@ -0,0 +1,142 @@
+"""Blocs de mémoire partagée échangés entre l'API et ses processus de travail.
+
+Un PointSet volumineux transmis à un processus de travail par le canal
+de `concurrent.futures` est sérialisé, écrit dans un tube puis relu : deux
+copies de chaque côté, pour l'entrée comme pour la réponse. Avec
+`multiprocessing.shared_memory`, l'API écrit le PointSet une fois dans un
+bloc nommé ; le processus de travail le décode directement depuis ce bloc
+et écrit la réponse encodée dans un bloc de résultat que l'API relit.
+
+Le cycle de vie des blocs est explicite : le processus qui crée un bloc
+(ou qui en prend possession avec `SharedBlocks.adopt`) doit le libérer
+avec `SharedBlocks.release`. Le registre `blocks` garde la trace des blocs
+non libérés ; ceux qui subsistent à la sortie du processus sont signalés
+par un `ResourceWarning` puis supprimés.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import warnings
+from multiprocessing import shared_memory
+from typing import Dict, List
+
+# Suffixe du nom du bloc de résultat associé à un bloc d'entrée.
+RESULT_SUFFIX = "r"
+
+
+class SharedBlocks:
+    """Registre thread-safe des blocs de mémoire partagée d'un processus."""
+
+    def __init__(self) -> None:
+        """Crée un registre vide."""
+        self._lock = threading.Lock()
+        self._blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+    def create(self, size: int) -> shared_memory.SharedMemory:
+        """Crée un bloc d'au moins ``size`` octets et l'enregistre.
+
+        Args:
+            size: Taille utile du bloc, en octets.
+
+        Returns:
+            SharedMemory: Bloc créé, à libérer avec `release`.
+
+        """
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        with self._lock:
+            self._blocks[block.name] = block
+        return block
+
+    def adopt(self, name: str) -> shared_memory.SharedMemory:
+        """Ouvre un bloc créé par un autre processus et en prend possession.
+
+        Args:
+            name: Nom du bloc.
+
+        Returns:
+            SharedMemory: Bloc ouvert, à libérer avec `release`.
+
+        Raises:
+            FileNotFoundError: Si le bloc n'existe pas.
+
+        """
+        block = shared_memory.SharedMemory(name=name)
+        with self._lock:
+            self._blocks[block.name] = block
+        return block
+
+    def release(self, block: shared_memory.SharedMemory) -> None:
+        """Ferme et supprime un bloc, puis le retire du registre.
+
+        Les vues ouvertes sur ``block.buf`` doivent avoir été libérées.
+        """
+        with self._lock:
+            self._blocks.pop(block.name, None)
+        block.close()
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+    def discard(self, name: str) -> bool:
+        """Supprime un bloc par son nom, s'il existe encore.
+
+        Sert à nettoyer le bloc de résultat d'une tâche interrompue, que
+        l'appelant n'a jamais ouvert.
+
+        Returns:
+            bool: True si un bloc a été supprimé.
+
+        """
+        try:
+            block = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            return False
+        self.release(block)
+        return True
+
+    def leaked(self) -> List[str]:
+        """Retourne les noms des blocs créés ou adoptés et non libérés."""
+        with self._lock:
+            return sorted(self._blocks)
+
+    def release_all(self) -> List[str]:
+        """Libère tous les blocs encore enregistrés.
+
+        Returns:
+            list[str]: Noms des blocs libérés.
+
+        """
+        with self._lock:
+            leaked = list(self._blocks.values())
+        for block in leaked:
+            try:
+                self.release(block)
+            except BufferError:
+                # Une vue exportée empêche la fermeture : on supprime le nom,
+                # la mémoire sera rendue à la fin du processus.
+                block.unlink()
+        return [block.name for block in leaked]
+
+
+def result_name(name: str) -> str:
+    """Retourne le nom du bloc de résultat associé au bloc d'entrée ``name``."""
+    return name + RESULT_SUFFIX
+
+
+# Registre du processus courant.
+blocks = SharedBlocks()
+
+
+@atexit.register
+def _release_leaked_blocks() -> None:
+    """Signale puis supprime les blocs non libérés à la sortie du processus."""
+    leaked = blocks.release_all()
+    if leaked:
+        warnings.warn(
+            f"Blocs de mémoire partagée non libérés : {', '.join(leaked)}",
+            ResourceWarning,
+            stacklevel=1,
+        )
@@ -0,0 +1,217 @@
+"""Regroupement des calculs identiques simultanés (« single-flight »).
+
+Lorsque plusieurs requêtes demandent en même temps le même résultat (même
+clé), seule la première exécute le calcul ; les suivantes attendent et
+reçoivent son résultat, ou son exception. Aucun résultat n'est conservé
+une fois le calcul terminé : un appel ultérieur recalcule.
+
+Entre processus d'une même machine, un verrou de fichier (`fcntl.flock`)
+par clé joue le même rôle. Un processus qui doit attendre le verrou le
+signale par un fichier marqueur ; le détenteur ne dépose son résultat
+(sérialisé par `pickle`) dans le répertoire des verrous que si un tel
+marqueur existe, et chaque processus en attente le relit au lieu de
+recalculer. Le dernier à relâcher le verrou sans attente restante supprime
+le résultat et le fichier de verrou : sans concurrence, rien n'est écrit
+ni conservé sur disque. Ce répertoire doit rester privé au service,
+puisque son contenu est désérialisé.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+import time
+from glob import glob
+from typing import Any, Callable, Dict, Optional
+
+try:  # fcntl n'existe que sur les systèmes POSIX.
+    import fcntl
+except ImportError:  # pragma: no cover - dépend de la plateforme
+    fcntl = None
+
+# Âge au-delà duquel un marqueur d'attente est attribué à un processus
+# disparu et ignoré, en secondes.
+WAITER_TTL = 600.0
+
+# Résultat absent ou antérieur à l'attente (voir `_read_result`).
+_MISSING = object()
+
+
+class _Call:
+    """Calcul en cours : événement de fin, puis résultat ou exception."""
+
+    def __init__(self) -> None:
+        """Prépare un calcul non terminé."""
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce les appels simultanés portant sur une même clé.
+
+    Attributes:
+        leaders (int): Appels ayant exécuté le calcul.
+        followers (int): Appels ayant attendu le calcul d'un autre thread.
+
+    """
+
+    def __init__(self, lock_dir: Optional[str] = None) -> None:
+        """Crée un regroupement vide.
+
+        Args:
+            lock_dir: Répertoire des verrous de fichier, pour coalescer
+                aussi entre processus (None : threads du processus seulement).
+
+        Raises:
+            ValueError: Si ``lock_dir`` est demandé sans `fcntl`.
+
+        """
+        if lock_dir is not None:
+            if fcntl is None:
+                raise ValueError("Le mode inter-processus nécessite fcntl.")
+            os.makedirs(lock_dir, exist_ok=True)
+        self.lock_dir = lock_dir
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Exécute ``fn`` ou attend le calcul déjà en cours pour ``key``.
+
+        Args:
+            key: Clé identifiant le calcul (par exemple l'identifiant du
+                PointSet).
+            fn: Calcul à exécuter, sans argument.
+
+        Returns:
+            Le résultat de ``fn``, calculé par cet appel ou par un appel
+            concurrent.
+
+        Raises:
+            Exception: L'exception levée par le calcul, propagée à tous les
+                appels qui l'attendaient.
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.followers += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._run(key, fn)
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def _run(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Exécute le calcul, sous verrou de fichier si le mode est actif."""
+        if self.lock_dir is None:
+            return fn()
+
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        base = os.path.join(self.lock_dir, name)
+        started = time.time()
+        marker = None
+        try:
+            while True:
+                lock_file = open(base + ".lock", "a+b")
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    if marker is None:
+                        marker = f"{base}.{os.getpid()}.{threading.get_ident()}.wait"
+                        open(marker, "wb").close()
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                if _is_current(lock_file, base + ".lock"):
+                    break
+                # Fichier supprimé par le détenteur précédent : on verrouille
+                # le nouveau.
+                lock_file.close()
+
+            try:
+                if marker is not None:
+                    _remove(marker)
+                    marker = None
+                    # Un autre processus vient de calculer : on relit son
+                    # résultat s'il a été déposé pendant notre attente.
+                    result = _read_result(base, started)
+                    if result is not _MISSING:
+                        return result
+
+                result = fn()
+                if _has_waiters(base):
+                    tmp = f"{base}.{os.getpid()}.{threading.get_ident()}.tmp"
+                    with open(tmp, "wb") as f:
+                        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(tmp, base + ".result")
+                return result
+            finally:
+                if not _has_waiters(base):
+                    _remove(base + ".result")
+                    _remove(base + ".lock")
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+                lock_file.close()
+        finally:
+            if marker is not None:
+                _remove(marker)
+
+
+def _is_current(lock_file, path: str) -> bool:
+    """Indique si le fichier verrouillé est toujours celui du chemin."""
+    try:
+        return os.stat(path).st_ino == os.fstat(lock_file.fileno()).st_ino
+    except FileNotFoundError:
+        return False
+
+
+def _has_waiters(base: str) -> bool:
+    """Indique si un processus attend le verrou ; purge les marqueurs périmés."""
+    deadline = time.time() - WAITER_TTL
+    waiting = False
+    for marker in glob(base + ".*.wait"):
+        try:
+            if os.stat(marker).st_mtime < deadline:
+                _remove(marker)
+            else:
+                waiting = True
+        except FileNotFoundError:
+            pass
+    return waiting
+
+
+def _read_result(base: str, started: float) -> Any:
+    """Relit le résultat déposé depuis ``started``, ou retourne `_MISSING`."""
+    try:
+        if os.stat(base + ".result").st_mtime >= started:
+            with open(base + ".result", "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    return _MISSING
+
+
+def _remove(path: str) -> None:
+    """Supprime un fichier s'il existe encore."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
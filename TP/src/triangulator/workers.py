@@ -0,0 +1,414 @@
+"""Exécution des triangulations hors des threads de requête de l'API.
+
+Sous le GIL, une triangulation volumineuse exécutée dans un thread Flask
+bloque toutes les autres requêtes du même processus. `TriangulationPool`
+confie la chaîne décodage → triangulation → encodage à un pool de
+processus de longue durée :
+
+- seuls des octets traversent la frontière entre processus (le PointSet
+  reçu et la réponse encodée), par défaut au travers de blocs de mémoire
+  partagée (voir `triangulator.sharedmem`) ;
+- chaque tâche est bornée en temps CPU (``RLIMIT_CPU``) : au-delà, elle
+  lève `TriangulationTimeout` et le processus reste utilisable ;
+- chaque processus est remplacé après ``max_tasks_per_child`` tâches ;
+- les petits PointSets sont traités directement dans l'appelant, pour ne
+  pas payer le coût des échanges entre processus.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import signal
+import struct
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional
+
+from triangulator import binary, core, sharedmem
+
+try:  # resource n'existe que sur les systèmes POSIX.
+    import resource
+except ImportError:  # pragma: no cover - dépend de la plateforme
+    resource = None
+
+# Encodages de réponse reconnus par `encode_triangulation`.
+ENCODINGS = ("triangles", "compact", "indices")
+
+# Période de relecture de la progression d'une tâche du pool, en secondes.
+PROGRESS_POLL_INTERVAL = 0.2
+
+
+class TriangulationTimeout(Exception):
+    """Exception levée lorsqu'une triangulation dépasse son temps CPU."""
+
+
+def encode_triangulation(
+    data: bytes,
+    encoding: str = "triangles",
+    compression: Optional[str] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> bytes:
+    """Décode, triangule puis encode un PointSet binaire.
+
+    Args:
+        data: PointSet au format binaire.
+        encoding: ``"triangles"`` (format historique), ``"compact"`` ou
+            ``"indices"`` (indices seuls).
+        compression: Compression du format compact (None, ``"zlib"`` ou
+            ``"lzma"``).
+        progress: Suivi de l'insertion des points (voir `core.triangulate`).
+
+    Returns:
+        La triangulation encodée.
+
+    Raises:
+        ValueError: Si le PointSet est invalide ou l'encodage inconnu.
+
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Encodage inconnu : {encoding}")
+    points = binary.decode_point_set(data)
+    triangles = core.triangulate(points, progress=progress)
+    if encoding == "indices":
+        return binary.encode_triangle_indices(data, triangles)
+    if encoding == "compact":
+        return binary.encode_triangles_compact(points, triangles, compression)
+    return binary.encode_triangles(points, triangles)
+
+
+class TriangulationPool:
+    """Pool de processus dédié aux triangulations de l'API."""
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        cpu_time_limit: Optional[float] = None,
+        max_tasks_per_child: Optional[int] = None,
+        inline_max_points: int = 0,
+        shared_memory: bool = False,
+    ) -> None:
+        """Configure le pool ; les processus sont lancés au premier besoin.
+
+        Args:
+            max_workers: Nombre de processus (0 : tout est traité dans
+                l'appelant).
+            cpu_time_limit: Temps CPU maximal d'une tâche, en secondes
+                (None : illimité).
+            max_tasks_per_child: Tâches après lesquelles un processus est
+                remplacé (None : jamais).
+            inline_max_points: Taille en dessous de laquelle un PointSet est
+                traité dans l'appelant.
+            shared_memory: Échanger PointSet et réponse par mémoire
+                partagée plutôt que par le canal du pool.
+
+        """
+        self.max_workers = max_workers
+        self.cpu_time_limit = cpu_time_limit
+        self.max_tasks_per_child = max_tasks_per_child
+        self.inline_max_points = inline_max_points
+        self.shared_memory = shared_memory
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def run(
+        self,
+        data: bytes,
+        encoding: str = "triangles",
+        compression: Optional[str] = None,
+        progress: Optional[Callable[[int], None]] = None,
+        inline: bool = True,
+    ) -> bytes:
+        """Triangule et encode un PointSet, dans le pool ou dans l'appelant.
+
+        Args:
+            data: PointSet au format binaire.
+            encoding: Encodage de la réponse (voir `encode_triangulation`).
+            compression: Compression du format compact.
+            progress: Appelée avec le nombre de points déjà insérés (voir
+                `core.triangulate`). Dans le pool, le compteur est relu
+                toutes les ``PROGRESS_POLL_INTERVAL`` secondes.
+            inline: Autorise le calcul dans l'appelant sous
+                ``inline_max_points``. Les appelants qui lancent déjà de
+                nombreux calculs en parallèle (requêtes groupées) passent
+                False pour ne pas les exécuter tous sous le GIL.
+
+        Returns:
+            La triangulation encodée.
+
+        Raises:
+            TriangulationTimeout: Si la tâche dépasse ``cpu_time_limit``.
+            ValueError: Si le PointSet est invalide.
+            RuntimeError: Si le processus de travail s'est arrêté
+                brutalement ; le pool est alors recréé.
+
+        """
+        n_points = (len(data) - 4) // 8 if len(data) >= 4 else 0
+        if self.max_workers <= 0 or (inline and n_points < self.inline_max_points):
+            return encode_triangulation(data, encoding, compression, progress)
+
+        executor = self._get_executor()
+        try:
+            if self.shared_memory:
+                return self._run_shared(
+                    executor, data, encoding, compression, progress
+                )
+            return self._call(
+                executor, progress, encode_triangulation, data, encoding, compression
+            )
+        except BrokenProcessPool:
+            self._discard(executor)
+            raise RuntimeError("Processus de triangulation interrompu.")
+
+    def shutdown(self) -> None:
+        """Arrête les processus du pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _call(
+        self,
+        executor: ProcessPoolExecutor,
+        progress: Optional[Callable[[int], None]],
+        fn: Callable[..., Any],
+        *args: Any,
+    ) -> Any:
+        """Exécute ``fn(*args)`` dans le pool, sous la limite de temps CPU.
+
+        Avec ``progress``, le processus de travail publie le nombre de points
+        insérés dans un bloc partagé de 8 octets, relu ici pendant l'attente.
+        """
+        if progress is None:
+            return executor.submit(
+                _run_limited, self.cpu_time_limit, fn, *args
+            ).result()
+
+        counter = sharedmem.blocks.create(8)
+        try:
+            counter.buf[:8] = bytes(8)
+            future = executor.submit(
+                _run_limited,
+                self.cpu_time_limit,
+                _report_progress,
+                counter.name,
+                fn,
+                *args,
+            )
+            while True:
+                try:
+                    result = future.result(timeout=PROGRESS_POLL_INTERVAL)
+                except TimeoutError:
+                    progress(struct.unpack_from("<Q", counter.buf)[0])
+                    continue
+                progress(struct.unpack_from("<Q", counter.buf)[0])
+                return result
+        finally:
+            sharedmem.blocks.release(counter)
+
+    def _run_shared(
+        self,
+        executor: ProcessPoolExecutor,
+        data: bytes,
+        encoding: str,
+        compression: Optional[str],
+        progress: Optional[Callable[[int], None]],
+    ) -> bytes:
+        """Soumet une tâche dont l'entrée et la sortie passent par des blocs.
+
+        Le bloc d'entrée est toujours libéré ; le bloc de résultat l'est
+        aussi lorsque la tâche échoue après l'avoir créé.
+        """
+        block = sharedmem.blocks.create(len(data))
+        output = sharedmem.result_name(block.name)
+        try:
+            block.buf[: len(data)] = data
+            size = self._call(
+                executor,
+                progress,
+                encode_shared,
+                block.name,
+                len(data),
+                output,
+                encoding,
+                compression,
+            )
+        except BaseException:
+            sharedmem.blocks.discard(output)
+            raise
+        finally:
+            sharedmem.blocks.release(block)
+
+        result = sharedmem.blocks.adopt(output)
+        try:
+            return bytes(result.buf[:size])
+        finally:
+            sharedmem.blocks.release(result)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Retourne l'exécuteur courant, créé au premier appel."""
+        with self._lock:
+            if self._executor is None:
+                # Le recyclage des processus impose la méthode « spawn ».
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    max_tasks_per_child=self.max_tasks_per_child,
+                )
+            return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        """Abandonne un exécuteur cassé pour qu'un nouveau soit créé."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def encode_shared(
+    name: str,
+    size: int,
+    output: str,
+    encoding: str = "triangles",
+    compression: Optional[str] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Triangule un PointSet lu dans un bloc partagé, réponse dans un autre.
+
+    Exécutée dans un processus de travail. Le PointSet est décodé
+    directement depuis le bloc ``name``, sans copie préalable. Le bloc
+    ``output`` est créé à la taille exacte de la réponse ; au format
+    historique, l'encodeur y écrit directement. L'appelant en devient
+    propriétaire et doit le libérer.
+
+    Args:
+        name: Nom du bloc contenant le PointSet.
+        size: Taille du PointSet dans le bloc, en octets.
+        output: Nom du bloc de résultat à créer.
+        encoding: Encodage de la réponse (voir `encode_triangulation`).
+        compression: Compression du format compact.
+        progress: Suivi de l'insertion des points (voir `core.triangulate`).
+
+    Returns:
+        int: Taille de la réponse écrite dans ``output``.
+
+    Raises:
+        ValueError: Si le PointSet est invalide ou l'encodage inconnu.
+
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Encodage inconnu : {encoding}")
+
+    source = shared_memory.SharedMemory(name=name)
+    view = source.buf[:size]
+    try:
+        points = binary.decode_point_set(view)
+        if encoding == "triangles":
+            triangles = core.triangulate(points, output="array", progress=progress)
+            payload = None
+            length = binary.triangles_nbytes(len(points), len(triangles) // 3)
+        else:
+            payload = encode_triangulation(view, encoding, compression, progress)
+            length = len(payload)
+    except Exception as exc:
+        # La trace retient des vues sur le bloc, qui empêcheraient sa
+        # fermeture : elle est abandonnée avant de libérer le bloc.
+        raise exc.with_traceback(None)
+    finally:
+        view.release()
+        source.close()
+
+    result = shared_memory.SharedMemory(name=output, create=True, size=max(length, 1))
+    try:
+        if payload is None:
+            binary.encode_triangles(points, triangles, out=result.buf).release()
+        else:
+            result.buf[:length] = payload
+    except BaseException:
+        result.close()
+        result.unlink()
+        raise
+    result.close()
+    return length
+
+
+def _report_progress(name: str, fn: Callable[..., Any], *args: Any) -> Any:
+    """Exécute ``fn(*args)`` en publiant sa progression dans le bloc ``name``.
+
+    Exécutée dans un processus de travail : le nombre de points insérés est
+    écrit en entier 64 bits au début du bloc, que l'appelant relit.
+    """
+    counter = shared_memory.SharedMemory(name=name)
+    try:
+        return fn(*args, progress=partial(struct.pack_into, "<Q", counter.buf, 0))
+    finally:
+        counter.close()
+
+
+def _run_limited(
+    cpu_time_limit: Optional[float],
+    fn: Callable[..., Any],
+    *args: Any,
+) -> Any:
+    """Exécute ``fn(*args)`` sous une limite de temps CPU.
+
+    Exécutée dans un processus de travail. La limite souple ``RLIMIT_CPU``
+    est placée à la consommation courante plus ``cpu_time_limit`` ; le
+    signal SIGXCPU émis à son dépassement est converti en
+    `TriangulationTimeout`, puis la limite est levée.
+    """
+    if cpu_time_limit is None or resource is None:
+        return fn(*args)
+
+    def on_limit(signum, frame):
+        raise TriangulationTimeout(
+            f"Temps CPU de triangulation dépassé ({cpu_time_limit:g} s)."
+        )
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = usage.ru_utime + usage.ru_stime
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    limit = int(used + cpu_time_limit) + 1
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+
+    previous = signal.signal(signal.SIGXCPU, on_limit)
+    resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+    try:
+        return fn(*args)
+    finally:
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+        signal.signal(signal.SIGXCPU, previous)
+
+
+def default_pool() -> TriangulationPool:
+    """Crée le pool de l'API à partir des variables d'environnement.
+
+    - ``TRIANGULATOR_POOL_SIZE`` : nombre de processus (défaut : nombre de
+      cœurs ; 0 désactive le pool) ;
+    - ``TRIANGULATOR_CPU_LIMIT`` : temps CPU maximal par tâche, en secondes
+      (défaut 60 ; 0 : illimité) ;
+    - ``TRIANGULATOR_TASKS_PER_CHILD`` : tâches avant recyclage (défaut 100) ;
+    - ``TRIANGULATOR_INLINE_POINTS`` : seuil du traitement direct (défaut
+      20000 points) ;
+    - ``TRIANGULATOR_SHARED_MEMORY`` : échanges par mémoire partagée (défaut
+      1 ; 0 les fait passer par le canal du pool).
+
+    Returns:
+        TriangulationPool: Pool configuré, sans processus lancé.
+
+    """
+    cpu_limit = float(os.getenv("TRIANGULATOR_CPU_LIMIT", "60"))
+    return TriangulationPool(
+        max_workers=int(
+            os.getenv("TRIANGULATOR_POOL_SIZE", str(os.cpu_count() or 1))
+        ),
+        cpu_time_limit=cpu_limit or None,
+        max_tasks_per_child=int(os.getenv("TRIANGULATOR_TASKS_PER_CHILD", "100"))
+        or None,
+        inline_max_points=int(os.getenv("TRIANGULATOR_INLINE_POINTS", "20000")),
+        shared_memory=os.getenv("TRIANGULATOR_SHARED_MEMORY", "1") != "0",
+    )
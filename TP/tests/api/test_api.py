@@ -19,6 +19,17 @@ def client():
     return app.test_client()
 
 
+@pytest.fixture(autouse=True)
+def empty_result_cache(monkeypatch):
+    """Isole chaque test avec un cache de résultats vide."""
+    from triangulator import api
+    from triangulator.cache import ByteLRUCache
+
+    cache = ByteLRUCache(1024 * 1024)
+    monkeypatch.setattr(api, "results", cache)
+    return cache
+
+
 def test_get_triangulation_success(monkeypatch, client):
     """Retourne 200 et un flux binaire lorsque la triangulation réussit."""
     def mock_get_pointset_bytes(pointset_id):
@@ -121,7 +132,7 @@ def test_get_triangulation_internal_error(monkeypatch, client):
 
 def test_get_triangulation_value_error(monkeypatch, client):
     """Retourne 400 si la triangulation échoue pour un PointSet invalide."""
-    def mock_raise_error(*args):
+    def mock_raise_error(*args, progress=None):
         raise ValueError("Erreur de triangulation simulée")
 
     monkeypatch.setattr(
@@ -143,4 +154,412 @@ def test_get_triangulation_value_error(monkeypatch, client):
 
     assert res.status_code == 400
     assert res.json["code"] == "BAD_POINTSET"
-    assert "Erreur de triangulation" in res.json["message"]
\ No newline at end of file
+    assert "Erreur de triangulation" in res.json["message"]
+
+def _mock_square_pointset(monkeypatch):
+    """Remplace le PointSetManager par un PointSet carré de quatre points."""
+    from triangulator import binary
+
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    monkeypatch.setattr(
+        "triangulator.client_psm.get_pointset_bytes",
+        lambda pointset_id: binary.encode_point_set(points),
+    )
+    return points
+
+
+@pytest.mark.parametrize(
+    "accept",
+    [
+        "application/vnd.triangulator.compact",
+        "application/vnd.triangulator.compact+zlib",
+        "application/vnd.triangulator.compact+lzma, */*;q=0.1",
+    ],
+)
+def test_get_triangulation_compact_format(monkeypatch, client, accept):
+    """Retourne le format compact demandé par l’en-tête Accept."""
+    from triangulator import binary
+
+    points = _mock_square_pointset(monkeypatch)
+
+    res = client.get(
+        "/triangulation/123e4567-e89b-12d3-a456-426614174000",
+        headers={"Accept": accept},
+    )
+
+    assert res.status_code == 200
+    assert res.mimetype == accept.split(",")[0]
+    assert "Accept" in res.headers["Vary"]
+    vertices, triangles = binary.decode_triangles_compact(res.data)
+    assert vertices == points
+    assert len(triangles) == 2
+
+
+@pytest.mark.parametrize("accept", [None, "*/*", "text/html"])
+def test_get_triangulation_default_format(monkeypatch, client, accept):
+    """Conserve le format application/octet-stream par défaut."""
+    from triangulator import binary
+
+    points = _mock_square_pointset(monkeypatch)
+    headers = {"Accept": accept} if accept else {}
+
+    res = client.get(
+        "/triangulation/123e4567-e89b-12d3-a456-426614174000", headers=headers
+    )
+
+    assert res.status_code == 200
+    assert res.mimetype == "application/octet-stream"
+    vertices, triangles = binary.decode_triangles(res.data)
+    assert vertices == points
+    assert len(triangles) == 2
+
+
+def test_get_triangulation_indices_only(monkeypatch, client):
+    """Retourne uniquement les indices lorsque le client les demande."""
+    from triangulator import binary
+
+    points = _mock_square_pointset(monkeypatch)
+
+    res = client.get(
+        "/triangulation/123e4567-e89b-12d3-a456-426614174000",
+        headers={"Accept": "application/vnd.triangulator.indices"},
+    )
+
+    assert res.status_code == 200
+    assert res.mimetype == "application/vnd.triangulator.indices"
+    assert len(res.data) == 12 + 2 * 12
+    vertices, triangles = binary.decode_triangles(res.data, points)
+    assert vertices == points
+    assert len(triangles) == 2
+
+
+def test_get_triangulation_coalesces_concurrent_requests(monkeypatch):
+    """Des requêtes simultanées sur un PointSet ne le triangulent qu’une fois."""
+    import threading
+    import time
+
+    from triangulator import core
+
+    _mock_square_pointset(monkeypatch)
+    calls = []
+    triangulate = core.triangulate
+
+    def slow_triangulate(points, progress=None):
+        calls.append(1)
+        time.sleep(0.2)
+        return triangulate(points, progress=progress)
+
+    monkeypatch.setattr("triangulator.core.triangulate", slow_triangulate)
+    statuses = []
+
+    def fetch():
+        res = app.test_client().get(
+            "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+        )
+        statuses.append(res.status_code)
+
+    threads = [threading.Thread(target=fetch) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert statuses == [200] * 4
+    assert len(calls) == 1
+
+
+def test_get_triangulation_result_cache(monkeypatch, client, empty_result_cache):
+    """Une requête répétée est servie depuis le cache, sans retrianguler."""
+    from triangulator import core
+
+    _mock_square_pointset(monkeypatch)
+    calls = []
+    triangulate = core.triangulate
+    monkeypatch.setattr(
+        "triangulator.core.triangulate",
+        lambda points, progress=None: calls.append(1)
+        or triangulate(points, progress=progress),
+    )
+    url = "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+
+    first = client.get(url)
+    second = client.get(url)
+    compact = client.get(
+        url, headers={"Accept": "application/vnd.triangulator.compact"}
+    )
+
+    assert first.data == second.data
+    assert len(calls) == 2
+    assert empty_result_cache.stats()["hits"] == 1
+    assert first.headers["ETag"] == second.headers["ETag"]
+    assert compact.headers["ETag"] != first.headers["ETag"]
+    assert not first.headers["ETag"].startswith("W/")
+
+
+def test_get_triangulation_not_modified(monkeypatch, client):
+    """Retourne 304 sans corps si l’ETag du client est à jour."""
+    _mock_square_pointset(monkeypatch)
+    url = "/triangulation/123e4567-e89b-12d3-a456-426614174000"
+
+    etag = client.get(url).headers["ETag"]
+    res = client.get(url, headers={"If-None-Match": etag})
+
+    assert res.status_code == 304
+    assert res.data == b""
+    assert res.headers["ETag"] == etag
+    assert client.get(url, headers={"If-None-Match": '"autre"'}).status_code == 200
+
+
+def test_get_triangulation_cpu_limit_exceeded(monkeypatch, client):
+    """Retourne 422 si la triangulation dépasse son temps CPU."""
+    from triangulator import api, workers
+
+    _mock_square_pointset(monkeypatch)
+
+    def mock_run(*args, inline=True):
+        raise workers.TriangulationTimeout("Temps CPU de triangulation dépassé")
+
+    monkeypatch.setattr(api.pool, "run", mock_run)
+
+    res = client.get("/triangulation/123e4567-e89b-12d3-a456-426614174000")
+
+    assert res.status_code == 422
+    assert res.json["code"] == "TRIANGULATION_TIMEOUT"
+
+
+@pytest.fixture
+def job_queue(monkeypatch):
+    """Isole chaque test de tâches avec une file vide."""
+    from triangulator import api
+    from triangulator.jobs import JobQueue
+
+    queue = JobQueue(api._run_job, max_pending=4, workers=1)
+    monkeypatch.setattr(api, "jobs", queue)
+    return queue
+
+
+def _wait_job(client, location):
+    """Interroge l'état d'une tâche jusqu'à sa fin et le retourne."""
+    import time
+
+    deadline = time.monotonic() + 5
+    while True:
+        status = client.get(location).json
+        if status["status"] in ("succeeded", "failed"):
+            return status
+        assert time.monotonic() < deadline, "tâche non terminée"
+        time.sleep(0.01)
+
+
+def test_triangulation_job_lifecycle(monkeypatch, client, job_queue):
+    """Soumet une tâche, suit sa progression puis télécharge son résultat."""
+    from triangulator import binary
+
+    points = _mock_square_pointset(monkeypatch)
+
+    res = client.post(
+        "/triangulation-jobs",
+        json={
+            "pointSetId": "123e4567-e89b-12d3-a456-426614174000",
+            "mediaType": "application/vnd.triangulator.compact",
+        },
+    )
+    assert res.status_code == 202
+    location = res.headers["Location"]
+    assert location == f"/triangulation-jobs/{res.json['jobId']}"
+    assert res.json["status"] in ("queued", "running", "succeeded")
+
+    status = _wait_job(client, location)
+    assert status["status"] == "succeeded"
+    assert status["progress"] == {"inserted": 4, "total": 4}
+
+    result = client.get(status["result"])
+    assert result.status_code == 200
+    assert result.mimetype == "application/vnd.triangulator.compact"
+    assert "ETag" in result.headers
+    vertices, triangles = binary.decode_triangles_compact(result.data)
+    assert vertices == points
+    assert len(triangles) == 2
+
+
+def test_triangulation_job_failure_keeps_error_code(monkeypatch, client, job_queue):
+    """Reporte sur la tâche et son résultat l'erreur NOT_FOUND du PSM."""
+    def mock_not_found(pointset_id):
+        raise client_psm.PointSetNotFound()
+
+    monkeypatch.setattr(
+        "triangulator.client_psm.get_pointset_bytes", mock_not_found
+    )
+
+    res = client.post(
+        "/triangulation-jobs",
+        json={"pointSetId": "123e4567-e89b-12d3-a456-426614174000"},
+    )
+    status = _wait_job(client, res.headers["Location"])
+
+    assert status["status"] == "failed"
+    assert status["error"]["code"] == "NOT_FOUND"
+    result = client.get(res.headers["Location"] + "/result")
+    assert result.status_code == 404
+    assert result.json["code"] == "NOT_FOUND"
+
+
+@pytest.mark.parametrize(
+    "body, code",
+    [
+        ({"pointSetId": "invalid-id"}, "INVALID_ID_FORMAT"),
+        ({}, "INVALID_ID_FORMAT"),
+        (
+            {
+                "pointSetId": "123e4567-e89b-12d3-a456-426614174000",
+                "mediaType": "text/html",
+            },
+            "INVALID_MEDIA_TYPE",
+        ),
+    ],
+)
+def test_triangulation_job_rejects_bad_request(client, job_queue, body, code):
+    """Retourne 400 pour un identifiant ou un format invalide."""
+    res = client.post("/triangulation-jobs", json=body)
+
+    assert res.status_code == 400
+    assert res.json["code"] == code
+
+
+def test_triangulation_job_unknown_or_invalid_id(client, job_queue):
+    """Retourne 404 pour une tâche inconnue et 400 pour un identifiant invalide."""
+    unknown = client.get("/triangulation-jobs/123e4567-e89b-12d3-a456-426614174000")
+    invalid = client.get("/triangulation-jobs/invalid-id/result")
+
+    assert unknown.status_code == 404
+    assert unknown.json["code"] == "NOT_FOUND"
+    assert invalid.status_code == 400
+    assert invalid.json["code"] == "INVALID_ID_FORMAT"
+
+
+def test_triangulation_job_pending_and_queue_full(monkeypatch, client):
+    """Retourne 409 avant la fin d'une tâche et 503 si la file est pleine."""
+    import threading
+
+    from triangulator import api
+    from triangulator.jobs import JobQueue
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocked_run(job):
+        started.set()
+        release.wait()
+        return b"", None
+
+    monkeypatch.setattr(api, "jobs", JobQueue(blocked_run, max_pending=1, workers=1))
+    body = {"pointSetId": "123e4567-e89b-12d3-a456-426614174000"}
+    try:
+        first = client.post("/triangulation-jobs", json=body)
+        started.wait(5)
+        responses = [client.post("/triangulation-jobs", json=body) for _ in range(2)]
+        pending = client.get(first.headers["Location"] + "/result")
+    finally:
+        release.set()
+
+    assert pending.status_code == 409
+    assert pending.json["code"] == "JOB_NOT_FINISHED"
+    assert responses[-1].status_code == 503
+    assert responses[-1].json["code"] == "QUEUE_FULL"
+    assert responses[-1].headers["Retry-After"] == "5"
+
+
+def test_batch_triangulation_reports_each_item(monkeypatch, client):
+    """Retourne une trame par identifiant, succès et échecs mêlés."""
+    import json
+
+    from triangulator import binary
+
+    square = binary.encode_point_set(
+        [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    )
+    ok_id = "123e4567-e89b-12d3-a456-426614174000"
+    missing_id = "123e4567-e89b-12d3-a456-426614174001"
+    bad_id = "123e4567-e89b-12d3-a456-426614174002"
+
+    def mock_get_pointset_bytes(pointset_id):
+        if pointset_id == missing_id:
+            raise client_psm.PointSetNotFound()
+        if pointset_id == bad_id:
+            return b"\x05\x00\x00\x00"
+        return square
+
+    monkeypatch.setattr(
+        "triangulator.client_psm.get_pointset_bytes", mock_get_pointset_bytes
+    )
+
+    ids = [ok_id, missing_id, bad_id, "invalid-id"]
+    res = client.post(
+        "/triangulations",
+        json={"pointSetIds": ids, "mediaType": "application/vnd.triangulator.indices"},
+    )
+
+    assert res.status_code == 200
+    assert res.mimetype == "application/vnd.triangulator.batch"
+    items = {pid: (status, body) for pid, status, body in binary.decode_batch(res.data)}
+    assert sorted(items) == sorted(ids)
+
+    status, body = items[ok_id]
+    assert status == 200
+    _, triangles = binary.decode_triangles(body, pointset=square)
+    assert len(triangles) == 2
+
+    expected = {
+        missing_id: (404, "NOT_FOUND"),
+        bad_id: (400, "BAD_POINTSET"),
+        "invalid-id": (400, "INVALID_ID_FORMAT"),
+    }
+    for pid, (status, code) in expected.items():
+        assert items[pid][0] == status
+        assert json.loads(items[pid][1])["code"] == code
+
+
+def test_batch_triangulation_bypasses_inline_path(monkeypatch, client):
+    """Confie chaque élément d'un lot au pool, même un petit PointSet."""
+    from triangulator import api, binary
+
+    _mock_square_pointset(monkeypatch)
+    calls = []
+
+    def mock_run(*args, **kwargs):
+        calls.append(kwargs)
+        return b""
+
+    monkeypatch.setattr(api.pool, "run", mock_run)
+
+    res = client.post(
+        "/triangulations",
+        json={"pointSetIds": ["123e4567-e89b-12d3-a456-426614174000"]},
+    )
+
+    assert [status for _, status, _ in binary.decode_batch(res.data)] == [200]
+    assert calls == [{"inline": False}]
+
+
+@pytest.mark.parametrize(
+    "body, status, code",
+    [
+        ({}, 400, "INVALID_REQUEST"),
+        ({"pointSetIds": "123e4567-e89b-12d3-a456-426614174000"}, 400,
+         "INVALID_REQUEST"),
+        ({"pointSetIds": [], "mediaType": "text/html"}, 400, "INVALID_MEDIA_TYPE"),
+        ({"pointSetIds": ["a", "b", "c"]}, 413, "BATCH_TOO_LARGE"),
+    ],
+)
+def test_batch_triangulation_rejects_bad_request(
+    monkeypatch, client, body, status, code
+):
+    """Rejette une requête groupée mal formée ou trop grande."""
+    from triangulator import api
+
+    monkeypatch.setattr(api, "BATCH_MAX_IDS", 2)
+
+    res = client.post("/triangulations", json=body)
+
+    assert res.status_code == status
+    assert res.json["code"] == code
@@ -0,0 +1,137 @@
+"""Tests d'intégration du client asyncio du PointSetManager.
+
+Un PointSetManager de substitution est servi par `asyncio.start_server`
+dans la même boucle d'événements que le client.
+"""
+
+import asyncio
+
+import pytest
+
+from triangulator import binary, client_psm
+
+POINTSET = binary.encode_point_set([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+
+
+class _FakePSM:
+    """PointSetManager minimal mesurant la concurrence des requêtes."""
+
+    def __init__(self, delay=0.0, chunked=False):
+        """Configure le délai de réponse et l'encodage du corps."""
+        self.delay = delay
+        self.chunked = chunked
+        self.active = 0
+        self.max_active = 0
+        self.requests = 0
+
+    async def handle(self, reader, writer):
+        """Répond à une requête GET /pointset/<id>, puis ferme la connexion."""
+        try:
+            await self._respond(reader, writer)
+        finally:
+            writer.close()
+
+    async def _respond(self, reader, writer):
+        """Lit la requête et écrit la réponse."""
+        request_line = await reader.readline()
+        while (await reader.readline()) not in (b"\r\n", b""):
+            pass
+
+        self.requests += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+
+        pointset_id = request_line.split()[1].rsplit(b"/", 1)[-1]
+        if pointset_id == b"silent":
+            return
+        if pointset_id == b"garbage":
+            writer.write(b"garbage\r\n\r\n")
+            await writer.drain()
+            return
+        status = {b"missing": 404, b"down": 503}.get(pointset_id, 200)
+        body = POINTSET + pointset_id if status == 200 else b"{}"
+
+        if self.chunked:
+            half = len(body) // 2
+            payload = b"".join(
+                b"%x\r\n%s\r\n" % (len(part), part)
+                for part in (body[:half], body[half:], b"")
+            )
+            head = "Transfer-Encoding: chunked"
+        else:
+            payload = body
+            head = f"Content-Length: {len(body)}"
+
+        writer.write(
+            f"HTTP/1.1 {status} X\r\n{head}\r\nConnection: close\r\n\r\n".encode()
+            + payload
+        )
+        await writer.drain()
+
+    async def serve(self, scenario):
+        """Exécute ``scenario(client)`` contre le serveur démarré."""
+        server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        host, port = server.sockets[0].getsockname()[:2]
+        client = client_psm.AsyncPointSetManagerClient(
+            f"http://{host}:{port}", timeout=5.0
+        )
+        async with server:
+            return await scenario(client)
+
+
+def test_async_get_pointset_bytes():
+    """Récupère un PointSet, avec ou sans encodage chunked."""
+    for chunked in (False, True):
+        psm = _FakePSM(chunked=chunked)
+        data = asyncio.run(psm.serve(lambda c: c.get_pointset_bytes("ok")))
+        assert data == POINTSET + b"ok"
+
+
+def test_async_error_mapping():
+    """Traduit 404 et 503 comme le client bloquant."""
+    psm = _FakePSM()
+
+    with pytest.raises(client_psm.PointSetNotFound):
+        asyncio.run(psm.serve(lambda c: c.get_pointset_bytes("missing")))
+    with pytest.raises(client_psm.PointSetManagerUnavailable):
+        asyncio.run(psm.serve(lambda c: c.get_pointset_bytes("down")))
+
+
+@pytest.mark.parametrize("pointset_id", ["silent", "garbage"])
+def test_async_invalid_reply(pointset_id):
+    """Une réponse absente ou mal formée lève PointSetManagerUnavailable."""
+    psm = _FakePSM()
+
+    with pytest.raises(client_psm.PointSetManagerUnavailable):
+        asyncio.run(psm.serve(lambda c: c.get_pointset_bytes(pointset_id)))
+
+
+def test_async_unreachable_host():
+    """Un hôte injoignable lève PointSetManagerUnavailable."""
+    client = client_psm.AsyncPointSetManagerClient("http://127.0.0.1:9")
+
+    with pytest.raises(client_psm.PointSetManagerUnavailable):
+        asyncio.run(client.get_pointset_bytes("ok"))
+
+
+def test_async_get_many_bounds_concurrency():
+    """get_many respecte l'ordre des identifiants et la borne de concurrence."""
+    psm = _FakePSM(delay=0.02)
+    ids = [f"id-{i}" for i in range(12)]
+
+    results = asyncio.run(psm.serve(lambda c: c.get_many(ids, concurrency=3)))
+
+    assert results == [POINTSET + i.encode() for i in ids]
+    assert psm.max_active == 3
+
+
+def test_async_get_many_propagates_errors():
+    """Une erreur sur un identifiant interrompt le lot et est propagée."""
+    psm = _FakePSM(delay=0.02)
+    ids = ["a", "missing"] + [f"id-{i}" for i in range(10)]
+
+    with pytest.raises(client_psm.PointSetNotFound):
+        asyncio.run(psm.serve(lambda c: c.get_many(ids, concurrency=2)))
+    assert psm.requests < len(ids)
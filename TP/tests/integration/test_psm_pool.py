@@ -0,0 +1,165 @@
+"""Tests d'intégration du pool de connexions vers le PointSetManager.
+
+Un PointSetManager de substitution est servi localement par
+`http.server`, en HTTP/1.1, afin d'observer les connexions réellement
+ouvertes par le client.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from triangulator import binary, client_psm
+
+POINTSET = binary.encode_point_set([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+
+
+class _FakePSMHandler(BaseHTTPRequestHandler):
+    """Répond aux GET /pointset/<id> selon l'identifiant demandé."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        """Sert un PointSet, une 404 ou une 503 selon l'identifiant."""
+        pointset_id = self.path.rsplit("/", 1)[-1]
+        status = {"missing": 404, "down": 503, "teapot": 418}.get(pointset_id, 200)
+        body = POINTSET if status == 200 else b"{}"
+        if status == 200 and self.headers.get("If-None-Match") == '"v1"':
+            status, body = 304, b""
+
+        self.send_response(status)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+        if self.server.drop_after_response:
+            # Ferme la connexion sans l'annoncer : elle devient obsolète.
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        """Rend le serveur silencieux pendant les tests."""
+
+
+@pytest.fixture
+def psm_server():
+    """Démarre un PointSetManager de substitution sur un port libre."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakePSMHandler)
+    server.daemon_threads = True
+    server.drop_after_response = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def pool(psm_server):
+    """Pool de deux connexions vers le serveur de substitution."""
+    host, port = psm_server.server_address
+    pool = client_psm.PointSetManagerPool(
+        f"http://{host}:{port}", max_connections=2, read_timeout=5.0
+    )
+    yield pool
+    pool.close()
+
+
+def test_pool_reuses_keep_alive_connection(pool):
+    """Plusieurs appels successifs partagent une seule connexion."""
+    for _ in range(5):
+        assert pool.get_pointset_bytes("ok") == POINTSET
+
+    assert pool.connections_opened == 1
+
+
+def test_pool_maps_http_errors(pool):
+    """Les statuts HTTP d'erreur sont traduits comme par get_pointset_bytes."""
+    with pytest.raises(client_psm.PointSetNotFound):
+        pool.get_pointset_bytes("missing")
+    with pytest.raises(client_psm.PointSetManagerUnavailable):
+        pool.get_pointset_bytes("down")
+    with pytest.raises(client_psm.PointSetManagerUnavailable):
+        pool.get_pointset_bytes("teapot")
+
+    assert pool.get_pointset_bytes("ok") == POINTSET
+    assert pool.connections_opened == 1
+
+
+def test_pool_reconnects_stale_connection(pool, psm_server):
+    """Une connexion fermée par le serveur est rouverte sans erreur."""
+    psm_server.drop_after_response = True
+
+    for _ in range(3):
+        assert pool.get_pointset_bytes("ok") == POINTSET
+
+    assert pool.connections_opened == 3
+
+
+def test_pool_bounds_concurrent_connections(pool):
+    """Des appels concurrents n'ouvrent pas plus de connexions que la borne."""
+    results = []
+
+    def fetch():
+        for _ in range(10):
+            results.append(pool.get_pointset_bytes("ok"))
+
+    threads = [threading.Thread(target=fetch) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [POINTSET] * 80
+    assert pool.connections_opened <= 2
+
+
+def test_pool_unreachable_host():
+    """Un hôte injoignable lève PointSetManagerUnavailable."""
+    pool = client_psm.PointSetManagerPool(
+        "http://127.0.0.1:9", connect_timeout=0.5
+    )
+
+    with pytest.raises(client_psm.PointSetManagerUnavailable):
+        pool.get_pointset_bytes("ok")
+
+
+def test_get_pointset_bytes_uses_default_pool(monkeypatch, psm_server):
+    """get_pointset_bytes passe par le pool partagé si PSM_POOL_SIZE > 0."""
+    host, port = psm_server.server_address
+    monkeypatch.setattr(client_psm, "PSM_HOST", f"http://{host}:{port}")
+    monkeypatch.setattr(client_psm, "PSM_POOL_SIZE", 2)
+    monkeypatch.setattr(client_psm, "_default_pool", None)
+
+    assert client_psm.get_pointset_bytes("ok") == POINTSET
+    assert client_psm.get_pointset_bytes("ok") == POINTSET
+    assert client_psm.default_pool().connections_opened == 1
+    client_psm.default_pool().close()
+
+
+def test_get_pointset_streams_through_default_pool(monkeypatch, psm_server):
+    """get_pointset décode le flux sur une connexion du pool partagé."""
+    host, port = psm_server.server_address
+    monkeypatch.setattr(client_psm, "PSM_HOST", f"http://{host}:{port}")
+    monkeypatch.setattr(client_psm, "PSM_POOL_SIZE", 2)
+    monkeypatch.setattr(client_psm, "_default_pool", None)
+    expected = binary.decode_point_set(POINTSET)
+
+    assert client_psm.get_pointset("ok", chunk_size=5) == expected
+    assert client_psm.get_pointset("ok") == expected
+    with pytest.raises(client_psm.PointSetNotFound):
+        client_psm.get_pointset("missing")
+    assert client_psm.default_pool().connections_opened == 1
+    client_psm.default_pool().close()
+
+
+def test_pool_conditional_fetch(pool):
+    """Un GET conditionnel à jour reçoit une 304 sans corps."""
+    body, etag, _ = pool.fetch("ok")
+
+    assert body == POINTSET
+    assert etag == '"v1"'
+    assert pool.fetch("ok", {"If-None-Match": etag}) is None
+    assert pool.connections_opened == 1
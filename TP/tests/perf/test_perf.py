@@ -5,11 +5,16 @@ mesurer le temps d'exécution des opérations critiques et détecter
 d'éventuelles régressions de performance.
 """
 
+import os
+import random
+import struct
 import time
+import tracemalloc
 
 import pytest
 
 from triangulator import binary, core
+from triangulator.mesh import DelaunayMesh
 
 
 @pytest.mark.perf
@@ -48,3 +53,208 @@ def test_encode_decode_point_set_perf():
 
     assert duration < 1.0
     assert decoded == points
+
+
+def _pairwise_cavity_boundary(bad_triangles):
+    """Reproduit l'ancienne extraction du bord par comparaison deux à deux."""
+    polygon = []
+    for tri in bad_triangles:
+        edges = [(tri[0], tri[1]), (tri[1], tri[2]), (tri[2], tri[0])]
+        for edge in edges:
+            is_shared = False
+            for other_tri in bad_triangles:
+                if tri == other_tri:
+                    continue
+                other_edges = [
+                    (other_tri[0], other_tri[1]),
+                    (other_tri[1], other_tri[2]),
+                    (other_tri[2], other_tri[0]),
+                ]
+                if edge in other_edges or (edge[1], edge[0]) in other_edges:
+                    is_shared = True
+                    break
+            if not is_shared:
+                polygon.append(edge)
+    return polygon
+
+
+@pytest.mark.perf
+def test_cavity_boundary_vs_pairwise_loop():
+    """Compare l'extraction du bord de cavité par table de hachage à l'ancienne boucle.
+
+    Une cavité de 400 triangles en éventail autour d'un sommet central
+    reproduit le cas d'un jeu de points groupés. Les deux méthodes doivent
+    retourner le même bord et la version par comptage doit être plus rapide.
+    """
+    k = 400
+    center = k
+    bad_triangles = [(i, (i + 1) % k, center) for i in range(k)]
+
+    start = time.perf_counter()
+    expected = _pairwise_cavity_boundary(bad_triangles)
+    pairwise_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    boundary = core._cavity_boundary(bad_triangles)
+    hashed_duration = time.perf_counter() - start
+
+    print(
+        f"\ncavité de {k} triangles : boucle {pairwise_duration * 1e3:.2f} ms, "
+        f"comptage {hashed_duration * 1e3:.2f} ms"
+    )
+    assert sorted(boundary) == sorted(expected)
+    assert hashed_duration < pairwise_duration
+
+
+@pytest.mark.perf
+def test_triangulation_perf_clustered():
+    """Test de performance du moteur historique sur des points groupés.
+
+    Les points sont répartis en quelques amas serrés, ce qui produit de
+    grandes cavités. Le test réussit si 400 points sont triangulés en moins
+    de 2 secondes.
+    """
+    rng = random.Random(7)
+    centers = [(0.0, 0.0), (50.0, 10.0), (20.0, 40.0)]
+    points = [
+        (cx + rng.gauss(0, 0.5), cy + rng.gauss(0, 0.5))
+        for cx, cy in centers
+        for _ in range(400 // len(centers))
+    ]
+
+    start = time.perf_counter()
+    core.triangulate(points, engine="bowyer-watson")
+    duration = time.perf_counter() - start
+
+    assert duration < 2.0
+
+
+@pytest.mark.perf
+def test_mesh_memory_report():
+    """Rapporte la mémoire du moteur à adjacence, extrapolée à 1M points.
+
+    Le nombre de points mesuré vient de ``TRIANGULATOR_PERF_POINTS``
+    (2 000 par défaut, 1 000 000 pour une mesure complète). Le cache des
+    cercles circonscrits doit occuper exactement 24 octets par slot.
+    """
+    n = int(os.getenv("TRIANGULATOR_PERF_POINTS", "2000"))
+    rng = random.Random(13)
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+
+    tracemalloc.start()
+    mesh = DelaunayMesh.from_points(points)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    slots = len(mesh._r2)
+    cache_bytes = sum(
+        len(column) * column.itemsize for column in (mesh._cx, mesh._cy, mesh._r2)
+    )
+    per_point = peak / n
+    print(
+        f"\n{n} points : pic {peak / 2**20:.1f} Mo, "
+        f"cache des cercles {cache_bytes / 2**20:.1f} Mo ({slots} slots), "
+        f"estimation 1M points : {per_point * 1_000_000 / 2**20:.0f} Mo"
+    )
+    assert cache_bytes == 24 * slots
+    assert slots <= 2 * n + 4
+
+
+@pytest.mark.perf
+def test_insertion_order_scanline_perf():
+    """Compare les ordres d'insertion sur un PointSet en lignes de balayage.
+
+    Des points triés par abscisse sont le pire cas de l'insertion
+    incrémentale. L'ordre BRIO doit trianguler 10 000 points plus vite que
+    l'ordre d'entrée, et en moins de 2 secondes.
+    """
+    rng = random.Random(17)
+    points = sorted((rng.random(), rng.random()) for _ in range(10_000))
+
+    durations = {}
+    for order in ("input", "brio"):
+        start = time.perf_counter()
+        core.triangulate(points, order=order)
+        durations[order] = time.perf_counter() - start
+
+    print(
+        f"\nlignes de balayage : entrée {durations['input']:.2f} s, "
+        f"BRIO {durations['brio']:.2f} s"
+    )
+    assert durations["brio"] < durations["input"]
+    assert durations["brio"] < 2.0
+
+
+@pytest.mark.perf
+def test_decode_point_set_large_payload_perf():
+    """Test de performance du décodage d'un PointSet de 1 000 000 de points.
+
+    La vue sans copie doit être quasi instantanée (moins de 10 ms), et le
+    décodage en liste de tuples doit rester sous 1 seconde.
+    """
+    n = 1_000_000
+    data = struct.pack("<I", n) + bytes(8 * n)
+
+    start = time.perf_counter()
+    coords = binary.decode_point_set_view(data)
+    view_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    points = binary.decode_point_set(data)
+    list_duration = time.perf_counter() - start
+
+    assert len(coords) == 2 * n
+    assert len(points) == n
+    assert view_duration < 0.01
+    assert list_duration < 1.0
+
+
+@pytest.mark.perf
+def test_encode_large_payload_perf():
+    """Test de performance de l'encodage de 200 000 points et 400 000 triangles.
+
+    Les encodeurs dimensionnent la sortie en une fois : le coût doit rester
+    linéaire, y compris lors de l'écriture dans un tampon réutilisé.
+    """
+    n = 200_000
+    points = [(float(i), float(i % 1000)) for i in range(n)]
+    triangles = [(i % n, (i + 1) % n, (i + 2) % n) for i in range(2 * n)]
+    out = bytearray(binary.triangles_nbytes(n, 2 * n))
+
+    start = time.perf_counter()
+    data = binary.encode_triangles(points, triangles)
+    duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    view = binary.encode_triangles(points, triangles, out=out)
+    reuse_duration = time.perf_counter() - start
+
+    assert len(data) == len(out)
+    assert view == data
+    assert duration < 1.0
+    assert reuse_duration < 1.0
+
+
+@pytest.mark.perf
+def test_load_triangles_file_perf(tmp_path):
+    """Test de performance de l'ouverture d'un fichier de maillage volumineux.
+
+    La projection en mémoire ne lit aucune donnée à l'ouverture : charger
+    un maillage de 1 000 000 de sommets et 2 000 000 de triangles doit
+    prendre moins de 10 ms.
+    """
+    n = 1_000_000
+    path = tmp_path / "mesh.bin"
+    with open(path, "wb") as f:
+        f.write(struct.pack("<I", n))
+        f.write(bytes(8 * n))
+        f.write(struct.pack("<I", 2 * n))
+        f.write(bytes(24 * n))
+
+    start = time.perf_counter()
+    vertices, indices = binary.load_triangles(path)
+    duration = time.perf_counter() - start
+
+    assert len(vertices) == 2 * n
+    assert len(indices) == 6 * n
+    assert duration < 0.01
@@ -123,4 +123,379 @@ def test_decode_triangles_extra_bytes():
     corrupted_data = data + b"\x00"
     
     with pytest.raises(ValueError, match="Longueur invalide"):
-        binary.decode_triangles(corrupted_data)
\ No newline at end of file
+        binary.decode_triangles(corrupted_data)
+
+def test_encode_triangles_from_flat_array():
+    """Vérifie que l'encodage d'un `array('I')` plat équivaut à celui des tuples."""
+    from array import array
+
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    triangles = [(0, 1, 2), (2, 1, 3)]
+    flat = array("I", [0, 1, 2, 2, 1, 3])
+
+    assert binary.encode_triangles(points, flat) == binary.encode_triangles(
+        points, triangles
+    )
+
+
+def test_encode_triangles_from_numpy_array():
+    """Vérifie l'encodage d'un tableau NumPy (T, 3) d'indices."""
+    np = pytest.importorskip("numpy")
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    triangles = [(0, 1, 2), (2, 1, 3)]
+
+    for dtype in (np.uint32, np.int64):
+        encoded = binary.encode_triangles(points, np.array(triangles, dtype=dtype))
+        assert encoded == binary.encode_triangles(points, triangles)
+
+
+def test_encode_triangles_rejects_invalid_numpy_array():
+    """Vérifie le rejet d'un tableau NumPy mal formé ou hors limites."""
+    np = pytest.importorskip("numpy")
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+
+    for triangles in (
+        np.array([[0, 1, -1]]),
+        np.array([[0, 1, 2 ** 32]], dtype=np.int64),
+        np.array([0, 1, 2]),
+        np.array([[0, 1], [2, 0]]),
+        np.array([[0.0, 1.0, 2.0]]),
+    ):
+        with pytest.raises(ValueError):
+            binary.encode_triangles(points, triangles)
+        with pytest.raises(ValueError):
+            binary.encode_triangle_indices(points, triangles)
+
+
+def test_encode_triangles_rejects_incomplete_buffer():
+    """Vérifie le rejet d'un tampon dont la taille n'est pas un multiple de 3."""
+    from array import array
+
+    with pytest.raises(ValueError):
+        binary.encode_triangles([(0.0, 0.0)], array("I", [0, 0]))
+
+
+def test_decode_point_set_view_shares_buffer():
+    """Vérifie que la vue des coordonnées ne copie pas le buffer d'origine."""
+    pts = [(1.5, -2.0), (3.25, 4.0), (0.0, 8.5)]
+    data = bytearray(binary.encode_point_set(pts))
+
+    coords = binary.decode_point_set_view(data)
+
+    assert coords.format == "f"
+    assert list(coords) == [1.5, -2.0, 3.25, 4.0, 0.0, 8.5]
+    data[4:8] = b"\x00\x00\x80\x3f"
+    assert coords[0] == 1.0
+
+
+def test_decode_point_set_view_numpy():
+    """Vérifie la vue NumPy (N, 2) sur un PointSet."""
+    np = pytest.importorskip("numpy")
+    pts = [(1.5, -2.0), (3.25, 4.0)]
+    data = binary.encode_point_set(pts)
+
+    coords = binary.decode_point_set_view(data, as_numpy=True)
+
+    assert coords.shape == (2, 2)
+    assert coords.dtype == np.float32
+    assert coords.tolist() == [[1.5, -2.0], [3.25, 4.0]]
+
+
+def test_decode_point_set_view_invalid_length():
+    """Vérifie que la vue valide l'en-tête comme le décodeur classique."""
+    with pytest.raises(ValueError):
+        binary.decode_point_set_view(b"\x02\x00\x00\x00" + b"\x00" * 12)
+
+
+def test_decode_triangles_view():
+    """Vérifie les vues sur les sommets et indices d'une triangulation."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    triangles = [(0, 1, 2), (2, 1, 3)]
+    data = binary.encode_triangles(points, triangles)
+
+    vertices, indices = binary.decode_triangles_view(data)
+
+    assert list(vertices) == [c for p in points for c in p]
+    assert list(indices) == [0, 1, 2, 2, 1, 3]
+
+    with pytest.raises(ValueError, match="Longueur invalide"):
+        binary.decode_triangles_view(data + b"\x00")
+
+
+def test_encode_matches_per_record_packing():
+    """Vérifie que l'encodage groupé reproduit l'encodage point par point."""
+    import struct
+
+    points = [(0.0, 0.0), (1.5, -2.25), (3, 4)]
+    triangles = [(0, 1, 2), (2, 1, 0)]
+
+    expected = struct.pack("<I", 3)
+    for x, y in points:
+        expected += struct.pack("<ff", x, y)
+    assert binary.encode_point_set(points) == expected
+
+    expected += struct.pack("<I", 2)
+    for tri in triangles:
+        expected += struct.pack("<III", *tri)
+    assert binary.encode_triangles(points, triangles) == expected
+
+
+def test_encode_into_caller_buffer():
+    """Vérifie l'écriture dans un tampon fourni et réutilisé par l'appelant."""
+    from array import array
+
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    triangles = [(0, 1, 2), (2, 1, 3)]
+    out = bytearray(256)
+
+    view = binary.encode_point_set(points, out=out)
+    assert bytes(view) == binary.encode_point_set(points)
+    assert len(view) == binary.point_set_nbytes(4)
+
+    for tris in (triangles, array("I", [0, 1, 2, 2, 1, 3])):
+        view = binary.encode_triangles(points, tris, out=out)
+        assert bytes(view) == binary.encode_triangles(points, triangles)
+        assert len(view) == binary.triangles_nbytes(4, 2)
+        assert binary.decode_triangles(view) == (points, triangles)
+
+
+def test_encode_rejects_bad_output_buffer():
+    """Vérifie le rejet d'un tampon trop petit ou en lecture seule."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+
+    with pytest.raises(ValueError, match="trop petit"):
+        binary.encode_triangles(points, [(0, 1, 2)], out=bytearray(8))
+    with pytest.raises(ValueError, match="inscriptible"):
+        binary.encode_point_set(points, out=bytes(64))
+
+
+def test_encode_rejects_malformed_records():
+    """Vérifie le rejet d'un point ou d'un triangle mal formé."""
+    with pytest.raises(ValueError):
+        binary.encode_point_set([(0.0, 0.0), (1.0,)])
+    with pytest.raises(ValueError):
+        binary.encode_triangles([(0.0, 0.0)], [(0, 0)])
+
+
+def test_encode_rejects_uneven_records():
+    """Vérifie le rejet d'enregistrements dont seule la somme des tailles est juste."""
+    with pytest.raises(ValueError):
+        binary.encode_point_set([(1.0, 2.0, 3.0), (4.0,)])
+    with pytest.raises(ValueError):
+        binary.encode_triangles([(0.0, 0.0)], [(0, 1), (2, 0, 1, 2)])
+
+
+def test_save_and_load_triangles_file(tmp_path):
+    """Vérifie l'aller-retour fichier d'une triangulation projetée en mémoire."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    triangles = [(0, 1, 2), (2, 1, 3)]
+    path = tmp_path / "mesh.bin"
+
+    size = binary.save_triangles(path, points, triangles)
+
+    assert path.read_bytes() == binary.encode_triangles(points, triangles)
+    assert size == binary.triangles_nbytes(4, 2)
+
+    vertices, indices = binary.load_triangles(path)
+    assert list(vertices) == [c for p in points for c in p]
+    assert list(indices) == [0, 1, 2, 2, 1, 3]
+
+
+def test_load_point_set_file(tmp_path):
+    """Vérifie l'ouverture d'un fichier PointSet, en vue plate ou NumPy."""
+    pts = [(1.5, -2.0), (3.25, 4.0)]
+    path = tmp_path / "points.bin"
+    path.write_bytes(binary.encode_point_set(pts))
+
+    assert list(binary.load_point_set(path)) == [1.5, -2.0, 3.25, 4.0]
+
+    np = pytest.importorskip("numpy")
+    coords = binary.load_point_set(path, as_numpy=True)
+    assert coords.dtype == np.float32
+    assert coords.tolist() == [[1.5, -2.0], [3.25, 4.0]]
+
+
+def test_load_invalid_files(tmp_path):
+    """Vérifie le rejet de fichiers vides ou tronqués."""
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    truncated = tmp_path / "truncated.bin"
+    truncated.write_bytes(b"\x02\x00\x00\x00" + b"\x00" * 12)
+
+    with pytest.raises(ValueError, match="trop court"):
+        binary.load_point_set(empty)
+    with pytest.raises(ValueError, match="trop court"):
+        binary.load_triangles(empty)
+    with pytest.raises(ValueError, match="Longueur binaire invalide"):
+        binary.load_point_set(truncated)
+
+
+def test_stream_decoder_matches_decode_point_set():
+    """Vérifie que le décodage par morceaux équivaut au décodage complet."""
+    pts = [(0.5 * i, -1.25 * i) for i in range(50)]
+    data = binary.encode_point_set(pts)
+
+    for size in (1, 3, 7, 64, len(data)):
+        decoder = binary.PointSetStreamDecoder(expected_size=len(data))
+        for start in range(0, len(data), size):
+            decoder.feed(data[start:start + size])
+        assert decoder.done
+        assert decoder.close() == binary.decode_point_set(data)
+
+
+def test_stream_decoder_fails_fast():
+    """Vérifie le rejet immédiat d'un excédent ou d'une taille incohérente."""
+    data = binary.encode_point_set([(1.0, 2.0), (3.0, 4.0)])
+
+    decoder = binary.PointSetStreamDecoder()
+    decoder.feed(data)
+    with pytest.raises(ValueError, match="Longueur binaire invalide"):
+        decoder.feed(b"\x00")
+
+    decoder = binary.PointSetStreamDecoder(expected_size=len(data) + 8)
+    with pytest.raises(ValueError, match="Longueur binaire invalide"):
+        decoder.feed(data[:4])
+
+
+def test_stream_decoder_rejects_truncated_stream():
+    """Vérifie qu'un flux interrompu est signalé à la fermeture."""
+    data = binary.encode_point_set([(1.0, 2.0), (3.0, 4.0)])
+
+    decoder = binary.PointSetStreamDecoder()
+    decoder.feed(data[:2])
+    with pytest.raises(ValueError, match="trop court"):
+        decoder.close()
+
+    decoder = binary.PointSetStreamDecoder()
+    decoder.feed(data[:-3])
+    assert not decoder.done
+    with pytest.raises(ValueError, match="Longueur binaire invalide"):
+        decoder.close()
+
+
+@pytest.mark.parametrize("compression", [None, "zlib", "lzma"])
+def test_compact_triangles_roundtrip(compression):
+    """Vérifie l'aller-retour du format compact, à l'ordre des triangles près.
+
+    Chaque triangle peut être tourné, mais son orientation est conservée.
+    """
+    points = [(float(i % 10), float(i // 10)) for i in range(100)]
+    triangles = [(i + 11, i, i + 1) for i in range(0, 88, 2)] + [(99, 0, 50)]
+
+    data = binary.encode_triangles_compact(points, triangles, compression)
+    vertices, decoded = binary.decode_triangles_compact(data)
+
+    assert data[:4] == b"TRC1"
+    assert vertices == binary.decode_point_set(binary.encode_point_set(points))
+    assert sorted(decoded) == sorted(
+        binary._rotate_min_first(t) for t in triangles
+    )
+
+
+def test_compact_triangles_smaller_than_default():
+    """Vérifie que les indices compacts occupent moins que 12 octets/triangle."""
+    points = [(float(i % 100), float(i // 100)) for i in range(10_000)]
+    triangles = [
+        (i, i + 1, i + 100) for i in range(9_899) if (i + 1) % 100
+    ]
+
+    default = binary.encode_triangles(points, triangles)
+    compact = binary.encode_triangles_compact(points, triangles)
+
+    index_bytes = len(compact) - 5 - (len(default) - 12 * len(triangles))
+    assert index_bytes <= 4 * len(triangles)
+    assert len(binary.encode_triangles_compact(points, triangles, "zlib")) < len(
+        compact
+    )
+
+
+def test_compact_triangles_invalid_data():
+    """Vérifie le rejet de données compactes corrompues."""
+    data = binary.encode_triangles_compact([(0.0, 0.0)] * 3, [(0, 1, 2)])
+
+    with pytest.raises(ValueError, match="Signature"):
+        binary.decode_triangles_compact(b"XXXX\x00")
+    with pytest.raises(ValueError, match="Compression inconnue"):
+        binary.decode_triangles_compact(data[:4] + b"\x09" + data[5:])
+    with pytest.raises(ValueError, match="Longueur invalide"):
+        binary.decode_triangles_compact(data[:-1])
+    with pytest.raises(ValueError, match="Corps compressé"):
+        binary.decode_triangles_compact(b"TRC1\x01garbage")
+    with pytest.raises(ValueError, match="Compression inconnue"):
+        binary.encode_triangles_compact([], [], "brotli")
+
+
+@pytest.mark.parametrize("indices", [b"\x03\x03\x03", b"\x06\x02\x04"])
+def test_compact_triangles_index_out_of_range(indices):
+    """Vérifie le rejet d'indices négatifs ou au-delà des sommets."""
+    body = binary.encode_point_set([(0.0, 0.0)] * 3) + b"\x01\x00\x00\x00"
+
+    with pytest.raises(ValueError, match="Indice de sommet"):
+        binary.decode_triangles_compact(b"TRC1\x00" + body + indices)
+
+
+def test_triangle_indices_roundtrip():
+    """Vérifie le format sans sommets, avec PointSet binaire ou décodé."""
+    from array import array
+
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    triangles = [(0, 1, 2), (2, 1, 3)]
+    pointset = binary.encode_point_set(points)
+
+    data = binary.encode_triangle_indices(pointset, triangles)
+
+    assert data[:4] == b"TIDX"
+    assert len(data) == 12 + 12 * len(triangles)
+    assert binary.encode_triangle_indices(points, triangles) == data
+    assert binary.encode_triangle_indices(
+        pointset, array("I", [0, 1, 2, 2, 1, 3])
+    ) == data
+    assert binary.decode_triangles(data, pointset) == (points, triangles)
+    assert binary.decode_triangles(data, points) == (points, triangles)
+
+
+def test_triangle_indices_checksum_mismatch():
+    """Vérifie le rejet d'indices calculés pour un autre PointSet."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+    data = binary.encode_triangle_indices(points, [(0, 1, 2)])
+
+    with pytest.raises(ValueError, match="Somme de contrôle"):
+        binary.decode_triangles(data, [(0.0, 0.0), (2.0, 0.0), (0.0, 1.0)])
+    with pytest.raises(ValueError, match="Longueur invalide"):
+        binary.decode_triangles(data[:-1], points)
+    with pytest.raises(ValueError, match="trop court"):
+        binary.decode_triangles(b"TIDX", points)
+
+
+def test_triangle_indices_out_of_range():
+    """Vérifie le rejet d'un indice qui dépasse le PointSet source."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+    data = binary.encode_triangle_indices(points, [(0, 1, 3)])
+
+    with pytest.raises(ValueError, match="hors du PointSet"):
+        binary.decode_triangles(data, points)
+
+
+def test_batch_roundtrip():
+    """Vérifie la relecture des trames d'une réponse groupée."""
+    items = [
+        ("123e4567-e89b-12d3-a456-426614174000", 200, b"\x01\x02\x03"),
+        ("inconnu", 404, b'{"code": "NOT_FOUND"}'),
+        ("vide", 200, b""),
+    ]
+    data = binary.encode_batch_header(len(items)) + b"".join(
+        binary.encode_batch_item(*item) for item in items
+    )
+
+    assert binary.decode_batch(data) == items
+
+
+@pytest.mark.parametrize("cut", [1, 3, 9])
+def test_batch_truncated(cut):
+    """Vérifie qu'une réponse groupée tronquée lève ValueError."""
+    data = binary.encode_batch_header(1) + binary.encode_batch_item("id", 200, b"xy")
+
+    with pytest.raises(ValueError):
+        binary.decode_batch(data[:-cut])
+    with pytest.raises(ValueError, match="Signature"):
+        binary.decode_batch(b"XXXX" + data[4:])
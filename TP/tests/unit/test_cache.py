@@ -0,0 +1,119 @@
+"""Tests unitaires du cache LRU borné en octets."""
+
+import os
+
+import pytest
+
+from triangulator.cache import ByteLRUCache
+
+
+def test_cache_evicts_least_recently_used():
+    """Vérifie l'éviction LRU lorsque la taille maximale est dépassée."""
+    cache = ByteLRUCache(max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"5678")
+    assert cache.get("a").body == b"1234"
+
+    cache.put("c", b"9012")
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.size == 8
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_counters_and_ttl(monkeypatch):
+    """Vérifie les compteurs et le passage d'une entrée à l'état périmé."""
+    now = [1000.0]
+    monkeypatch.setattr("triangulator.cache.time.time", lambda: now[0])
+    cache = ByteLRUCache(max_bytes=100, ttl=5.0)
+    cache.put("a", b"data", {"etag": '"v1"'})
+
+    assert cache.get("missing") is None
+    assert cache.is_fresh(cache.get("a"))
+
+    now[0] += 10
+    entry = cache.get("a")
+    assert entry.metadata == {"etag": '"v1"'}
+    assert not cache.is_fresh(entry)
+
+    assert cache.is_fresh(cache.touch("a"))
+    stats = cache.stats()
+    assert (stats["hits"], stats["stale"], stats["misses"]) == (1, 1, 1)
+    assert stats["revalidations"] == 1
+
+
+def test_cache_oversized_body_not_kept_in_memory():
+    """Vérifie qu'un corps plus grand que le cache n'évince rien."""
+    cache = ByteLRUCache(max_bytes=4)
+    cache.put("a", b"1234")
+    cache.put("big", b"123456789")
+
+    assert cache.get("big") is None
+    assert cache.get("a").body == b"1234"
+
+
+def test_cache_disk_tier_survives_restart(tmp_path):
+    """Vérifie qu'un nouveau cache relit les entrées du niveau disque."""
+    first = ByteLRUCache(max_bytes=100, directory=str(tmp_path), max_disk_bytes=1000)
+    first.put("pointset/1", b"payload", {"etag": '"v1"'})
+    first.put("big", b"x" * 200)
+
+    second = ByteLRUCache(max_bytes=100, directory=str(tmp_path))
+    entry = second.get("pointset/1")
+
+    assert entry.body == b"payload"
+    assert entry.metadata == {"etag": '"v1"'}
+    assert second.get("big").body == b"x" * 200
+    assert second.stats()["disk_hits"] == 2
+
+    second.discard("pointset/1")
+    assert ByteLRUCache(max_bytes=100, directory=str(tmp_path)).get(
+        "pointset/1"
+    ) is None
+
+
+def test_cache_disk_tier_is_bounded(tmp_path):
+    """Vérifie la suppression des entrées disque les plus anciennes."""
+    cache = ByteLRUCache(max_bytes=0, directory=str(tmp_path), max_disk_bytes=10)
+    cache.put("a", b"1234")
+    os.utime(cache._paths("a")[1], (0, 0))
+    cache.put("b", b"5678")
+    cache.put("c", b"9012")
+
+    reopened = ByteLRUCache(max_bytes=100, directory=str(tmp_path))
+    assert reopened.get("a") is None
+    assert reopened.get("b").body == b"5678"
+    assert reopened.get("c").body == b"9012"
+
+
+@pytest.mark.parametrize(
+    "meta", [b"[]", b'{"metadata": {}}', b'{"metadata": 1, "stored_at": 0}']
+)
+def test_cache_drops_malformed_disk_entry(tmp_path, meta):
+    """Vérifie qu'une entrée disque mal formée est ignorée puis supprimée."""
+    cache = ByteLRUCache(max_bytes=100, directory=str(tmp_path))
+    cache.put("a", b"payload")
+    body_path, meta_path = cache._paths("a")
+    with open(meta_path, "wb") as f:
+        f.write(meta)
+
+    assert ByteLRUCache(max_bytes=100, directory=str(tmp_path)).get("a") is None
+    assert not os.path.exists(body_path)
+    assert not os.path.exists(meta_path)
+
+
+def test_cache_ignores_metadata_without_body(tmp_path):
+    """Vérifie qu'une entrée dont le corps manque est ignorée."""
+    cache = ByteLRUCache(max_bytes=100, directory=str(tmp_path))
+    cache.put("a", b"payload")
+    os.remove(cache._paths("a")[0])
+
+    assert ByteLRUCache(max_bytes=100, directory=str(tmp_path)).get("a") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_rejects_negative_size():
+    """Vérifie le rejet d'une taille maximale négative."""
+    with pytest.raises(ValueError):
+        ByteLRUCache(max_bytes=-1)
@@ -82,4 +82,110 @@ def test_psm_weird_http_error():
     err = urllib.error.HTTPError("url", 418, "I am a teapot", {}, None)
     with patch("urllib.request.urlopen", side_effect=err):
         with pytest.raises(client_psm.PointSetManagerUnavailable):
-            client_psm.get_pointset_bytes("id-teapot")
\ No newline at end of file
+            client_psm.get_pointset_bytes("id-teapot")
+
+def _streaming_response(body, content_length=None):
+    """Construit une réponse simulée lisible par morceaux via readinto."""
+    import io
+
+    stream = io.BytesIO(body)
+    mock_resp = MagicMock()
+    mock_resp.status = 200
+    mock_resp.headers = {"Content-Length": str(content_length or len(body))}
+    mock_resp.readinto.side_effect = stream.readinto
+    mock_resp.__enter__.return_value = mock_resp
+    return mock_resp
+
+
+def test_psm_get_pointset_streaming():
+    """Scénario : PointSet lu par petits morceaux et décodé au fil de l'eau.
+
+    Comportement attendu : get_pointset retourne les points décodés.
+    """
+    from triangulator import binary
+
+    pts = [(float(i), float(-i)) for i in range(100)]
+    mock_resp = _streaming_response(binary.encode_point_set(pts))
+
+    with patch("urllib.request.urlopen", return_value=mock_resp):
+        assert client_psm.get_pointset("id-ok", chunk_size=13) == pts
+    assert mock_resp.readinto.call_count > 1
+
+
+def test_psm_get_pointset_length_mismatch():
+    """Scénario : Content-Length incohérent avec l'en-tête du PointSet.
+
+    Comportement attendu : ValueError dès la lecture de l'en-tête.
+    """
+    from triangulator import binary
+
+    body = binary.encode_point_set([(0.0, 0.0), (1.0, 1.0)])
+    mock_resp = _streaming_response(body, content_length=len(body) + 8)
+
+    with patch("urllib.request.urlopen", return_value=mock_resp):
+        with pytest.raises(ValueError):
+            client_psm.get_pointset("id-bad", chunk_size=4)
+    assert mock_resp.readinto.call_count == 1
+
+
+def test_psm_get_pointset_interrupted():
+    """Scénario : connexion coupée pendant le transfert.
+
+    Comportement attendu : get_pointset lève PointSetManagerUnavailable.
+    """
+    mock_resp = _streaming_response(b"\x02\x00\x00\x00")
+    mock_resp.readinto.side_effect = ConnectionResetError("reset")
+
+    with patch("urllib.request.urlopen", return_value=mock_resp):
+        with pytest.raises(client_psm.PointSetManagerUnavailable):
+            client_psm.get_pointset("id-reset")
+
+
+def test_psm_cache_revalidates_with_etag(monkeypatch):
+    """Scénario : PointSet en cache, périmé puis revalidé par une 304.
+
+    Comportement attendu : un seul transfert de corps, la requête de
+    revalidation porte If-None-Match et la 304 prolonge l'entrée.
+    """
+    from triangulator.cache import ByteLRUCache
+
+    cache = ByteLRUCache(max_bytes=1024, ttl=60.0)
+    ok = MagicMock()
+    ok.status = 200
+    ok.read.return_value = b"\x01\x02\x03"
+    ok.headers = {"ETag": '"v1"', "Last-Modified": None}
+    ok.__enter__.return_value = ok
+    not_modified = urllib.error.HTTPError("url", 304, "Not Modified", {}, None)
+
+    with patch("urllib.request.urlopen", side_effect=[ok, not_modified]) as urlopen:
+        assert client_psm.get_pointset_bytes_cached(cache, "id") == b"\x01\x02\x03"
+        assert client_psm.get_pointset_bytes_cached(cache, "id") == b"\x01\x02\x03"
+        assert urlopen.call_count == 1
+
+        cache.ttl = 0.0
+        assert client_psm.get_pointset_bytes_cached(cache, "id") == b"\x01\x02\x03"
+
+    request = urlopen.call_args.args[0]
+    assert request.get_header("If-none-match") == '"v1"'
+    assert cache.stats()["revalidations"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_psm_default_cache_in_front_of_get_pointset_bytes(monkeypatch):
+    """Scénario : cache activé par PSM_CACHE_BYTES.
+
+    Comportement attendu : le second appel est servi sans requête HTTP.
+    """
+    monkeypatch.setattr(client_psm, "PSM_CACHE_BYTES", 1024)
+    monkeypatch.setattr(client_psm, "_default_cache", None)
+    mock_resp = MagicMock()
+    mock_resp.status = 200
+    mock_resp.read.return_value = b"\x01\x02\x03"
+    mock_resp.headers = {}
+    mock_resp.__enter__.return_value = mock_resp
+
+    with patch("urllib.request.urlopen", return_value=mock_resp) as urlopen:
+        client_psm.get_pointset_bytes("id-cached")
+        assert client_psm.get_pointset_bytes("id-cached") == b"\x01\x02\x03"
+
+    assert urlopen.call_count == 1
@@ -4,7 +4,11 @@ Ces tests valident le comportement de base de la fonction de triangulation,
 en vérifiant des cas géométriques simples et des situations limites.
 """
 
-from triangulator import core
+import random
+
+import pytest
+
+from triangulator import binary, core
 
 
 def test_triangulate_square():
@@ -39,4 +43,130 @@ def test_triangulate_collinear_safe():
     Ce test couvre le cas où certains points sont alignés.
     """
     points = [(0, 0), (1, 1), (2, 2), (5, 0)]
-    core.triangulate(points)
\ No newline at end of file
+    core.triangulate(points)
+
+def test_triangulate_mesh_matches_bowyer_watson():
+    """Vérifie que le moteur à adjacence produit les mêmes triangles.
+
+    Sur des points en position générale, la triangulation de Delaunay est
+    unique : les deux moteurs doivent retourner le même ensemble.
+    """
+    rng = random.Random(42)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(150)]
+
+    mesh = core.triangulate(points, engine="mesh")
+    reference = core.triangulate(points, engine="bowyer-watson")
+
+    assert {frozenset(t) for t in mesh} == {frozenset(t) for t in reference}
+
+
+def test_triangulate_grid_triangle_count():
+    """Vérifie le nombre de triangles d'une grille régulière (cas cocirculaire)."""
+    points = [(float(i % 10), float(i // 10)) for i in range(100)]
+
+    assert len(core.triangulate(points)) == 2 * 9 * 9
+
+
+def test_triangulate_unknown_engine():
+    """Vérifie qu'un moteur inconnu est refusé."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+
+    with pytest.raises(ValueError):
+        core.triangulate(points, engine="inconnu")
+
+
+def test_cavity_boundary_keeps_orientation():
+    """Vérifie que le bord d'une cavité garde l'orientation de ses triangles.
+
+    Deux triangles partageant l'arête (1, 2) forment un quadrilatère : seule
+    l'arête commune disparaît et les quatre autres sont orientées dans le
+    sens trigonométrique.
+    """
+    boundary = core._cavity_boundary([(0, 1, 2), (2, 1, 3)])
+
+    assert sorted(boundary) == [(0, 1), (1, 3), (2, 0), (3, 2)]
+
+
+def test_triangulate_bowyer_watson_ccw():
+    """Vérifie que le moteur historique produit des triangles orientés."""
+    rng = random.Random(3)
+    points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(60)]
+
+    for i, j, k in core.triangulate(points, engine="bowyer-watson"):
+        (ax, ay), (bx, by), (cx, cy) = points[i], points[j], points[k]
+        assert (bx - ax) * (cy - ay) - (by - ay) * (cx - ax) > 0
+
+
+def test_circumcircle_mask_matches_scalar_predicate():
+    """Vérifie que le prédicat vectorisé reproduit `_circumcircle_contains`."""
+    np = pytest.importorskip("numpy")
+    rng = random.Random(5)
+    points = [(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(30)]
+    triangles = [tuple(rng.sample(range(30), 3)) for _ in range(200)]
+    probe = (0.5, -0.25)
+
+    coords = np.array(points)
+    mask = core._circumcircle_mask(coords[np.array(triangles)], probe)
+
+    expected = [core._circumcircle_contains(t, probe, points) for t in triangles]
+    assert mask.tolist() == expected
+
+
+def test_triangulate_bowyer_watson_without_numpy(monkeypatch):
+    """Vérifie que le moteur historique retombe sur le prédicat pur Python."""
+    rng = random.Random(11)
+    points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(80)]
+    vectorized = core.triangulate(points, engine="bowyer-watson")
+
+    monkeypatch.setattr(core, "np", None)
+    fallback = core.triangulate(points, engine="bowyer-watson")
+
+    assert {frozenset(t) for t in fallback} == {frozenset(t) for t in vectorized}
+
+
+def test_triangulate_array_outputs():
+    """Vérifie que les sorties tableau contiennent les mêmes triangles.
+
+    Le tableau plat et la vue NumPy doivent donner le même encodage binaire
+    que la liste de tuples.
+    """
+    rng = random.Random(8)
+    points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(120)]
+
+    triangles = core.triangulate(points)
+    flat = core.triangulate(points, output="array")
+
+    assert flat.typecode == "I"
+    assert list(zip(flat[0::3], flat[1::3], flat[2::3])) == triangles
+    assert binary.encode_triangles(points, flat) == binary.encode_triangles(
+        points, triangles
+    )
+
+    np = pytest.importorskip("numpy")
+    matrix = core.triangulate(points, engine="bowyer-watson", output="numpy")
+    assert matrix.dtype == np.uint32
+    assert matrix.shape == (len(triangles), 3)
+
+
+def test_triangulate_unknown_output():
+    """Vérifie qu'un format de sortie inconnu est refusé."""
+    with pytest.raises(ValueError):
+        core.triangulate([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)], output="csv")
+
+
+@pytest.mark.parametrize("engine", ["mesh", "bowyer-watson"])
+def test_triangulate_reports_progress(monkeypatch, engine):
+    """Vérifie la progression croissante jusqu'au nombre total de points."""
+    from triangulator import mesh
+
+    monkeypatch.setattr(mesh, "PROGRESS_INTERVAL", 64)
+    rng = random.Random(3)
+    points = [(rng.random(), rng.random()) for _ in range(200)]
+    reports = []
+
+    core.triangulate(points, engine=engine, progress=reports.append)
+
+    assert reports == sorted(reports)
+    assert reports[-1] == len(points)
+    if engine == "mesh":
+        assert reports == [64, 128, 192, 200]
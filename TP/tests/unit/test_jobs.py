@@ -0,0 +1,107 @@
+"""Tests unitaires de la file de tâches de triangulation."""
+
+import threading
+import time
+
+import pytest
+
+from triangulator.jobs import FAILED, QUEUED, SUCCEEDED, JobQueue, JobQueueFull
+
+
+def _wait_finished(job, timeout=5.0):
+    """Attend la fin d'une tâche."""
+    deadline = time.monotonic() + timeout
+    while not job.finished:
+        assert time.monotonic() < deadline, "tâche non terminée"
+        time.sleep(0.01)
+
+
+def test_job_succeeds_with_result_and_progress():
+    """Vérifie le résultat, l'ETag et la progression d'une tâche réussie."""
+    def run(job):
+        job.total = 10
+        job.report(4)
+        return b"result", "etag"
+
+    jobs = JobQueue(run, workers=1)
+    job = jobs.submit("pointset", "application/octet-stream")
+    _wait_finished(job)
+
+    assert job.status == SUCCEEDED
+    assert (job.result, job.etag) == (b"result", "etag")
+    assert (job.inserted, job.total) == (10, 10)
+    assert jobs.get(job.id) is job
+
+
+def test_job_failure_keeps_exception():
+    """Vérifie qu'une exception du calcul fait échouer la tâche."""
+    def run(job):
+        raise ValueError("PointSet invalide")
+
+    jobs = JobQueue(run, workers=1)
+    job = jobs.submit("pointset", "application/octet-stream")
+    _wait_finished(job)
+
+    assert job.status == FAILED
+    assert isinstance(job.error, ValueError)
+    assert job.result is None
+
+
+def test_queue_is_bounded():
+    """Vérifie le refus d'une tâche lorsque la file est pleine."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def run(job):
+        started.set()
+        release.wait()
+        return b"", None
+
+    jobs = JobQueue(run, max_pending=1, workers=1)
+    running = jobs.submit("a", "application/octet-stream")
+    started.wait(5)
+    waiting = jobs.submit("b", "application/octet-stream")
+
+    with pytest.raises(JobQueueFull):
+        jobs.submit("c", "application/octet-stream")
+    assert waiting.status == QUEUED
+
+    release.set()
+    _wait_finished(running)
+    _wait_finished(waiting)
+
+
+def test_finished_jobs_expire():
+    """Vérifie l'oubli des tâches terminées après leur durée de vie."""
+    now = [0.0]
+    jobs = JobQueue(lambda job: (b"", None), workers=1, ttl=60, clock=lambda: now[0])
+    job = jobs.submit("pointset", "application/octet-stream")
+    _wait_finished(job)
+
+    now[0] = 59.0
+    assert jobs.get(job.id) is job
+    now[0] = 61.0
+    assert jobs.get(job.id) is None
+
+
+def test_result_budget_forgets_oldest_jobs():
+    """Vérifie l'oubli des résultats les plus anciens au-delà du budget."""
+    jobs = JobQueue(lambda job: (b"x" * 4, None), workers=1, max_result_bytes=10)
+    finished = []
+    for pointset_id in "abc":
+        job = jobs.submit(pointset_id, "application/octet-stream")
+        _wait_finished(job)
+        finished.append(job)
+
+    assert jobs.get(finished[0].id) is None
+    assert jobs.get(finished[1].id) is finished[1]
+    assert jobs.get(finished[2].id) is finished[2]
+
+
+def test_result_budget_keeps_latest_job():
+    """Vérifie qu'un résultat plus grand que le budget reste téléchargeable."""
+    jobs = JobQueue(lambda job: (b"x" * 20, None), workers=1, max_result_bytes=10)
+    job = jobs.submit("pointset", "application/octet-stream")
+    _wait_finished(job)
+
+    assert jobs.get(job.id) is job
@@ -0,0 +1,58 @@
+"""Tests unitaires des ordres d'insertion (courbe de Hilbert et BRIO)."""
+
+import random
+
+import pytest
+
+from triangulator import core, ordering
+
+
+def _random_points(n, seed):
+    rng = random.Random(seed)
+    return [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(n)]
+
+
+def test_brio_order_is_permutation():
+    """Vérifie que l'ordre BRIO est une permutation reproductible des indices."""
+    points = _random_points(500, 1)
+
+    order = ordering.brio_order(points)
+
+    assert sorted(order) == list(range(len(points)))
+    assert ordering.brio_order(points) == order
+    assert ordering.brio_order(points, seed=1) != order
+
+
+def test_hilbert_order_follows_quadrants():
+    """Vérifie que la courbe de Hilbert parcourt les quadrants dans l'ordre.
+
+    Le premier niveau de la courbe visite successivement les quadrants
+    bas-gauche, haut-gauche, haut-droit puis bas-droit.
+    """
+    points = [(9.0, 1.0), (9.0, 9.0), (1.0, 9.0), (1.0, 1.0), (0.0, 0.0), (10.0, 10.0)]
+
+    order = ordering.hilbert_order(points)
+
+    assert order[:2] == [4, 3]
+    assert order[2:] == [2, 1, 5, 0]
+
+
+@pytest.mark.parametrize("order", ["brio", "hilbert", "input"])
+def test_triangulate_order_keeps_input_indices(order):
+    """Vérifie que l'ordre d'insertion ne change pas le résultat.
+
+    Les indices retournés doivent désigner les points d'entrée, quel que
+    soit l'ordre dans lequel ils ont été insérés.
+    """
+    points = sorted(_random_points(300, 2))
+
+    triangles = core.triangulate(points, order=order)
+    reference = core.triangulate(points, engine="bowyer-watson", order="input")
+
+    assert {frozenset(t) for t in triangles} == {frozenset(t) for t in reference}
+
+
+def test_triangulate_unknown_order():
+    """Vérifie qu'un ordre d'insertion inconnu est refusé."""
+    with pytest.raises(ValueError):
+        core.triangulate(_random_points(10, 3), order="inconnu")
@@ -0,0 +1,117 @@
+"""Tests unitaires de la triangulation parallèle par bandes."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from triangulator import binary, core, parallel
+
+
+@pytest.fixture
+def small_strips(monkeypatch):
+    """Autorise des bandes de 100 points pour tester sur de petits jeux."""
+    monkeypatch.setattr(parallel, "MIN_POINTS_PER_STRIP", 100)
+
+
+def _as_set(triangles):
+    return {frozenset(t) for t in triangles}
+
+
+def test_parallel_matches_serial(small_strips):
+    """Vérifie que le recollement des bandes redonne la triangulation séquentielle."""
+    rng = random.Random(21)
+    points = [(rng.uniform(0, 50), rng.uniform(0, 50)) for _ in range(800)]
+
+    result = parallel.triangulate_parallel(points, workers=3)
+
+    assert len(result) == len(set(result))
+    assert _as_set(result) == _as_set(core.triangulate(points, engine="mesh"))
+
+
+def test_parallel_clustered_points(small_strips):
+    """Vérifie le recollement lorsque les amas chevauchent les coutures."""
+    rng = random.Random(22)
+    points = [
+        (cx + rng.gauss(0, 1), rng.gauss(0, 1))
+        for cx in (0.0, 3.0, 6.0)
+        for _ in range(200)
+    ]
+
+    result = parallel.triangulate_parallel(points, workers=4)
+
+    assert _as_set(result) == _as_set(core.triangulate(points, engine="mesh"))
+
+
+def test_parallel_ignores_duplicates(small_strips):
+    """Vérifie qu'un point dupliqué n'apparaît que par sa première occurrence."""
+    rng = random.Random(23)
+    points = [(rng.random(), rng.random()) for _ in range(300)]
+    points.append(points[10])
+
+    result = parallel.triangulate_parallel(points, workers=2)
+
+    assert all(len(points) - 1 not in t for t in result)
+    assert _as_set(result) == _as_set(core.triangulate(points[:-1], engine="mesh"))
+
+
+def _signed_area(points, triangles):
+    """Retourne la somme des aires orientées des triangles."""
+    total = 0.0
+    for a, b, c in triangles:
+        (ax, ay), (bx, by), (cx, cy) = points[a], points[b], points[c]
+        total += ((bx - ax) * (cy - ay) - (by - ay) * (cx - ax)) / 2
+    return total
+
+
+@pytest.mark.parametrize("side, workers", [(25, 2), (30, 3), (80, 3)])
+def test_parallel_grid_cocircular_points(small_strips, side, workers):
+    """Vérifie un maillage sans recouvrement sur une grille (points cocirculaires).
+
+    Les diagonales des carrés peuvent différer du moteur séquentiel, mais le
+    nombre de triangles, l'aire couverte et la conformité des arêtes non.
+    """
+    points = [(float(x), float(y)) for x in range(side) for y in range(side)]
+
+    result = parallel.triangulate_parallel(points, workers=workers)
+
+    assert len(result) == len(core.triangulate(points, engine="mesh"))
+    assert _signed_area(points, result) == (side - 1) ** 2
+    edges = Counter(
+        frozenset(edge)
+        for a, b, c in result
+        for edge in ((a, b), (b, c), (c, a))
+    )
+    assert max(edges.values()) == 2
+
+
+def test_parallel_too_few_points():
+    """Vérifie le refus d'un ensemble de moins de trois points."""
+    with pytest.raises(ValueError):
+        parallel.triangulate_parallel([(0.0, 0.0), (1.0, 1.0)])
+
+
+def test_triangulate_data_uses_parallel_threshold(monkeypatch, small_strips):
+    """Vérifie que le pipeline binaire bascule en parallèle au-delà du seuil."""
+    calls = []
+    original = parallel.triangulate_parallel
+
+    def spy(points, workers=None):
+        calls.append(len(points))
+        return original(points, workers=2)
+
+    monkeypatch.setattr(core, "triangulate_parallel", spy)
+    monkeypatch.setattr(core, "PARALLEL_THRESHOLD", 250)
+
+    rng = random.Random(24)
+    small = [(rng.random(), rng.random()) for _ in range(100)]
+    large = [(rng.random(), rng.random()) for _ in range(300)]
+
+    core.triangulate_data(binary.encode_point_set(small))
+    data = core.triangulate_data(binary.encode_point_set(large))
+
+    assert calls == [300]
+    _, triangles = binary.decode_triangles(data)
+    assert _as_set(triangles) == _as_set(core.triangulate(
+        binary.decode_point_set(binary.encode_point_set(large)), engine="mesh"
+    ))
@@ -0,0 +1,75 @@
+"""Tests unitaires des prédicats géométriques robustes."""
+
+import math
+
+from triangulator import core, predicates
+
+
+def test_orient2d_signs():
+    """Vérifie le signe de l'orientation pour des cas simples."""
+    assert predicates.orient2d(0.0, 0.0, 1.0, 0.0, 0.0, 1.0) > 0
+    assert predicates.orient2d(0.0, 0.0, 0.0, 1.0, 1.0, 0.0) < 0
+    assert predicates.orient2d(0.0, 0.0, 1.0, 1.0, 2.0, 2.0) == 0
+
+
+def test_orient2d_near_collinear_exact():
+    """Vérifie que le chemin exact tranche là où le calcul flottant échoue.
+
+    Le point a est décalé d'un ulp au-dessus de la droite y = x : le
+    déterminant flottant naïf s'annule, alors que l'orientation exacte est
+    strictement positive.
+    """
+    ax, ay = 0.5, 0.5 + 2.0 ** -53
+    bx, by = 12.0, 12.0
+    cx, cy = 24.0, 24.0
+
+    naive = (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+    assert naive == 0
+    assert predicates.orient2d(ax, ay, bx, by, cx, cy) > 0
+    assert predicates.orient2d(0.5, 0.5, bx, by, cx, cy) == 0
+
+
+def test_incircle_signs():
+    """Vérifie le test du cercle circonscrit, y compris le cas cocirculaire."""
+    a, b, c = (1.0, 0.0), (0.0, 1.0), (-1.0, 0.0)
+
+    assert predicates.incircle(*a, *b, *c, 0.0, 0.0) > 0
+    assert predicates.incircle(*a, *b, *c, 2.0, 2.0) < 0
+    assert predicates.incircle(*a, *b, *c, 0.0, -1.0) == 0
+
+
+def test_incircle_cocircular_large_offset():
+    """Vérifie le cas cocirculaire loin de l'origine, où les arrondis dominent."""
+    offset = 1e7
+    a = (offset + 1.0, offset)
+    b = (offset, offset + 1.0)
+    c = (offset - 1.0, offset)
+    d = (offset, offset - 1.0)
+
+    assert predicates.incircle(*a, *b, *c, *d) == 0
+
+
+def test_triangulate_cocircular_points():
+    """Vérifie la triangulation de points cocirculaires avec leur centre.
+
+    Chaque corde du polygone doit former un triangle avec le centre, quel
+    que soit le moteur.
+    """
+    points = [
+        (math.cos(2 * math.pi * i / 32), math.sin(2 * math.pi * i / 32))
+        for i in range(32)
+    ]
+    points.append((0.0, 0.0))
+
+    for engine in ("mesh", "bowyer-watson"):
+        assert len(core.triangulate(points, engine=engine)) == 32
+
+
+def test_triangulate_shifted_grid():
+    """Vérifie une grille décalée loin de l'origine (données cocirculaires)."""
+    points = [
+        (1e7 + 0.1 * (i % 12), 1e7 + 0.1 * (i // 12)) for i in range(144)
+    ]
+
+    for engine in ("mesh", "bowyer-watson"):
+        assert len(core.triangulate(points, engine=engine)) == 2 * 11 * 11
@@ -0,0 +1,240 @@
+"""Tests unitaires des relances, requêtes couvertes et du disjoncteur."""
+
+import threading
+import time
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from triangulator import client_psm
+from triangulator.resilience import CircuitBreaker, backoff_delay, hedged
+
+
+def _ok_response(body=b"\x01\x02\x03"):
+    """Construit une réponse HTTP 200 simulée."""
+    mock_resp = MagicMock()
+    mock_resp.status = 200
+    mock_resp.read.return_value = body
+    mock_resp.__enter__.return_value = mock_resp
+    return mock_resp
+
+
+def _http_error(code):
+    """Construit une erreur HTTP simulée."""
+    return urllib.error.HTTPError("url", code, "error", {}, None)
+
+
+def test_breaker_opens_then_half_opens():
+    """Vérifie les transitions fermé → ouvert → semi-ouvert → fermé."""
+    now = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=2, reset_timeout=10.0, clock=lambda: now[0]
+    )
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    now[0] = 10.0
+    assert breaker.allow()
+    assert breaker.state == "half-open"
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_breaker_reopens_after_failed_trial():
+    """Vérifie qu'un essai semi-ouvert raté rouvre le circuit."""
+    now = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=3, reset_timeout=5.0, clock=lambda: now[0]
+    )
+    for _ in range(3):
+        breaker.record_failure()
+
+    now[0] = 5.0
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_backoff_delay_is_bounded():
+    """Vérifie que l'attente avec gigue reste dans [0, base × 2^n]."""
+    delays = [backoff_delay(3, 0.1) for _ in range(100)]
+
+    assert all(0.0 <= d <= 0.8 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_hedged_returns_fastest_answer():
+    """Vérifie que la requête de couverture l'emporte sur un appel lent."""
+    answers = iter([("slow", 1.0), ("fast", 0.0)])
+
+    def call():
+        name, delay = next(answers)
+        time.sleep(delay)
+        return name
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        start = time.perf_counter()
+        assert hedged(call, 0.05, executor) == "fast"
+        assert time.perf_counter() - start < 0.5
+
+
+def test_hedged_skips_hedge_for_fast_call():
+    """Vérifie qu'aucune couverture n'est lancée pour un appel rapide."""
+    calls = []
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert hedged(lambda: calls.append(1) or "ok", 1.0, executor) == "ok"
+    assert calls == [1]
+
+
+def test_hedged_propagates_final_error():
+    """Vérifie qu'une erreur définitive n'attend pas l'autre appel."""
+    answers = iter([KeyError("absent"), None])
+
+    def call():
+        error = next(answers)
+        if error is None:
+            time.sleep(1.0)
+            return "late"
+        time.sleep(0.1)
+        raise error
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(KeyError):
+            hedged(call, 0.01, executor, final=(KeyError,))
+
+
+def test_hedged_runs_on_caller_thread_when_saturated():
+    """Vérifie qu'un exécuteur saturé n'est pas sollicité ni mis en file."""
+    slots = threading.BoundedSemaphore(1)
+    slots.acquire()
+    threads = []
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        result = hedged(
+            lambda: threads.append(threading.get_ident()) or "ok",
+            0.01,
+            executor,
+            slots=slots,
+        )
+    assert result == "ok"
+    assert threads == [threading.get_ident()]
+
+
+def test_hedged_skips_hedge_without_free_slot():
+    """Vérifie que la couverture est abandonnée faute de place libre."""
+    slots = threading.BoundedSemaphore(1)
+    calls = []
+
+    def call():
+        calls.append(1)
+        time.sleep(0.1)
+        return "ok"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert hedged(call, 0.01, executor, slots=slots) == "ok"
+    assert calls == [1]
+    assert slots.acquire(blocking=False)
+
+
+def test_psm_retries_503_with_backoff(monkeypatch):
+    """Scénario : deux 503 puis un succès, avec deux relances autorisées.
+
+    Comportement attendu : get_pointset_bytes retourne les octets reçus.
+    """
+    monkeypatch.setattr(client_psm, "PSM_RETRIES", 2)
+    monkeypatch.setattr(client_psm, "PSM_RETRY_BACKOFF", 0.0)
+    side_effect = [_http_error(503), _http_error(503), _ok_response()]
+
+    with patch("urllib.request.urlopen", side_effect=side_effect) as urlopen:
+        assert client_psm.get_pointset_bytes("id") == b"\x01\x02\x03"
+    assert urlopen.call_count == 3
+
+
+def test_psm_does_not_retry_other_errors(monkeypatch):
+    """Scénario : 404 puis 500 avec relances autorisées.
+
+    Comportement attendu : aucune relance, exceptions habituelles.
+    """
+    monkeypatch.setattr(client_psm, "PSM_RETRIES", 3)
+    monkeypatch.setattr(client_psm, "PSM_RETRY_BACKOFF", 0.0)
+
+    with patch("urllib.request.urlopen", side_effect=_http_error(404)) as urlopen:
+        with pytest.raises(client_psm.PointSetNotFound):
+            client_psm.get_pointset_bytes("id")
+    assert urlopen.call_count == 1
+
+    with patch("urllib.request.urlopen", side_effect=_http_error(500)) as urlopen:
+        with pytest.raises(client_psm.PointSetManagerUnavailable) as info:
+            client_psm.get_pointset_bytes("id")
+    assert info.value.status == 500
+    assert urlopen.call_count == 1
+
+
+def test_psm_breaker_fast_fails(monkeypatch):
+    """Scénario : PointSetManager en panne, disjoncteur à deux échecs.
+
+    Comportement attendu : le troisième appel échoue sans requête HTTP.
+    """
+    monkeypatch.setattr(client_psm, "PSM_BREAKER_THRESHOLD", 2)
+    monkeypatch.setattr(client_psm, "_default_breaker", None)
+
+    with patch("urllib.request.urlopen", side_effect=_http_error(503)) as urlopen:
+        for _ in range(3):
+            with pytest.raises(client_psm.PointSetManagerUnavailable):
+                client_psm.get_pointset_bytes("id")
+
+    assert urlopen.call_count == 2
+    assert client_psm.default_breaker().state == "open"
+
+
+def test_psm_breaker_trial_unexpected_error_reopens(monkeypatch):
+    """Scénario : appel d'essai du circuit semi-ouvert levant une autre erreur.
+
+    Comportement attendu : l'échec est enregistré et le circuit se rouvre
+    au lieu de rester semi-ouvert.
+    """
+    monkeypatch.setattr(client_psm, "PSM_BREAKER_THRESHOLD", 1)
+    monkeypatch.setattr(client_psm, "PSM_BREAKER_RESET", 0.0)
+    monkeypatch.setattr(client_psm, "_default_breaker", None)
+    breaker = client_psm.default_breaker()
+    breaker.record_failure()
+
+    with patch("urllib.request.urlopen", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError):
+            client_psm.get_pointset_bytes("id")
+
+    assert breaker.state == "open"
+    with patch("urllib.request.urlopen", return_value=_ok_response()):
+        assert client_psm.get_pointset_bytes("id") == b"\x01\x02\x03"
+    assert breaker.state == "closed"
+
+
+def test_psm_hedged_request(monkeypatch):
+    """Scénario : premier appel lent, requête de couverture rapide.
+
+    Comportement attendu : la réponse de couverture est retournée sans
+    attendre l'appel lent.
+    """
+    monkeypatch.setattr(client_psm, "PSM_HEDGE_DELAY", 0.05)
+    delays = iter([1.0, 0.0])
+
+    def urlopen(url, timeout=None):
+        time.sleep(next(delays))
+        return _ok_response()
+
+    with patch("urllib.request.urlopen", side_effect=urlopen):
+        start = time.perf_counter()
+        assert client_psm.get_pointset_bytes("id") == b"\x01\x02\x03"
+        assert time.perf_counter() - start < 0.5
@@ -0,0 +1,59 @@
+"""Tests unitaires du registre des blocs de mémoire partagée."""
+
+from multiprocessing import shared_memory
+
+import pytest
+
+from triangulator.sharedmem import SharedBlocks, result_name
+
+
+def test_create_and_release():
+    """Vérifie qu'un bloc libéré quitte le registre et le système."""
+    blocks = SharedBlocks()
+    block = blocks.create(16)
+    block.buf[:4] = b"abcd"
+
+    assert blocks.leaked() == [block.name]
+    other = shared_memory.SharedMemory(name=block.name)
+    assert bytes(other.buf[:4]) == b"abcd"
+    other.close()
+
+    blocks.release(block)
+
+    assert blocks.leaked() == []
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=block.name)
+
+
+def test_adopt_takes_ownership():
+    """Vérifie qu'un bloc adopté est suivi puis supprimé par le registre."""
+    owner = shared_memory.SharedMemory(create=True, size=8)
+    owner.close()
+    blocks = SharedBlocks()
+
+    block = blocks.adopt(owner.name)
+    assert blocks.leaked() == [owner.name]
+
+    blocks.release(block)
+    assert not blocks.discard(owner.name)
+
+
+def test_discard_by_name():
+    """Vérifie la suppression d'un bloc jamais ouvert par l'appelant."""
+    blocks = SharedBlocks()
+    block = blocks.create(8)
+    output = result_name(block.name)
+    shared_memory.SharedMemory(name=output, create=True, size=8).close()
+
+    assert blocks.discard(output)
+    assert not blocks.discard(output)
+    blocks.release(block)
+
+
+def test_release_all_reports_leaks():
+    """Vérifie que les blocs oubliés sont signalés et libérés."""
+    blocks = SharedBlocks()
+    names = sorted(blocks.create(8).name for _ in range(3))
+
+    assert sorted(blocks.release_all()) == names
+    assert blocks.leaked() == []
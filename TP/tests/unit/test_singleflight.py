@@ -0,0 +1,142 @@
+"""Tests unitaires du regroupement des calculs simultanés."""
+
+import hashlib
+import os
+import threading
+import time
+
+import pytest
+
+from triangulator.singleflight import SingleFlight
+
+
+def _run_concurrently(count, target):
+    """Lance ``count`` threads sur ``target`` et retourne leurs résultats."""
+    results = [None] * count
+
+    def worker(i):
+        try:
+            results[i] = target()
+        except Exception as exc:
+            results[i] = exc
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_calls_share_one_computation():
+    """Vérifie qu'un seul calcul est exécuté pour des appels simultanés."""
+    flights = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return "result"
+
+    results = _run_concurrently(6, lambda: flights.do("key", compute))
+
+    assert results == ["result"] * 6
+    assert len(calls) == 1
+    assert (flights.leaders, flights.followers) == (1, 5)
+
+
+def test_concurrent_calls_share_exception():
+    """Vérifie que l'exception du calcul est propagée à tous les appels."""
+    flights = SingleFlight()
+
+    def compute():
+        time.sleep(0.2)
+        raise ValueError("échec")
+
+    results = _run_concurrently(4, lambda: flights.do("key", compute))
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flights.leaders == 1
+
+
+def test_sequential_calls_recompute():
+    """Vérifie qu'aucun résultat n'est conservé après la fin du calcul."""
+    flights = SingleFlight()
+    counter = iter(range(10))
+
+    assert flights.do("key", lambda: next(counter)) == 0
+    assert flights.do("key", lambda: next(counter)) == 1
+    assert flights.do("other", lambda: next(counter)) == 2
+
+
+def test_file_lock_mode_shares_result_between_instances(tmp_path):
+    """Vérifie le partage d'un résultat entre deux regroupements distincts.
+
+    Deux instances sur le même répertoire de verrous se comportent comme
+    deux processus : la seconde attend le verrou puis relit le résultat.
+    """
+    pytest.importorskip("fcntl")
+    first = SingleFlight(str(tmp_path))
+    second = SingleFlight(str(tmp_path))
+    started = threading.Event()
+    calls = []
+
+    def slow():
+        started.set()
+        time.sleep(0.3)
+        calls.append("first")
+        return {"triangles": [(0, 1, 2)]}
+
+    def fast():
+        calls.append("second")
+        return None
+
+    results = {}
+    leader = threading.Thread(
+        target=lambda: results.setdefault("a", first.do("key", slow))
+    )
+    leader.start()
+    started.wait()
+    results["b"] = second.do("key", fast)
+    leader.join()
+
+    assert results["a"] == results["b"] == {"triangles": [(0, 1, 2)]}
+    assert calls == ["first"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_file_lock_mode_ignores_previous_result(tmp_path):
+    """Vérifie qu'un résultat déposé avant l'attente n'est pas réutilisé."""
+    pytest.importorskip("fcntl")
+    flights = SingleFlight(str(tmp_path))
+
+    assert flights.do("key", lambda: 1) == 1
+    assert flights.do("key", lambda: 2) == 2
+
+
+def test_file_lock_mode_writes_nothing_without_waiter(tmp_path, monkeypatch):
+    """Vérifie qu'un appel sans concurrence ne laisse aucun fichier."""
+    pytest.importorskip("fcntl")
+    flights = SingleFlight(str(tmp_path))
+    dumps = []
+    monkeypatch.setattr(
+        "triangulator.singleflight.pickle.dump", lambda *args, **kw: dumps.append(1)
+    )
+
+    assert flights.do("key", lambda: 1) == 1
+    assert dumps == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_file_lock_mode_ignores_stale_waiter(tmp_path, monkeypatch):
+    """Vérifie qu'un marqueur d'attente périmé est ignoré puis supprimé."""
+    pytest.importorskip("fcntl")
+    flights = SingleFlight(str(tmp_path))
+    flights.do("key", lambda: 1)
+    name = hashlib.sha256(b"key").hexdigest()
+    marker = tmp_path / f"{name}.1.1.wait"
+    marker.touch()
+    os.utime(marker, (0, 0))
+
+    assert flights.do("key", lambda: 2) == 2
+    assert list(tmp_path.iterdir()) == []
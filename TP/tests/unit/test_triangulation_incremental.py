@@ -0,0 +1,138 @@
+"""Tests unitaires de la triangulation incrémentale `core.Triangulation`."""
+
+import random
+
+import pytest
+
+from triangulator import binary, core
+from triangulator.mesh import DelaunayMesh
+
+
+def _random_points(n, seed, low=0.0, high=100.0):
+    """Tire n points dans un carré dont les quatre coins sont inclus.
+
+    Les coins fixent l'enveloppe convexe : les triangles de bord ne
+    dépendent alors pas de la taille du super-triangle.
+    """
+    rng = random.Random(seed)
+    corners = [(low, low), (high, low), (low, high), (high, high)]
+    inner = [(rng.uniform(low, high), rng.uniform(low, high)) for _ in range(n - 4)]
+    return corners + inner
+
+
+def _as_set(triangles):
+    return {frozenset(t) for t in triangles}
+
+
+def test_incremental_insert_matches_full_triangulation():
+    """Vérifie qu'ajouter des points par lots équivaut à tout trianguler d'un coup."""
+    points = _random_points(400, 1)
+
+    triangulation = core.Triangulation(points[:150])
+    indices = triangulation.insert(points[150:])
+
+    assert indices == list(range(150, 400))
+    assert _as_set(triangulation.triangles()) == _as_set(core.triangulate(points))
+
+
+def test_insert_outside_domain_rebuilds():
+    """Vérifie l'ajout de points hors du domaine initial du super-triangle."""
+    inner = _random_points(100, 2, 40.0, 60.0)
+    outer = _random_points(100, 3, 0.0, 100.0)[4:] + [
+        (-50.0, -50.0), (150.0, -50.0), (-50.0, 150.0), (150.0, 150.0)
+    ]
+
+    triangulation = core.Triangulation(inner)
+    triangulation.insert(outer)
+    triangulation.insert(_random_points(50, 4, 10.0, 90.0))
+
+    expected = core.triangulate(triangulation.points, engine="bowyer-watson")
+    assert _as_set(triangulation.triangles()) == _as_set(expected)
+
+
+def test_to_bytes_matches_encode_triangles():
+    """Vérifie que `to_bytes` produit le format binaire Triangles."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    triangulation = core.Triangulation(points)
+
+    vertices, triangles = binary.decode_triangles(triangulation.to_bytes())
+
+    assert vertices == points
+    assert _as_set(triangles) == _as_set(triangulation.triangles())
+    assert len(triangles) == 2
+
+
+def test_state_roundtrip_can_be_extended():
+    """Vérifie qu'un état restauré se prolonge comme l'original."""
+    points = _random_points(300, 5)
+    original = core.Triangulation(points[:200])
+
+    restored = core.Triangulation.load_state(original.dump_state())
+    assert restored.points == original.points
+    assert restored.triangles() == original.triangles()
+
+    restored.insert(points[200:])
+    assert _as_set(restored.triangles()) == _as_set(core.triangulate(points))
+
+
+def test_empty_triangulation():
+    """Vérifie le comportement d'une triangulation sans point."""
+    triangulation = core.Triangulation()
+
+    assert triangulation.triangles() == []
+    restored = core.Triangulation.load_state(triangulation.dump_state())
+    assert restored.insert([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]) == [0, 1, 2]
+    assert len(restored.triangles()) == 1
+
+
+def test_load_state_rejects_truncated_data():
+    """Vérifie le rejet d'un état tronqué."""
+    state = core.Triangulation(_random_points(20, 6)).dump_state()
+
+    with pytest.raises(ValueError):
+        core.Triangulation.load_state(state[:-1])
+    with pytest.raises(ValueError):
+        core.Triangulation.load_state(state[:10])
+
+
+def test_triangulation_accepts_numpy_points():
+    """Vérifie la construction à partir d'un tableau NumPy (N, 2)."""
+    np = pytest.importorskip("numpy")
+    points = _random_points(50, 7)
+
+    triangulation = core.Triangulation(np.array(points))
+    assert _as_set(triangulation.triangles()) == _as_set(core.triangulate(points))
+
+
+@pytest.mark.parametrize(
+    "field, index, value",
+    [
+        ("_tri", 0, 10 ** 6),
+        ("_tri", 1, -1),
+        ("_adj", 0, 10 ** 6),
+        ("_adj", 0, -2),
+        ("_free", None, 0),
+        ("_last", None, 10 ** 6),
+    ],
+)
+def test_mesh_load_state_rejects_out_of_range_indices(field, index, value):
+    """Vérifie le rejet à la relecture d'un état aux indices invalides."""
+    mesh = DelaunayMesh.from_points(_random_points(20, 8))
+    if field == "_free":
+        mesh._free.append(value)
+    elif index is None:
+        setattr(mesh, field, value)
+    else:
+        getattr(mesh, field)[index] = value
+
+    with pytest.raises(ValueError):
+        DelaunayMesh.load_state(mesh.dump_state())
+
+
+def test_load_state_rejects_out_of_range_ids():
+    """Vérifie le rejet d'un état dont un identifiant de point est invalide."""
+    triangulation = core.Triangulation(_random_points(20, 9))
+    triangulation._ids[0] = 20
+
+    with pytest.raises(ValueError):
+        core.Triangulation.load_state(triangulation.dump_state())
@@ -0,0 +1,201 @@
+"""Tests unitaires du pool de processus des triangulations."""
+
+import os
+import random
+
+import pytest
+
+from triangulator import binary, core, sharedmem, workers
+from triangulator.workers import TriangulationPool, TriangulationTimeout
+
+
+def _pointset(n, seed=0):
+    """Retourne un PointSet binaire de ``n`` points aléatoires."""
+    rng = random.Random(seed)
+    return binary.encode_point_set([(rng.random(), rng.random()) for _ in range(n)])
+
+
+@pytest.fixture
+def process_pool():
+    """Pool à un processus, recyclé après chaque tâche, sans voie directe."""
+    pool = TriangulationPool(
+        max_workers=1, cpu_time_limit=30, max_tasks_per_child=1, inline_max_points=0
+    )
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.parametrize(
+    "encoding, compression",
+    [("triangles", None), ("compact", "zlib"), ("indices", None)],
+)
+def test_encode_triangulation_formats(encoding, compression):
+    """Vérifie que chaque encodage se relit en la même triangulation."""
+    data = _pointset(50)
+    points = binary.decode_point_set(data)
+    expected = sorted(tuple(sorted(t)) for t in core.triangulate(points))
+
+    payload = workers.encode_triangulation(data, encoding, compression)
+    if encoding == "indices":
+        _, triangles = binary.decode_triangles(payload, pointset=data)
+    elif encoding == "compact":
+        _, triangles = binary.decode_triangles_compact(payload)
+    else:
+        _, triangles = binary.decode_triangles(payload)
+
+    assert sorted(tuple(sorted(t)) for t in triangles) == expected
+
+
+def test_encode_triangulation_unknown_encoding():
+    """Vérifie qu'un encodage inconnu lève ValueError."""
+    with pytest.raises(ValueError, match="Encodage inconnu"):
+        workers.encode_triangulation(_pointset(3), "svg")
+
+
+def test_small_pointset_stays_inline(monkeypatch):
+    """Vérifie que les petits PointSets ne lancent aucun processus."""
+    pool = TriangulationPool(max_workers=2, inline_max_points=100)
+    monkeypatch.setattr(
+        pool, "_get_executor", lambda: pytest.fail("pool sollicité")
+    )
+
+    assert pool.run(_pointset(10)) == workers.encode_triangulation(_pointset(10))
+    assert pool._executor is None
+
+
+def test_small_pointset_uses_pool_when_inline_disabled(monkeypatch):
+    """Vérifie que ``inline=False`` confie même un petit PointSet au pool."""
+    pool = TriangulationPool(max_workers=2, inline_max_points=100)
+    calls = []
+    monkeypatch.setattr(
+        pool, "_get_executor", lambda: calls.append(1) or pool._executor
+    )
+    monkeypatch.setattr(pool, "_call", lambda executor, progress, fn, *args: fn(*args))
+
+    assert pool.run(_pointset(10), inline=False) == workers.encode_triangulation(
+        _pointset(10)
+    )
+    assert calls == [1]
+
+
+def test_pool_matches_inline_result(process_pool):
+    """Vérifie que le pool produit exactement la réponse du calcul direct."""
+    data = _pointset(200)
+
+    assert process_pool.run(data, "compact") == workers.encode_triangulation(
+        data, "compact"
+    )
+
+
+def test_pool_propagates_bad_pointset(process_pool):
+    """Vérifie qu'un PointSet invalide lève ValueError depuis le processus."""
+    with pytest.raises(ValueError):
+        process_pool.run(b"\x02\x00\x00\x00" + b"\x00" * 5)
+
+
+def test_workers_are_recycled(process_pool):
+    """Vérifie qu'un processus est remplacé après ``max_tasks_per_child``."""
+    executor = process_pool._get_executor()
+    first = executor.submit(os.getpid).result()
+    second = executor.submit(os.getpid).result()
+
+    assert first != second != os.getpid()
+
+
+@pytest.fixture
+def shared_pool():
+    """Pool à un processus échangeant par mémoire partagée."""
+    pool = TriangulationPool(
+        max_workers=1, cpu_time_limit=30, inline_max_points=0, shared_memory=True
+    )
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.parametrize(
+    "encoding, compression",
+    [("triangles", None), ("compact", "lzma"), ("indices", None)],
+)
+def test_shared_memory_pool_matches_inline(shared_pool, encoding, compression):
+    """Vérifie la réponse transmise par mémoire partagée et la libération."""
+    data = _pointset(300)
+
+    result = shared_pool.run(data, encoding, compression)
+
+    assert result == workers.encode_triangulation(data, encoding, compression)
+    assert sharedmem.blocks.leaked() == []
+
+
+def test_shared_memory_pool_releases_blocks_on_error(shared_pool):
+    """Vérifie qu'aucun bloc ne subsiste après un PointSet invalide."""
+    with pytest.raises(ValueError):
+        shared_pool.run(b"\x02\x00\x00\x00" + b"\x00" * 5)
+
+    assert sharedmem.blocks.leaked() == []
+
+
+def test_encode_shared_writes_result_block():
+    """Vérifie que le résultat est écrit dans le bloc nommé, à sa taille."""
+    data = _pointset(40)
+    block = sharedmem.blocks.create(len(data))
+    output = sharedmem.result_name(block.name)
+    block.buf[: len(data)] = data
+    try:
+        size = workers.encode_shared(block.name, len(data), output)
+    finally:
+        sharedmem.blocks.release(block)
+
+    result = sharedmem.blocks.adopt(output)
+    try:
+        assert bytes(result.buf[:size]) == workers.encode_triangulation(data)
+    finally:
+        sharedmem.blocks.release(result)
+    assert not sharedmem.blocks.discard(output)
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_pool_reports_progress(monkeypatch, shared):
+    """Vérifie la remontée de la progression depuis le processus de travail."""
+    monkeypatch.setattr(workers, "PROGRESS_POLL_INTERVAL", 0.01)
+    pool = TriangulationPool(max_workers=1, inline_max_points=0, shared_memory=shared)
+    reports = []
+    try:
+        pool.run(_pointset(500), progress=reports.append)
+    finally:
+        pool.shutdown()
+
+    assert reports[-1] == 500
+    assert sharedmem.blocks.leaked() == []
+
+
+@pytest.mark.skipif(workers.resource is None, reason="RLIMIT_CPU indisponible")
+def test_cpu_time_limit_raises_timeout(monkeypatch):
+    """Vérifie qu'un calcul sans fin est interrompu par la limite CPU."""
+    def spin(points, progress=None):
+        while True:
+            pass
+
+    monkeypatch.setattr(core, "triangulate", spin)
+    soft_before = workers.resource.getrlimit(workers.resource.RLIMIT_CPU)
+
+    with pytest.raises(TriangulationTimeout):
+        workers._run_limited(
+            0.1, workers.encode_triangulation, _pointset(3), "triangles", None
+        )
+
+    assert workers.resource.getrlimit(workers.resource.RLIMIT_CPU) == soft_before
+
+
+def test_default_pool_reads_environment(monkeypatch):
+    """Vérifie la configuration du pool par variables d'environnement."""
+    monkeypatch.setenv("TRIANGULATOR_POOL_SIZE", "3")
+    monkeypatch.setenv("TRIANGULATOR_CPU_LIMIT", "0")
+    monkeypatch.setenv("TRIANGULATOR_TASKS_PER_CHILD", "7")
+    monkeypatch.setenv("TRIANGULATOR_INLINE_POINTS", "5")
+
+    pool = workers.default_pool()
+
+    assert pool.max_workers == 3
+    assert pool.cpu_time_limit is None
+    assert pool.max_tasks_per_child == 7
+    assert pool.inline_max_points == 5